@@ -2,7 +2,8 @@
 Core AWS AssumeRole configuration
 """
 #!/usr/bin/env python
-from typing import Dict, Tuple, Optional
+from typing import Dict, Tuple, Optional, Hashable
+import threading
 # from os import getenv
 from os.path import expanduser
 
@@ -28,9 +29,26 @@ home = expanduser("~")
 AWS_CONFIG_ROOT = home + "/.aws/"
 
 
+def _config_key(config: Optional[Config]) -> Tuple[Optional[str], str]:
+    """
+    :param config: botocore client Config (may be None)
+    :return: hashable (region name, options) key of the given Config
+    """
+    if config is None:
+        return None, ''
+    # the (private) botocore record of the options explicitly set in the Config
+    options: Dict = getattr(config, '_user_provided_options', {})
+    return options.get('region_name'), repr(sorted(options.items()))
+
+
 class AssumeRole:
     """
     AWS IAM 'AssumeRole' wrapper
+
+    Clients (which are thread safe) are pooled and shared across threads;
+    resources (which are not) are pooled per thread. Pooled clients and resources
+    are keyed on (service, region, config, credential generation), so they are only
+    rotated when the temporary 'assume role' credentials are renewed.
     """
     def __init__(
             self,
@@ -57,6 +75,16 @@ class AssumeRole:
             self.expiration = datetime.now()
             self.aws_session: Optional[boto3.Session] = None
 
+        # 'generation' of the current credentials, bumped each time they are renewed
+        self._generation: int = 0
+        self._session_generation: int = -1
+        self._lock = threading.RLock()
+
+        self._client_pool: Dict[Hashable, object] = dict()
+        self._resource_pool = threading.local()
+        self.pool_hits: int = 0
+        self.pool_misses: int = 0
+
         # Connect to AWS STS ... using local guest credentials
         self.sts_client = None
         try:
@@ -79,12 +107,17 @@ class AssumeRole:
                  and second, a boolean flag which is True
                  if the session credentials were renewed.
         """
+        with self._lock:
+            return self._get_credentials_dict()
+
+    def _get_credentials_dict(self) -> Tuple[Dict, bool]:
         session_renewed: bool = False
         
         if not self.assumed_role_object or \
                 self.expiration.timestamp() <= datetime.now().timestamp():
             
             session_renewed = True
+            self._generation += 1
 
             # Full STS "Assume Role" method signature, returns temporary security credentials.
             # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/sts.html#STS.Client.assume_role
@@ -171,55 +204,119 @@ class AssumeRole:
             credentials, _ = self.get_credentials_dict()
             return dumps(credentials)
 
+    def _get_session(self) -> Optional[boto3.Session]:
+        """
+        :return: boto3 Session of the current assumed role credentials (None if using default credentials)
+        """
+        if self._default_credentials:
+            return None
+
+        with self._lock:
+            #
+            # Get the temporary credentials, in a Python dictionary
+            # with temporary AWS credentials of the form:
+            #
+            # {
+            #     "sessionId": "temp-access_key-id",
+            #     "sessionKey": "temp-secret-access-key",
+            #     "sessionToken": "temp-session-token"
+            # }
+            #
+            credentials, session_renewed = self._get_credentials_dict()
+
+            if not self.aws_session or self._session_generation != self._generation:
+
+                self.aws_session = boto3.Session(
+                    aws_access_key_id=credentials["sessionId"],
+                    aws_secret_access_key=credentials["sessionKey"],
+                    aws_session_token=credentials["sessionToken"]
+                )
+                self._session_generation = self._generation
+
+                # clients of earlier credentials are discarded
+                self._client_pool = {
+                    key: client for key, client in self._client_pool.items() if key[-1] == self._generation
+                }
+
+            return self.aws_session
+
+    def get_credentials_lifetime(self) -> Optional[float]:
+        """
+        :return: remaining lifetime, in seconds, of the current assumed role credentials
+                 (None if using default credentials, or if no credentials were yet obtained)
+        """
+        if self._default_credentials or not self.assumed_role_object:
+            return None
+        with self._lock:
+            return self.expiration.timestamp() - datetime.now().timestamp()
+
     def get_client(self, service: str, config: Optional[Config] = None):
         """
+        Returns a (pooled) client for the AWS service.
 
         :param service:
         :param config:
         :return:
         """
-        #
-        # Get the temporary credentials, in a Python dictionary
-        # with temporary AWS credentials of the form:
-        #
-        # {
-        #     "sessionId": "temp-access_key-id",
-        #     "sessionKey": "temp-secret-access-key",
-        #     "sessionToken": "temp-session-token"
-        # }
-        #
         if self._default_credentials:
             logging.debug("AssumeRole.get_client(): using default credentials")
-            return boto3.client(service, config=config)
-        else:
-            credentials, session_renewed = self.get_credentials_dict()
 
-            if not self.aws_session or session_renewed:
+        with self._lock:
+            aws_session = self._get_session()
+            key = (service, *_config_key(config), self._generation)
 
-                self.aws_session = boto3.Session(
-                    aws_access_key_id=credentials["sessionId"],
-                    aws_secret_access_key=credentials["sessionKey"],
-                    aws_session_token=credentials["sessionToken"]
-                )
+            client = self._client_pool.get(key)
+            if client is not None:
+                self.pool_hits += 1
+            else:
+                self.pool_misses += 1
+                if aws_session:
+                    client = aws_session.client(service, config=config)
+                else:
+                    client = boto3.client(service, config=config)
+                self._client_pool[key] = client
 
-            return self.aws_session.client(service, config=config)
+            return client
 
     def get_resource(self, service, **kwargs):
         """
+        Returns a (pooled, per thread) resource for the AWS service.
 
         :param service:
         :param kwargs:
         :return:
         """
-        if self._default_credentials:
-            return boto3.resource('s3', **kwargs)
+        with self._lock:
+            aws_session = self._get_session()
+            generation = self._generation
+
+        key = (service, repr(sorted(kwargs.items())))
+
+        pool: Dict = getattr(self._resource_pool, 'resources', None)
+        if pool is None or getattr(self._resource_pool, 'generation', None) != generation:
+            # resources of earlier credentials are discarded
+            pool = self._resource_pool.resources = dict()
+            self._resource_pool.generation = generation
+
+        resource = pool.get(key)
+        if resource is not None:
+            self.pool_hits += 1
         else:
-            credentials, session_renewed = self.get_credentials_dict()
+            self.pool_misses += 1
+            if aws_session:
+                resource = aws_session.resource(service_name=service, **kwargs)
+            else:
+                resource = boto3.resource(service, **kwargs)
+            pool[key] = resource
 
-            if not self.aws_session or session_renewed:
-                self.aws_session = boto3.Session(
-                    aws_access_key_id=credentials["sessionId"],
-                    aws_secret_access_key=credentials["sessionKey"],
-                    aws_session_token=credentials["sessionToken"]
-                )
-            return self.aws_session.resource(service_name=service, **kwargs)
+        return resource
+
+    def get_pool_statistics(self) -> Dict[str, int]:
+        """
+        :return: dictionary of the number of client and resource pool 'hits' and 'misses'
+        """
+        return {
+            'hits': self.pool_hits,
+            'misses': self.pool_misses,
+            'clients': len(self._client_pool)
+        }
@@ -158,6 +158,7 @@ PUBLISH_FILE_SET = BACKEND + "publish"  # GET
 # upload controller
 SETUP_UPLOAD_CONTEXT = BACKEND + "upload"  # GET
 UPLOAD_FILE = BACKEND + "upload"  # POST
+UPLOAD_FILE_STREAM = BACKEND + "upload/stream"  # POST (plain aiohttp route, outside of the OpenAPI specification)
 DIRECT_URL_TRANSFER = BACKEND + "upload/url"  # GET
 CANCEL_UPLOAD = BACKEND + "upload/cancel"  # DELETE
 
@@ -0,0 +1,53 @@
+"""
+Knowledge Graph Archive back end KGE Archiver worker service component.
+
+The service claims the KGE File Set publication jobs posted to the shared (durable) archiver
+job queue by the web services (running with the 'remote' Archiver_Mode), then runs their
+archiving pipeline. Several such worker service processes, sharing the archiver job queue,
+may publish distinct KGE File Sets concurrently: on the same host, with the (default) SQLite
+job queue, or on several hosts, with the DynamoDB job queue (see archiver_jobs.py).
+"""
+from argparse import ArgumentParser
+import asyncio
+
+from kgea.server.web_services.catalog import (
+    KgeArchiver,
+    Number_of_Archiver_Tasks,
+    ARCHIVER_POLL_INTERVAL
+)
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+async def run_archiver_service(tasks: int, poll_interval: float):
+    """
+    Runs the given number of archiver worker tasks, until the process is stopped.
+
+    :param tasks: number of archiver jobs run concurrently by this process
+    :param poll_interval: seconds between checks of the job queue, when it is empty
+    """
+    # no local worker tasks: the jobs are claimed from the shared archiver job queue
+    archiver = KgeArchiver(max_tasks=0)
+
+    logger.info(f"KGE Archiver worker service started with {tasks} worker tasks")
+
+    await asyncio.gather(*[archiver.serve(task_id, poll_interval) for task_id in range(tasks)])
+
+
+def main():
+    """
+    KGE Archiver worker service entry point
+    """
+    parser = ArgumentParser(description="KGE Archiver worker service")
+    parser.add_argument(
+        '--tasks', type=int, default=Number_of_Archiver_Tasks,
+        help="number of archiver jobs run concurrently by this process"
+    )
+    parser.add_argument(
+        '--poll-interval', type=float, default=ARCHIVER_POLL_INTERVAL,
+        help="seconds between checks of the archiver job queue, when it is empty"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run_archiver_service(args.tasks, args.poll_interval))
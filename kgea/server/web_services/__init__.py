@@ -6,8 +6,9 @@ import connexion
 from connexion.apps import aiohttp_app
 import aiohttp_cors
 
-from kgea.server.web_services.catalog import KnowledgeGraphCatalog
+from kgea.server.web_services.catalog import KnowledgeGraphCatalog, KgeArchiver
 from kgea.server.web_services.kgea_session import KgeaSession
+from kgea.server.web_services.kgea_handlers import resume_url_transfers, kge_stream_upload_file
 import logging
 
 aiohttp_app.logger = logging.getLogger(__name__)
@@ -30,15 +31,19 @@ def main():
         }
     )
     
-    app.add_api('openapi.yaml',
-                arguments={
-                    'title': 'OpenAPI for the Biomedical Translator Knowledge Graph EXchange Archive. ' +
-                             'Although this API is SmartAPI compliant, it will not normally be visible in the ' +
-                             'Translator SmartAPI Registry since it is mainly meant to be accessed through ' +
-                             'Registry indexed KGE File Sets, which will have distinct entries in the Registry.'
-                },
-                pythonic_params=True,
-                pass_context_arg_name='request')
+    api = app.add_api('openapi.yaml',
+                      arguments={
+                          'title': 'OpenAPI for the Biomedical Translator Knowledge Graph EXchange Archive. ' +
+                                   'Although this API is SmartAPI compliant, it will not normally be visible in the ' +
+                                   'Translator SmartAPI Registry since it is mainly meant to be accessed through ' +
+                                   'Registry indexed KGE File Sets, which will have distinct entries in the Registry.'
+                      },
+                      pythonic_params=True,
+                      pass_context_arg_name='request')
+
+    # Streaming file uploads are served by a plain aiohttp route, since
+    # connexion reads the whole request body before calling its handlers
+    app.app.router.add_post(api.base_path + '/upload/stream', kge_stream_upload_file)
 
     # See https://github.com/aio-libs/aiohttp-cors#usage
 
@@ -57,6 +62,12 @@ def main():
 
     KgeaSession.initialize(app.app)
 
+    # Resume any KGE File Set publications interrupted by a previous shutdown of the service
+    app.app.on_startup.append(KgeArchiver.resume_jobs)
+
+    # Resume any direct URL transfers interrupted by a previous shutdown of the service
+    app.app.on_startup.append(resume_url_transfers)
+
     app.run(
         port=8080,
         server="aiohttp",
@@ -0,0 +1,698 @@
+"""
+Durable job queue of the KGE Archiver.
+
+Each publication of a KGE File Set is recorded as a job, together with the
+(JSON serialized) state of the file set and the completed steps of the archiving
+pipeline, such that an interrupted publication may be resumed (from its last
+completed step) after a restart of the service.
+
+The queue has two backends, selected by the 'Archiver_Job_Queue_Backend' configuration tag:
+
+- 'sqlite' (default): a local SQLite database file, for a single host (and for testing).
+  The atomic claiming of jobs, by the worker processes sharing the queue, relies upon SQLite
+  (WAL mode) file locking, which is only safe between processes of a single host: the
+  database file may not be shared through a network filesystem (e.g. NFS or EFS).
+- 'dynamodb': an AWS DynamoDB table, which may be shared by the web services and archiver
+  worker services of several hosts, jobs being atomically claimed by conditional writes.
+"""
+from typing import Dict, List, Optional, Tuple
+from os.path import dirname, abspath
+from contextlib import contextmanager
+import json
+import sqlite3
+import time
+import zlib
+
+from botocore.exceptions import ClientError
+
+from kgea.config import get_app_config, CONFIG_FILE_PATH
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Opaquely access the configuration dictionary
+_KGEA_APP_CONFIG = get_app_config()
+
+# Backend of the KGE Archiver job queue: 'sqlite' (single host) or 'dynamodb' (shared between hosts)
+Archiver_Job_Queue_Backend = \
+    _KGEA_APP_CONFIG['Archiver_Job_Queue_Backend'] if 'Archiver_Job_Queue_Backend' in _KGEA_APP_CONFIG \
+    else 'sqlite'
+
+# Path of the SQLite database file of the KGE Archiver job queue ('sqlite' backend)
+Archiver_Job_Queue_Path = \
+    _KGEA_APP_CONFIG['Archiver_Job_Queue_Path'] if 'Archiver_Job_Queue_Path' in _KGEA_APP_CONFIG \
+    else f"{dirname(CONFIG_FILE_PATH)}/archiver_jobs.sqlite"
+
+# Name of the DynamoDB table of the KGE Archiver job queue ('dynamodb' backend), created if necessary
+Archiver_Job_Queue_Table = \
+    _KGEA_APP_CONFIG['Archiver_Job_Queue_Table'] if 'Archiver_Job_Queue_Table' in _KGEA_APP_CONFIG \
+    else 'kgea-archiver-jobs'
+
+# Stages of the KGE File Set archiving pipeline, in order of execution:
+# the (independent) steps of each stage may be run concurrently
+ARCHIVER_STAGES: List[List[str]] = [
+    ["unpack"],
+    ["fileset_yaml"],
+    ["aggregate_nodes", "aggregate_edges", "copy_metadata"],
+    ["content_metadata"],
+    ["compress"],
+    ["sha1"]
+]
+
+# Steps of the KGE File Set archiving pipeline, in order of execution
+ARCHIVER_STEPS: List[str] = [step for stage in ARCHIVER_STAGES for step in stage]
+
+# Seconds after which a running job, whose worker stopped reporting (heartbeat)
+# its progress, is deemed abandoned, hence may be claimed by another worker
+ARCHIVER_JOB_LEASE = 300.0
+
+# Filesystem types on which the SQLite file locking of the job queue is unsafe
+_NETWORK_FILESYSTEMS = {'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', '9p', 'ceph', 'glusterfs', 'lustre', 'fuse.sshfs'}
+
+# Archiver job status values
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS archiver_job (
+    job_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    file_set TEXT NOT NULL,
+    worker TEXT,
+    error TEXT,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS archiver_step (
+    job_id TEXT NOT NULL,
+    step TEXT NOT NULL,
+    seconds REAL,
+    completed REAL NOT NULL,
+    PRIMARY KEY (job_id, step)
+);
+"""
+
+
+def filesystem_type(path: str, mounts: str = '/proc/mounts') -> Optional[str]:
+    """
+    :param path: file path
+    :param mounts: table of the mounted filesystems (in the Linux /proc/mounts format)
+    :return: type of the filesystem on which the path is found, None if unknown (e.g. not on Linux)
+    """
+    try:
+        with open(mounts, 'r') as mount_table:
+            entries = [line.split() for line in mount_table]
+    except OSError:
+        return None
+    path = abspath(path)
+    fs_type: Optional[str] = None
+    mount_point_length = -1
+    for entry in entries:
+        if len(entry) < 3:
+            continue
+        mount_point = entry[1]
+        if (path == mount_point or path.startswith(mount_point.rstrip('/') + '/')) and \
+                len(mount_point) > mount_point_length:
+            fs_type = entry[2]
+            mount_point_length = len(mount_point)
+    return fs_type
+
+
+class ArchiverJobQueue:
+    """
+    Interface of the durable record of the KGE Archiver jobs and their completed (checkpointed) steps,
+    from which the archiver worker tasks (and worker services) claim the jobs they run.
+    """
+    def enqueue(self, job_id: str, file_set: Dict):
+        """
+        Records a new (pending) job, replacing any earlier job (and its checkpoints) of the same identifier.
+
+        :param job_id: job identifier, i.e. the KGE File Set identifier
+        :param file_set: (JSON serializable) state of the KGE File Set
+        """
+        raise NotImplementedError
+
+    def claim(self, worker: str, lease: float = ARCHIVER_JOB_LEASE) -> Optional[Tuple[str, Dict]]:
+        """
+        Atomically claims the oldest pending job (or abandoned running job) for a worker.
+
+        :param worker: identifier of the worker claiming the job
+        :param lease: seconds without heartbeat after which a running job is deemed abandoned
+        :return: 2-tuple of the identifier and KGE File Set state of the claimed job, None if no job is available
+        """
+        raise NotImplementedError
+
+    def heartbeat(self, job_id: str):
+        """
+        Renews the lease of a running job.
+
+        :param job_id:
+        """
+        raise NotImplementedError
+
+    def start(self, job_id: str, worker: str):
+        """
+        Marks a job as running.
+
+        :param job_id:
+        :param worker: identifier of the worker running the job
+        """
+        raise NotImplementedError
+
+    def checkpoint(self, job_id: str, step: str, file_set: Dict, seconds: Optional[float] = None):
+        """
+        Records the completion of a step of a job, with the updated state of its KGE File Set.
+
+        :param job_id:
+        :param step: one of the ARCHIVER_STEPS
+        :param file_set: (JSON serializable) state of the KGE File Set after the step
+        :param seconds: (optional) duration of the step
+        """
+        raise NotImplementedError
+
+    def complete(self, job_id: str):
+        """
+        Marks a job as completed.
+
+        :param job_id:
+        """
+        self._set_status(job_id, JOB_COMPLETED)
+
+    def fail(self, job_id: str, error: str):
+        """
+        Marks a job as failed. Failed jobs are not resumed.
+
+        :param job_id:
+        :param error: error message
+        """
+        self._set_status(job_id, JOB_FAILED, error)
+
+    def _set_status(self, job_id: str, status: str, error: Optional[str] = None):
+        raise NotImplementedError
+
+    def get_status(self, job_id: str) -> Optional[str]:
+        """
+        :param job_id:
+        :return: status of the job, None if unknown
+        """
+        job: Optional[Dict] = self.get_job(job_id)
+        return job["status"] if job else None
+
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        """
+        :param job_id:
+        :return: dictionary of the 'status', 'file_set' (state), 'worker' and 'error' of the job, None if unknown
+        """
+        raise NotImplementedError
+
+    def get_completed_steps(self, job_id: str) -> Dict[str, Optional[float]]:
+        """
+        :param job_id:
+        :return: dictionary of the durations (in seconds, if recorded) of the completed steps of the job
+        """
+        raise NotImplementedError
+
+    def get_unfinished_jobs(self) -> List[Tuple[str, Dict]]:
+        """
+        :return: list of the identifiers and KGE File Set states of the pending
+                 or (interrupted) running jobs, in order of their creation
+        """
+        raise NotImplementedError
+
+
+class SQLiteArchiverJobQueue(ArchiverJobQueue):
+    """
+    SQLite database backed record of the KGE Archiver jobs and their completed (checkpointed) steps.
+
+    Each method opens its own short-lived database connection, hence the queue may be shared
+    between threads, and between the processes of a single host using the same database file.
+    """
+    def __init__(self, db_path: str = Archiver_Job_Queue_Path):
+        """
+        :param db_path: path of the SQLite database file (created, if necessary)
+        :raises RuntimeError: if the database file is on a network filesystem
+        """
+        fs_type = filesystem_type(db_path)
+        if fs_type in _NETWORK_FILESYSTEMS:
+            raise RuntimeError(
+                f"SQLiteArchiverJobQueue(): the job queue database '{db_path}' is on a '{fs_type}' " +
+                "network filesystem, on which SQLite locking is unsafe: the job queue may only be shared " +
+                "by the processes of a single host (set Archiver_Job_Queue_Backend to 'dynamodb' to share it)"
+            )
+        self.db_path = db_path
+        with self._connection() as db:
+            db.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connection(self):
+        db = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            yield db
+        finally:
+            db.close()
+
+    def enqueue(self, job_id: str, file_set: Dict):
+        """
+        Records a new (pending) job, replacing any earlier job (and its checkpoints) of the same identifier.
+
+        :param job_id: job identifier, i.e. the KGE File Set identifier
+        :param file_set: (JSON serializable) state of the KGE File Set
+        """
+        now = time.time()
+        with self._connection() as db:
+            db.execute("BEGIN IMMEDIATE")
+            db.execute("DELETE FROM archiver_step WHERE job_id = ?", (job_id,))
+            db.execute(
+                "INSERT OR REPLACE INTO archiver_job (job_id, status, file_set, worker, error, created, updated) " +
+                "VALUES (?, ?, ?, NULL, NULL, ?, ?)",
+                (job_id, JOB_PENDING, json.dumps(file_set), now, now)
+            )
+            db.execute("COMMIT")
+        logger.debug(f"SQLiteArchiverJobQueue.enqueue(): job '{job_id}' queued")
+
+    def claim(self, worker: str, lease: float = ARCHIVER_JOB_LEASE) -> Optional[Tuple[str, Dict]]:
+        """
+        Atomically claims the oldest pending job (or abandoned running job) for a worker.
+
+        :param worker: identifier of the worker claiming the job
+        :param lease: seconds without heartbeat after which a running job is deemed abandoned
+        :return: 2-tuple of the identifier and KGE File Set state of the claimed job, None if no job is available
+        """
+        now = time.time()
+        with self._connection() as db:
+            db.execute("BEGIN IMMEDIATE")
+            row = db.execute(
+                "SELECT job_id, file_set FROM archiver_job " +
+                "WHERE status = ? OR (status = ? AND updated < ?) ORDER BY created LIMIT 1",
+                (JOB_PENDING, JOB_RUNNING, now - lease)
+            ).fetchone()
+            if row:
+                db.execute(
+                    "UPDATE archiver_job SET status = ?, worker = ?, updated = ? WHERE job_id = ?",
+                    (JOB_RUNNING, worker, now, row[0])
+                )
+            db.execute("COMMIT")
+        if not row:
+            return None
+        logger.debug(f"SQLiteArchiverJobQueue.claim(): job '{row[0]}' claimed by worker '{worker}'")
+        return row[0], json.loads(row[1])
+
+    def heartbeat(self, job_id: str):
+        """
+        Renews the lease of a running job.
+
+        :param job_id:
+        """
+        with self._connection() as db:
+            db.execute(
+                "UPDATE archiver_job SET updated = ? WHERE job_id = ? AND status = ?",
+                (time.time(), job_id, JOB_RUNNING)
+            )
+
+    def start(self, job_id: str, worker: str):
+        """
+        Marks a job as running.
+
+        :param job_id:
+        :param worker: identifier of the worker running the job
+        """
+        with self._connection() as db:
+            db.execute(
+                "UPDATE archiver_job SET status = ?, worker = ?, updated = ? WHERE job_id = ?",
+                (JOB_RUNNING, worker, time.time(), job_id)
+            )
+
+    def checkpoint(self, job_id: str, step: str, file_set: Dict, seconds: Optional[float] = None):
+        """
+        Records the completion of a step of a job, with the updated state of its KGE File Set.
+
+        :param job_id:
+        :param step: one of the ARCHIVER_STEPS
+        :param file_set: (JSON serializable) state of the KGE File Set after the step
+        :param seconds: (optional) duration of the step
+        """
+        now = time.time()
+        with self._connection() as db:
+            db.execute("BEGIN IMMEDIATE")
+            db.execute(
+                "INSERT OR REPLACE INTO archiver_step (job_id, step, seconds, completed) VALUES (?, ?, ?, ?)",
+                (job_id, step, seconds, now)
+            )
+            db.execute(
+                "UPDATE archiver_job SET file_set = ?, updated = ? WHERE job_id = ?",
+                (json.dumps(file_set), now, job_id)
+            )
+            db.execute("COMMIT")
+        logger.debug(f"SQLiteArchiverJobQueue.checkpoint(): job '{job_id}' step '{step}' completed")
+
+    def _set_status(self, job_id: str, status: str, error: Optional[str] = None):
+        with self._connection() as db:
+            db.execute(
+                "UPDATE archiver_job SET status = ?, error = ?, updated = ? WHERE job_id = ?",
+                (status, error, time.time(), job_id)
+            )
+
+    def get_status(self, job_id: str) -> Optional[str]:
+        """
+        :param job_id:
+        :return: status of the job, None if unknown
+        """
+        with self._connection() as db:
+            row = db.execute("SELECT status FROM archiver_job WHERE job_id = ?", (job_id,)).fetchone()
+        return row[0] if row else None
+
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        """
+        :param job_id:
+        :return: dictionary of the 'status', 'file_set' (state), 'worker' and 'error' of the job, None if unknown
+        """
+        with self._connection() as db:
+            row = db.execute(
+                "SELECT status, file_set, worker, error FROM archiver_job WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if not row:
+            return None
+        return {"status": row[0], "file_set": json.loads(row[1]), "worker": row[2], "error": row[3]}
+
+    def get_completed_steps(self, job_id: str) -> Dict[str, Optional[float]]:
+        """
+        :param job_id:
+        :return: dictionary of the durations (in seconds, if recorded) of the completed steps of the job
+        """
+        with self._connection() as db:
+            rows = db.execute("SELECT step, seconds FROM archiver_step WHERE job_id = ?", (job_id,)).fetchall()
+        return {step: seconds for step, seconds in rows}
+
+    def get_unfinished_jobs(self) -> List[Tuple[str, Dict]]:
+        """
+        :return: list of the identifiers and KGE File Set states of the pending
+                 or (interrupted) running jobs, in order of their creation
+        """
+        with self._connection() as db:
+            rows = db.execute(
+                "SELECT job_id, file_set FROM archiver_job WHERE status IN (?, ?) ORDER BY created",
+                (JOB_PENDING, JOB_RUNNING)
+            ).fetchall()
+        return [(job_id, json.loads(file_set)) for job_id, file_set in rows]
+
+
+def _names(*attributes: str) -> Dict[str, str]:
+    # DynamoDB expression attribute names, sidestepping its (many) reserved words, e.g. 'status'
+    return {f"#{attribute}": attribute for attribute in attributes}
+
+
+def _number(value: Optional[float]) -> Dict:
+    return {'N': repr(value)} if value is not None else {'NULL': True}
+
+
+def _string(value: Optional[str]) -> Dict:
+    return {'S': value} if value is not None else {'NULL': True}
+
+
+def _file_set(file_set: Dict) -> Dict:
+    # the KGE File Set state is compressed, DynamoDB items being limited to 400 kilobytes
+    return {'B': zlib.compress(json.dumps(file_set).encode('utf-8'))}
+
+
+def _state(value: Dict) -> Dict:
+    return json.loads(zlib.decompress(value['B']).decode('utf-8'))
+
+
+class DynamoDBArchiverJobQueue(ArchiverJobQueue):
+    """
+    AWS DynamoDB table backed record of the KGE Archiver jobs and their completed (checkpointed) steps.
+
+    Each job is an item of the table, keyed on its 'job_id', holding the (compressed) state of its
+    KGE File Set and a map of its completed steps. A job is claimed by a conditional write, which
+    only succeeds if the job is still pending (or its lease expired) when written, hence the queue
+    may be shared by the web services and archiver worker services of several hosts. The (few) jobs
+    are found by consistent scans of the table.
+    """
+    def __init__(self, table_name: str = Archiver_Job_Queue_Table, client=None):
+        """
+        :param table_name: name of the DynamoDB table (created, if necessary)
+        :param client: (optional) DynamoDB client, by default that of the application AWS IAM role
+        """
+        if client is None:
+            from kgea.server.web_services.kgea_file_ops import dynamodb_client
+            client = dynamodb_client()
+        self.client = client
+        self.table_name = table_name
+        try:
+            self.client.describe_table(TableName=table_name)
+        except ClientError as error:
+            if error.response['Error']['Code'] != 'ResourceNotFoundException':
+                raise
+            logger.info(f"DynamoDBArchiverJobQueue(): creating the job queue table '{table_name}'")
+            try:
+                self.client.create_table(
+                    TableName=table_name,
+                    AttributeDefinitions=[{'AttributeName': 'job_id', 'AttributeType': 'S'}],
+                    KeySchema=[{'AttributeName': 'job_id', 'KeyType': 'HASH'}],
+                    BillingMode='PAY_PER_REQUEST'
+                )
+            except ClientError as error:
+                # the table is being created by another host
+                if error.response['Error']['Code'] != 'ResourceInUseException':
+                    raise
+            self.client.get_waiter('table_exists').wait(TableName=table_name)
+
+    def _update(
+            self,
+            job_id: str,
+            update: str,
+            condition: str,
+            names: Dict[str, str],
+            values: Dict[str, Dict],
+            **kwargs
+    ) -> Optional[Dict]:
+        """
+        Conditionally updates the item of a job.
+
+        :param job_id:
+        :param update: DynamoDB update expression
+        :param condition: DynamoDB condition expression
+        :param names: expression attribute names
+        :param values: expression attribute values
+        :param kwargs: other update_item() arguments, e.g. ReturnValues
+        :return: (requested) attributes of the updated item, None if the condition does not hold
+        """
+        try:
+            response = self.client.update_item(
+                TableName=self.table_name,
+                Key={'job_id': {'S': job_id}},
+                UpdateExpression=update,
+                ConditionExpression=condition,
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values,
+                **kwargs
+            )
+        except ClientError as error:
+            if error.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return None
+            raise
+        return response.get('Attributes', dict())
+
+    def _scan(self, condition: str, attributes: List[str], values: Dict[str, Dict]) -> List[Dict]:
+        """
+        :param condition: DynamoDB filter expression
+        :param attributes: attributes of the items returned (including those of the filter expression)
+        :param values: expression attribute values
+        :return: list of the job items satisfying the condition, in order of their creation
+        """
+        names = _names(*attributes)
+        kwargs = dict(
+            TableName=self.table_name,
+            FilterExpression=condition,
+            ProjectionExpression=", ".join(names),
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values,
+            ConsistentRead=True
+        )
+        items: List[Dict] = list()
+        while True:
+            response = self.client.scan(**kwargs)
+            items.extend(response.get('Items', []))
+            if 'LastEvaluatedKey' not in response:
+                break
+            kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        return sorted(items, key=lambda item: float(item['created']['N']))
+
+    def enqueue(self, job_id: str, file_set: Dict):
+        """
+        Records a new (pending) job, replacing any earlier job (and its checkpoints) of the same identifier.
+
+        :param job_id: job identifier, i.e. the KGE File Set identifier
+        :param file_set: (JSON serializable) state of the KGE File Set
+        """
+        now = time.time()
+        self.client.put_item(
+            TableName=self.table_name,
+            Item={
+                'job_id': {'S': job_id},
+                'status': {'S': JOB_PENDING},
+                'file_set': _file_set(file_set),
+                'worker': {'NULL': True},
+                'error': {'NULL': True},
+                'created': _number(now),
+                'updated': _number(now),
+                'steps': {'M': dict()}
+            }
+        )
+        logger.debug(f"DynamoDBArchiverJobQueue.enqueue(): job '{job_id}' queued")
+
+    def claim(self, worker: str, lease: float = ARCHIVER_JOB_LEASE) -> Optional[Tuple[str, Dict]]:
+        """
+        Atomically claims the oldest pending job (or abandoned running job) for a worker.
+
+        :param worker: identifier of the worker claiming the job
+        :param lease: seconds without heartbeat after which a running job is deemed abandoned
+        :return: 2-tuple of the identifier and KGE File Set state of the claimed job, None if no job is available
+        """
+        now = time.time()
+        claimable = "#status = :pending OR (#status = :running AND #updated < :expiry)"
+        values = {
+            ':pending': {'S': JOB_PENDING},
+            ':running': {'S': JOB_RUNNING},
+            ':expiry': _number(now - lease)
+        }
+        for item in self._scan(claimable, ['job_id', 'status', 'updated', 'created'], values):
+            job_id = item['job_id']['S']
+            # the job may have been claimed by another worker since the scan, then failing the condition
+            claimed = self._update(
+                job_id,
+                "SET #status = :running, #worker = :worker, #updated = :now",
+                claimable,
+                _names('status', 'worker', 'updated'),
+                {**values, ':worker': {'S': worker}, ':now': _number(now)},
+                ReturnValues='ALL_NEW'
+            )
+            if claimed is not None:
+                logger.debug(f"DynamoDBArchiverJobQueue.claim(): job '{job_id}' claimed by worker '{worker}'")
+                return job_id, _state(claimed['file_set'])
+        return None
+
+    def heartbeat(self, job_id: str):
+        """
+        Renews the lease of a running job.
+
+        :param job_id:
+        """
+        self._update(
+            job_id,
+            "SET #updated = :now",
+            "#status = :running",
+            _names('status', 'updated'),
+            {':now': _number(time.time()), ':running': {'S': JOB_RUNNING}}
+        )
+
+    def start(self, job_id: str, worker: str):
+        """
+        Marks a job as running.
+
+        :param job_id:
+        :param worker: identifier of the worker running the job
+        """
+        self._update(
+            job_id,
+            "SET #status = :running, #worker = :worker, #updated = :now",
+            "attribute_exists(#job_id)",
+            _names('job_id', 'status', 'worker', 'updated'),
+            {':running': {'S': JOB_RUNNING}, ':worker': {'S': worker}, ':now': _number(time.time())}
+        )
+
+    def checkpoint(self, job_id: str, step: str, file_set: Dict, seconds: Optional[float] = None):
+        """
+        Records the completion of a step of a job, with the updated state of its KGE File Set.
+
+        :param job_id:
+        :param step: one of the ARCHIVER_STEPS
+        :param file_set: (JSON serializable) state of the KGE File Set after the step
+        :param seconds: (optional) duration of the step
+        """
+        now = time.time()
+        self._update(
+            job_id,
+            "SET #steps.#step = :step, #file_set = :file_set, #updated = :now",
+            "attribute_exists(#job_id)",
+            {**_names('job_id', 'steps', 'file_set', 'updated'), '#step': step},
+            {
+                ':step': {'M': {'seconds': _number(seconds), 'completed': _number(now)}},
+                ':file_set': _file_set(file_set),
+                ':now': _number(now)
+            }
+        )
+        logger.debug(f"DynamoDBArchiverJobQueue.checkpoint(): job '{job_id}' step '{step}' completed")
+
+    def _set_status(self, job_id: str, status: str, error: Optional[str] = None):
+        self._update(
+            job_id,
+            "SET #status = :status, #error = :error, #updated = :now",
+            "attribute_exists(#job_id)",
+            _names('job_id', 'status', 'error', 'updated'),
+            {':status': {'S': status}, ':error': _string(error), ':now': _number(time.time())}
+        )
+
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        """
+        :param job_id:
+        :return: dictionary of the 'status', 'file_set' (state), 'worker' and 'error' of the job, None if unknown
+        """
+        item = self.client.get_item(
+            TableName=self.table_name, Key={'job_id': {'S': job_id}}, ConsistentRead=True
+        ).get('Item')
+        if not item:
+            return None
+        return {
+            "status": item['status']['S'],
+            "file_set": _state(item['file_set']),
+            "worker": item['worker'].get('S'),
+            "error": item['error'].get('S')
+        }
+
+    def get_completed_steps(self, job_id: str) -> Dict[str, Optional[float]]:
+        """
+        :param job_id:
+        :return: dictionary of the durations (in seconds, if recorded) of the completed steps of the job
+        """
+        item = self.client.get_item(
+            TableName=self.table_name,
+            Key={'job_id': {'S': job_id}},
+            ProjectionExpression="#steps",
+            ExpressionAttributeNames=_names('steps'),
+            ConsistentRead=True
+        ).get('Item')
+        if not item:
+            return dict()
+        return {
+            step: float(entry['M']['seconds']['N']) if 'N' in entry['M']['seconds'] else None
+            for step, entry in item['steps']['M'].items()
+        }
+
+    def get_unfinished_jobs(self) -> List[Tuple[str, Dict]]:
+        """
+        :return: list of the identifiers and KGE File Set states of the pending
+                 or (interrupted) running jobs, in order of their creation
+        """
+        items = self._scan(
+            "#status IN (:pending, :running)",
+            ['job_id', 'status', 'created', 'file_set'],
+            {':pending': {'S': JOB_PENDING}, ':running': {'S': JOB_RUNNING}}
+        )
+        return [(item['job_id']['S'], _state(item['file_set'])) for item in items]
+
+
+def get_archiver_job_queue(backend: str = Archiver_Job_Queue_Backend) -> ArchiverJobQueue:
+    """
+    :param backend: job queue backend, 'sqlite' (single host) or 'dynamodb' (shared between hosts)
+    :return: KGE Archiver job queue of the (configured) backend
+    :raises RuntimeError: if the backend is unknown
+    """
+    if backend == 'sqlite':
+        return SQLiteArchiverJobQueue()
+    elif backend == 'dynamodb':
+        return DynamoDBArchiverJobQueue()
+    raise RuntimeError(f"get_archiver_job_queue(): unknown Archiver_Job_Queue_Backend '{backend}'")
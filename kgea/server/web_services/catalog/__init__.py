@@ -15,10 +15,10 @@ KGE_SMARTAPI_DIRECTORY = "translator_knowledge_graph_archive"
 """
 from sys import stderr
 
-from os import getenv
+from os import getenv, getpid, mkfifo, O_RDONLY, O_NONBLOCK, open as os_open, close as os_close
 from os.path import dirname, abspath
 
-from typing import Dict, Union, Set, List, Any, Optional, Tuple
+from typing import Dict, Union, Set, List, Any, Optional, Tuple, Callable
 from enum import Enum
 from string import Template, punctuation
 from datetime import date, datetime
@@ -29,13 +29,22 @@ from datetime import date, datetime
 import re
 
 import threading
+from collections import OrderedDict
+import gzip
+import hashlib
+import time
+from socket import gethostname
+from multiprocessing import Manager
+from concurrent.futures import ProcessPoolExecutor
 from asyncio import (
     create_task,
     gather,
+    get_running_loop,
     sleep,
     Queue,
     Task,
     QueueFull,
+    as_completed,
     run
 )
 
@@ -60,6 +69,7 @@ except ImportError:
 from github import Github
 from github.GithubException import UnknownObjectException, BadCredentialsException
 
+import requests
 import smart_open
 
 from kgx.utils.kgx_utils import GraphEntityType
@@ -86,6 +96,7 @@ from kgea.server.web_services.kgea_file_ops import (
     get_default_date_stamp,
     get_object_location,
     get_archive_contents,
+    load_archive_contents,
     get_object_key,
     with_version,
     load_s3_text_file,
@@ -96,10 +107,28 @@ from kgea.server.web_services.kgea_file_ops import (
     random_alpha_string,
     object_key_exists,
     extract_data_archive,
-    create_presigned_url
+    create_presigned_url,
+    get_line_aligned_ranges,
+    get_first_line,
+    verify_archive_manifest
+)
+
+from kgea.server.web_services.archiver_jobs import (
+    ArchiverJobQueue,
+    get_archiver_job_queue,
+    ARCHIVER_STAGES,
+    ARCHIVER_JOB_LEASE,
+    JOB_COMPLETED,
+    JOB_FAILED
 )
 
 from kgea.server.web_services.sha_utils import sha1_manifest
+from kgea.server.web_services.content_metadata import (
+    archive_data_keys,
+    compute_content_metadata,
+    compare_content_metadata
+)
+from kgea.server.web_services.cross_references import check_cross_references
 
 import logging
 logger = logging.getLogger(__name__)
@@ -139,6 +168,33 @@ Number_of_Archiver_Tasks = \
 Number_of_Validator_Tasks = \
     _KGEA_APP_CONFIG['Number_of_Validator_Tasks'] if 'Number_of_Validator_Tasks' in _KGEA_APP_CONFIG else 1
 
+# KGE Archiver mode: 'local', for archiver worker tasks running inside the web services, or 'remote',
+# for the web services only posting jobs to the shared archiver job queue, which are then run by
+# separate archiver worker service processes (see kgea.server.archiver)
+Archiver_Mode = \
+    _KGEA_APP_CONFIG['Archiver_Mode'] if 'Archiver_Mode' in _KGEA_APP_CONFIG else 'local'
+
+# Interval (in seconds) between checks of the status of remotely run archiver jobs
+ARCHIVER_POLL_INTERVAL = 10
+
+# Number of (KGX) Validator worker processes, per Biolink Model release
+Number_of_Validator_Processes = \
+    _KGEA_APP_CONFIG['Number_of_Validator_Processes'] if 'Number_of_Validator_Processes' in _KGEA_APP_CONFIG else 1
+
+# Maximum number of KGX validation error messages reported back to a KGE File Set
+MAX_VALIDATION_ERROR_SAMPLE = 100
+
+# Nominal size (in bytes) of the line aligned shards of uncompressed KGX data files validated in
+# parallel, by the KGX Validator worker processes. Set to zero to disable sharded validation.
+Validation_Shard_Size = \
+    _KGEA_APP_CONFIG['Validation_Shard_Size'] if 'Validation_Shard_Size' in _KGEA_APP_CONFIG else 2**30
+
+# Size of the chunks streamed from S3 into the validation of a KGX data file shard
+_SHARD_DOWNLOAD_CHUNK_SIZE = 8 * 2**20
+
+# Maximum time (in seconds) waited for the end of the streaming of a KGX data file shard, after its validation
+_SHARD_WRITER_TIMEOUT = 60
+
 # TODO: operational parameter dependent configuration
 MAX_WAIT = 100  # number of iterations until we stop pushing onto the queue. -1 for unlimited waits
 MAX_QUEUE = 0  # amount of queueing until we stop pushing onto the queue. 0 for unlimited queue items
@@ -298,7 +354,10 @@ class KgeFileSet:
         # no errors to start
         self.errors: List[str] = list()
 
-        self.status: KgeFileSetStatusCode
+        # KGX validation progress counts (i.e. 'node_count', 'edge_count' and 'error_count')
+        self.validation_progress: Dict[str, int] = dict()
+
+        self._status: KgeFileSetStatusCode
 
         if archive_record:
             # File Set read in from the Archive
@@ -310,6 +369,24 @@ class KgeFileSet:
 
     def __str__(self):
         return f"File set version '{self.fileset_version}' of graph '{self.kg_id}': {self.data_files}"
+
+    @property
+    def status(self) -> KgeFileSetStatusCode:
+        """
+        :return: KgeFileSetStatusCode of the KGE File Set
+        """
+        return self._status
+
+    @status.setter
+    def status(self, status: KgeFileSetStatusCode):
+        """
+        Sets the status of the KGE File Set, invalidating the (cached) catalog entries,
+        which only list the validated file sets.
+
+        :param status: KgeFileSetStatusCode of the KGE File Set
+        """
+        self._status = status
+        KnowledgeGraphCatalog.invalidate_kg_entries()
     
     def is_validated(self) -> bool:
         """
@@ -338,6 +415,59 @@ class KgeFileSet:
         """
         return self.status
 
+    def get_validation_progress(self) -> Dict[str, int]:
+        """
+        :return: (snapshot of the) KGX validation progress counts of the KGE File Set
+        """
+        return dict(self.validation_progress)
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        :return: JSON serializable snapshot of the KGE File Set, for the durable KGE Archiver job queue
+        """
+        data_files: Dict[str, Dict[str, Any]] = dict()
+        for object_key, entry in self.data_files.items():
+            data_files[object_key] = dict(entry)
+            if "file_type" in entry:
+                data_files[object_key]["file_type"] = entry["file_type"].value
+        return {
+            "kg_id": self.kg_id,
+            "biolink_model_release": self.biolink_model_release,
+            "fileset_version": self.fileset_version,
+            "submitter_name": self.submitter_name,
+            "submitter_email": self.submitter_email,
+            "size": self.size,
+            "revisions": self.revisions,
+            "date_stamp": self.date_stamp,
+            "content_metadata": self.content_metadata,
+            "data_files": data_files,
+            "errors": self.errors
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]):
+        """
+        :param state: KGE File Set snapshot, as returned by get_state()
+        :return: KgeFileSet restored from the snapshot
+        """
+        file_set = cls(
+            kg_id=state["kg_id"],
+            biolink_model_release=state["biolink_model_release"],
+            fileset_version=state["fileset_version"],
+            submitter_name=state["submitter_name"],
+            submitter_email=state["submitter_email"],
+            size=state["size"],
+            revisions=state["revisions"],
+            date_stamp=state["date_stamp"]
+        )
+        file_set.content_metadata = state["content_metadata"]
+        for object_key, entry in state["data_files"].items():
+            if "file_type" in entry:
+                entry["file_type"] = KgeFileType(entry["file_type"])
+            file_set.data_files[object_key] = entry
+        file_set.errors = state["errors"]
+        return file_set
+
     def get_kg_id(self):
         """
         :return: the knowledge graph identifier string
@@ -499,6 +629,9 @@ class KgeFileSet:
         else:
             self.content_metadata["errors"] = errors
 
+        # Keep the parsed content metadata at hand, for serving by the meta_knowledge_graph endpoint
+        cache_content_metadata(self.kg_id, self.fileset_version, metadata_json)
+
     def add_data_file(
             self,
             file_type: KgeFileType,
@@ -994,6 +1127,7 @@ class KgeKnowledgeGraph:
         :return:
         """
         self._file_set_versions[fileset_version] = file_set
+        KnowledgeGraphCatalog.invalidate_kg_entries()
 
     def load_fileset_metadata(self, metadata_text: str) -> KgeFileSet:
         """
@@ -1125,18 +1259,88 @@ class KnowledgeGraphCatalog:
     """
     _the_catalog = None
 
+    # Serialized (JSON, then gzip compressed) catalog entries, with their ETag,
+    # rebuilt on demand after any change of the catalog (see invalidate_kg_entries())
+    _kg_entries_payload: Optional[Tuple[bytes, bytes, str]] = None
+    _kg_entries_generation: int = 0
+    _kg_entries_lock = threading.Lock()
+
     def __init__(self):
         # Catalog keys are kg_id's, entries are a Python dictionary of kg_id metadata including
         # name, KGE File Set metadata and a list of versions with associated file sets
         self._kge_knowledge_graph_catalog: Dict[str, KgeKnowledgeGraph] = dict()
 
         # Initialize catalog with the metadata of all the existing KGE Archive (AWS S3 stored) KGE File Sets
-        # archive_contents keys are the kg_id's, entries are the rest of the KGE File Set metadata
-        archive_contents: Dict = get_archive_contents(bucket_name=default_s3_bucket)
+        # archive_contents keys are the kg_id's, entries are the rest of the KGE File Set metadata.
+        # The contents are taken from the persisted KGE Archive index snapshot, if any, then brought up
+        # to date in the background; otherwise (i.e. on a cold start), from a listing of the whole archive.
+        archive_contents: Optional[Dict] = load_archive_contents(bucket_name=default_s3_bucket)
+        from_snapshot: bool = archive_contents is not None
+        if not from_snapshot:
+            archive_contents = get_archive_contents(bucket_name=default_s3_bucket)
         for kg_id, entry in archive_contents.items():
             if self.is_complete_kg(kg_id, entry):
                 self.load_archive_entry(kg_id=kg_id, entry=entry)
 
+        if from_snapshot:
+            threading.Thread(
+                target=self.refresh_archive_contents, args=(archive_contents,),
+                name="KGE Archive catalog refresh", daemon=True
+            ).start()
+
+    def refresh_archive_contents(self, snapshot_contents: Dict):
+        """
+        Brings the catalog, initialized from the KGE Archive index snapshot, up to date with the
+        current contents of the KGE Archive (also refreshing the snapshot), in a background thread.
+
+        :param snapshot_contents: KGE Archive contents recorded by the index snapshot
+        """
+        try:
+            archive_contents: Dict = get_archive_contents(bucket_name=default_s3_bucket)
+        except Exception as exc:
+            logger.error(f"refresh_archive_contents(): KGE Archive catalog not refreshed? {str(exc)}")
+            return
+        for kg_id, entry in archive_contents.items():
+            self.merge_archive_entry(kg_id, entry, snapshot_contents.get(kg_id, dict()))
+        logger.info("refresh_archive_contents(): KGE Archive catalog refreshed")
+
+    def merge_archive_entry(self, kg_id: str, entry: Dict, snapshot_entry: Dict):
+        """
+        Merges a (current) KGE Archive entry into the catalog: new knowledge graphs, new file set versions
+        and new data files are added, while archived file sets whose metadata changed since the index
+        snapshot are reloaded (unless they were processed since, e.g. published anew by this service).
+
+        :param kg_id: identifier of the knowledge graph
+        :param entry: current KGE Archive entry of the knowledge graph (see load_archive_entry())
+        :param snapshot_entry: KGE Archive entry of the knowledge graph recorded by the index snapshot
+        """
+        knowledge_graph: Optional[KgeKnowledgeGraph] = self.get_knowledge_graph(kg_id)
+        if not knowledge_graph:
+            if self.is_complete_kg(kg_id, entry):
+                self.load_archive_entry(kg_id=kg_id, entry=entry)
+            return
+
+        snapshot_versions: Dict = snapshot_entry.get('versions', dict())
+        reloaded_versions: Dict = dict()
+        for fileset_version, version_entry in entry.get('versions', dict()).items():
+            file_set: Optional[KgeFileSet] = knowledge_graph.get_file_set(fileset_version=fileset_version)
+            if file_set is None or (
+                    fileset_version in snapshot_versions and
+                    version_entry.get('metadata') != snapshot_versions[fileset_version].get('metadata') and
+                    file_set.status == KgeFileSetStatusCode.VALIDATED
+            ):
+                reloaded_versions[fileset_version] = version_entry
+            else:
+                new_object_keys = [
+                    object_key for object_key in version_entry['file_object_keys']
+                    if object_key not in file_set.data_files
+                ]
+                if new_object_keys:
+                    file_set.load_data_files(new_object_keys)
+                    self.invalidate_kg_entries()
+        if reloaded_versions:
+            knowledge_graph.load_file_set_versions(versions=reloaded_versions)
+
     @staticmethod
     def is_complete_kg(kg_id, entry) -> bool:
         """
@@ -1304,6 +1508,7 @@ class KnowledgeGraphCatalog:
         kg_id = kwargs['kg_id']
         if kg_id not in self._kge_knowledge_graph_catalog:
             self._kge_knowledge_graph_catalog[kg_id] = KgeKnowledgeGraph(**kwargs)
+            self.invalidate_kg_entries()
         return self._kge_knowledge_graph_catalog[kg_id]
 
     def get_knowledge_graph(self, kg_id: str) -> Union[KgeKnowledgeGraph, None]:
@@ -1407,6 +1612,38 @@ class KnowledgeGraphCatalog:
 
         return catalog
 
+    @classmethod
+    def invalidate_kg_entries(cls):
+        """
+        Discards the serialized catalog entries, after a knowledge graph or file set
+        is added to the catalog, or the status of a file set changes.
+        """
+        with cls._kg_entries_lock:
+            cls._kg_entries_payload = None
+            cls._kg_entries_generation += 1
+
+    def get_kg_entries_payload(self) -> Tuple[bytes, bytes, str]:
+        """
+        Get the serialized KGE Knowledge Graph Entries, computed once, then
+        cached until the catalog changes (see invalidate_kg_entries()).
+
+        :return: 3-tuple of the catalog entries as JSON, as gzip compressed JSON, and the (HTTP) ETag of the JSON
+        """
+        with self._kg_entries_lock:
+            payload = self._kg_entries_payload
+            generation = self._kg_entries_generation
+        if payload:
+            return payload
+
+        payload = serialize_json(self.get_kg_entries())
+
+        with self._kg_entries_lock:
+            # only cache the payload if the catalog did not change (i.e. was not
+            # invalidated, bumping its generation) while the payload was computed
+            if KnowledgeGraphCatalog._kg_entries_generation == generation:
+                KnowledgeGraphCatalog._kg_entries_payload = payload
+        return payload
+
 
 # TODO
 @prepare_test
@@ -1871,6 +2108,125 @@ def validate_content_metadata(content_metadata_file) -> List:
         return ["No file name provided - nothing to validate"]
 
 
+# Maximum number of KGE File Sets whose (parsed) content metadata is cached in memory
+Content_Metadata_Cache_Size = \
+    _KGEA_APP_CONFIG['Content_Metadata_Cache_Size'] if 'Content_Metadata_Cache_Size' in _KGEA_APP_CONFIG else 64
+
+# Least recently used cache of the content metadata of KGE File Sets, indexed by (kg_id, fileset_version)
+_content_metadata_cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+_content_metadata_lock = threading.Lock()
+
+# Number of invalidations of cached content metadata, telling whether content metadata loaded from S3 may be stale
+_content_metadata_generation: int = 0
+
+
+def serialize_json(content: Any) -> Tuple[bytes, bytes, str]:
+    """
+    Serializes JSON content once, for (repeated) direct serving in HTTP responses.
+
+    :param content: JSON serializable content
+    :return: 3-tuple of the content as JSON, as gzip compressed JSON, and the (quoted HTTP) ETag of the JSON
+    """
+    body: bytes = json.dumps(content, separators=(',', ':')).encode('utf-8')
+    return body, gzip.compress(body), f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+def cache_content_metadata(kg_id: str, fileset_version: str, metadata: Dict) -> Dict[str, Any]:
+    """
+    Caches the (parsed) content metadata of a KGE File Set, evicting the
+    least recently used entry once Content_Metadata_Cache_Size entries are cached.
+
+    :param kg_id: identifier of the knowledge graph of the KGE File Set
+    :param fileset_version: version of the KGE File Set
+    :param metadata: content metadata (meta knowledge graph) JSON, as a Python dictionary
+    :return: the cache entry of the content metadata (see get_content_metadata())
+    """
+    body, gzip_body, etag = serialize_json(metadata)
+    entry = {"metadata": metadata, "body": body, "gzip": gzip_body, "etag": etag}
+    if Content_Metadata_Cache_Size <= 0:
+        return entry
+    with _content_metadata_lock:
+        _content_metadata_cache[(kg_id, fileset_version)] = entry
+        _content_metadata_cache.move_to_end((kg_id, fileset_version))
+        while len(_content_metadata_cache) > Content_Metadata_Cache_Size:
+            _content_metadata_cache.popitem(last=False)
+    return entry
+
+
+def invalidate_content_metadata(kg_id: str, fileset_version: str):
+    """
+    Discards the cached content metadata of a KGE File Set.
+
+    :param kg_id: identifier of the knowledge graph of the KGE File Set
+    :param fileset_version: version of the KGE File Set
+    """
+    global _content_metadata_generation
+    with _content_metadata_lock:
+        _content_metadata_cache.pop((kg_id, fileset_version), None)
+        _content_metadata_generation += 1
+
+
+def get_content_metadata(kg_id: str, fileset_version: str, object_key: Optional[str] = None) -> Optional[Dict]:
+    """
+    Get the content metadata of a KGE File Set, from the cache or else,
+    if an object key is given, loaded (then cached) from S3.
+
+    :param kg_id: identifier of the knowledge graph of the KGE File Set
+    :param fileset_version: version of the KGE File Set
+    :param object_key: (optional) S3 object key of the content metadata file of the KGE File Set
+    :return: dictionary of the parsed content 'metadata', its serialized JSON 'body', the gzip
+             compressed 'gzip' JSON and the 'etag' of the JSON; None if the content metadata is unavailable
+    """
+    with _content_metadata_lock:
+        entry = _content_metadata_cache.get((kg_id, fileset_version))
+        if entry:
+            _content_metadata_cache.move_to_end((kg_id, fileset_version))
+            return entry
+        generation = _content_metadata_generation
+
+    if not (object_key and object_key_exists(object_key=object_key)):
+        return None
+
+    try:
+        metadata = json.loads(load_s3_text_file(bucket_name=default_s3_bucket, object_name=object_key))
+    except json.JSONDecodeError as jde:
+        logger.error(f"get_content_metadata(): content metadata file '{object_key}' is not valid JSON: {str(jde)}")
+        return None
+
+    if generation != _content_metadata_generation:
+        # content metadata invalidated while it was loaded, hence possibly stale: served, but not cached
+        body, gzip_body, etag = serialize_json(metadata)
+        return {"metadata": metadata, "body": body, "gzip": gzip_body, "etag": etag}
+
+    return cache_content_metadata(kg_id, fileset_version, metadata)
+
+
+def filter_content_metadata(
+        metadata: Dict,
+        categories: Optional[List[str]] = None,
+        predicates: Optional[List[str]] = None
+) -> Dict:
+    """
+    Filters the content metadata (meta knowledge graph) of a KGE File Set.
+
+    :param metadata: content metadata JSON, as a Python dictionary
+    :param categories: (optional) node categories retained, with the edges with a subject or object of these categories
+    :param predicates: (optional) predicates of the edges retained
+    :return: filtered content metadata
+    """
+    nodes: Dict = metadata.get("nodes", dict())
+    edges: List[Dict] = metadata.get("edges", list())
+    if categories:
+        nodes = {category: node for category, node in nodes.items() if category in categories}
+        edges = [
+            edge for edge in edges
+            if edge.get("subject") in categories or edge.get("object") in categories
+        ]
+    if predicates:
+        edges = [edge for edge in edges if edge.get("predicate") in predicates]
+    return {**metadata, "nodes": nodes, "edges": edges}
+
+
 def get_default_model_version():
     """
     
@@ -1888,9 +2244,14 @@ class ProgressMonitor:
     # TODO: how do we best track the validation here?
     #       We start by simply counting the nodes and edges
     #       and periodically reporting to debug logger.
-    def __init__(self):
+    def __init__(self, progress: Optional[Dict[str, int]] = None):
+        """
+        :param progress: (optional) dictionary (possibly, a multiprocessing proxy) into
+                         which the node and edge counts are periodically reported
+        """
         self._node_count = 0
         self._edge_count = 0
+        self._progress = progress
 
     def __call__(self, entity_type: GraphEntityType, rec: List):
         logger.setLevel(logging.DEBUG)
@@ -1898,13 +2259,28 @@ class ProgressMonitor:
             self._edge_count += 1
             if self._edge_count % 100000 == 0:
                 logger.info(str(self._edge_count) + " edges processed so far...")
+                self.report()
         elif entity_type == GraphEntityType.NODE:
             self._node_count += 1
             if self._node_count % 10000 == 0:
                 logger.info(str(self._node_count) + " nodes processed so far...")
+                self.report()
         else:
             logger.warning("Unexpected GraphEntityType: " + str(entity_type))
 
+    def report(self):
+        """
+        Reports the current node and edge counts into the progress dictionary, if any
+        """
+        if self._progress is not None:
+            self._progress.update({'node_count': self._node_count, 'edge_count': self._edge_count})
+
+    def get_counts(self) -> Dict[str, int]:
+        """
+        :return: dictionary of the node and edge counts seen so far
+        """
+        return {'node_count': self._node_count, 'edge_count': self._edge_count}
+
 
 class KgeArchiver:
     """
@@ -1914,9 +2290,14 @@ class KgeArchiver:
     # we leave the Queue open ended now...
     #
     # def __init__(self, max_tasks=Number_of_Archiver_Tasks, max_queue=MAX_QUEUE, max_wait=MAX_WAIT):
-    def __init__(self, max_tasks=Number_of_Archiver_Tasks, max_wait=MAX_WAIT):
+    def __init__(self, max_tasks=Number_of_Archiver_Tasks, max_wait=MAX_WAIT, mode: str = Archiver_Mode):
         """
         Constructor for a single archiver task wrapper.
+
+        :param max_tasks: number of (local) archiver worker tasks
+        :param max_wait:
+        :param mode: 'local' to run the archiver jobs in worker tasks of this process,
+                     'remote' to leave them to separate archiver worker service processes
         """
         #  we won't worry about queue size in this application
         #  unless informed otherwise by our use cases...
@@ -1924,13 +2305,29 @@ class KgeArchiver:
         self._archiver_queue: Queue = Queue()  # unlimited queue size
         self._archiver_worker: List[Task] = list()
 
+        self.mode: str = mode
+        self.max_tasks: int = max_tasks if mode == 'local' else 0
+        self.max_wait: int = max_wait
+
+        # durable record of the archiver jobs and of their completed steps
+        self.job_queue: ArchiverJobQueue = get_archiver_job_queue()
+
+        # the archiving pipeline steps, by name (see ARCHIVER_STAGES)
+        self._steps: Dict[str, Callable] = {
+            "unpack": self.unpack_archives,
+            "fileset_yaml": self.publish_fileset_metadata,
+            "aggregate_nodes": self.aggregate_nodes,
+            "aggregate_edges": self.aggregate_edges,
+            "copy_metadata": self.copy_metadata,
+            "content_metadata": self.generate_content_metadata,
+            "compress": self.compress,
+            "sha1": self.verify_sha1
+        }
+
         # we hard code the creation of KgeArchiver tasks here, not later
-        for i in range(0, max_tasks):
+        for i in range(0, self.max_tasks):
             self._archiver_worker.append(create_task(self.worker()))
 
-        self.max_tasks: int = max_tasks
-        self.max_wait: int = max_wait
-
     _the_archiver = None
     
     @classmethod
@@ -1948,13 +2345,14 @@ class KgeArchiver:
             file_set: KgeFileSet,
             kgx_file_type: str,
             file_object_keys
-    ):
+    ) -> Tuple[str, str]:
         """
         Wraps file aggregator for a given file type.
         
         :param file_set: KGE File Set metadata object
         :param kgx_file_type: the core file type to be aggregated (i.e. nodes or edges)
         :param file_object_keys: list of S3 object keys of files to be aggregated
+        :return: 2-tuple of the file name and the object key of the aggregated file
         """
         key_list = "\n\t".join(file_object_keys)
 
@@ -1990,7 +2388,7 @@ class KgeArchiver:
             print_error_trace(f"{kgx_file_type} file aggregation failure! " + str(e))
             raise e
 
-        file_set.add_data_file(KgeFileType.KGX_DATA_FILE, kgx_file_type, 0, agg_path)
+        return kgx_file_type, agg_path
     
     @staticmethod
     def copy_to_kge_archive(file_set: KgeFileSet, file_name: str):
@@ -2021,181 +2419,292 @@ class KgeArchiver:
             print_error_trace(f"Failure to copy '{file_name}' file?" + str(e))
             raise e
     
-    async def worker(self, task_id=None):
+    async def unpack_archives(self, file_set: KgeFileSet):
         """
+        Unpacks any uploaded archive(s) where they belong: (JSON) content metadata, nodes and edges.
 
-        :param task_id:
+        :param file_set: KGE File Set being archived
         """
-        if task_id is None:
-            task_id = len(self._archiver_worker)
+        try:
+            archive_file_key_list = file_set.get_archive_file_keys()
+            logger.debug(f"KgeArchiver unpacking incoming tar.gz archives: {archive_file_key_list}")
 
-        while True:
-            file_set: KgeFileSet = await self._archiver_queue.get()
+            for archive_file_key in archive_file_key_list:
 
-            logger.info(f"KgeArchiver worker {task_id} starting archive of {file_set.id()}")
-            
-            # sleep briefly to yield to co-routine executed main web application code. Done several times below...
-            # 10 seconds to allow the user to go to home and get the KG catalog, before this task ties up the CPU?
-            # TODO: performance issue seems to result from execution of this code on servers with few CPU's?
-            #       Or is this a main loop blockage issue (which maybe needs to be resolved some other way?)
-            await sleep(10)
+                archive_filename = file_set.get_property_of_data_file_key(archive_file_key, 'file_name')
 
-            # 1. Unpack any uploaded archive(s) where they belong: (JSON) content metadata, nodes and edges
-            try:
-                archive_file_key_list = file_set.get_archive_file_keys()
-                logger.debug(f"KgeArchiver task {task_id} unpacking incoming tar.gz archives: {archive_file_key_list}")
-                
-                for archive_file_key in archive_file_key_list:
-                    
-                    archive_filename = file_set.get_property_of_data_file_key(archive_file_key, 'file_name')
-                    
-                    logger.debug(f"Unpacking archive {archive_filename}")
-                    
-                    #
-                    # RMB: 2021-10-07, we deprecated the RAM-based version of the 'decompress-in-place' operation,
-                    # moving instead towards the kge_extract_data_archive.bash hard disk-centric solution
-                    #
-                    # archive_file_entries = decompress_to_kgx(file_key, archive_location)
-                    #
-                    archive_file_entries: List[Dict[str, str]] = \
-                        await extract_data_archive(
-                            kg_id=file_set.get_kg_id(),
-                            file_set_version=file_set.get_fileset_version(),
-                            archive_filename=archive_filename
-                        )
-                    #
-                    # ...Remove the archive entry from the KgxFileSet...
-                    file_set.remove_data_file(archive_file_key)
-                    
-                    logger.debug(f"Adding {len(archive_file_entries)} files to fileset '{file_set.id()}':")
-                    
-                    # ...but add in the archive's files to the file set
-                    for entry in archive_file_entries:
-                        # spread the entry across the add_data_file function,
-                        # which will take all its values as arguments
-                        logger.debug(f"\t{entry['file_name']}")
-                        file_set.add_data_file(
-                            file_name=entry["file_name"],
-                            file_type=KgeFileType(int(entry["file_type"])),
-                            file_size=int(entry["file_size"]),
-                            object_key=entry["object_key"]
-                        )
+                logger.debug(f"Unpacking archive {archive_filename}")
 
-            except Exception as e:
-                # Can't be more specific than this 'cuz not sure what errors may be thrown here...
-                print_error_trace("KgeArchiver.worker(): Error while unpacking archive?: "+str(e))
-                raise e
+                #
+                # RMB: 2021-10-07, we deprecated the RAM-based version of the 'decompress-in-place' operation,
+                # moving instead towards the kge_extract_data_archive.bash hard disk-centric solution
+                #
+                # archive_file_entries = decompress_to_kgx(file_key, archive_location)
+                #
+                archive_file_entries: List[Dict[str, str]] = \
+                    await extract_data_archive(
+                        kg_id=file_set.get_kg_id(),
+                        file_set_version=file_set.get_fileset_version(),
+                        archive_filename=archive_filename
+                    )
+                #
+                # ...Remove the archive entry from the KgxFileSet...
+                file_set.remove_data_file(archive_file_key)
+
+                logger.debug(f"Adding {len(archive_file_entries)} files to fileset '{file_set.id()}':")
+
+                # ...but add in the archive's files to the file set
+                for entry in archive_file_entries:
+                    # spread the entry across the add_data_file function,
+                    # which will take all its values as arguments
+                    logger.debug(f"\t{entry['file_name']}")
+                    file_set.add_data_file(
+                        file_name=entry["file_name"],
+                        file_type=KgeFileType(int(entry["file_type"])),
+                        file_size=int(entry["file_size"]),
+                        object_key=entry["object_key"]
+                    )
 
-            logger.debug("Create and add the fileset.yaml to the KGE S3 repository")
+        except Exception as e:
+            # Can't be more specific than this 'cuz not sure what errors may be thrown here...
+            print_error_trace("KgeArchiver.unpack_archives(): Error while unpacking archive?: "+str(e))
+            raise e
 
-            try:
-                # Publish a 'file_set.yaml' metadata file to the
-                # versioned archive subdirectory containing the KGE File Set
-
-                fileset_metadata_file = file_set.generate_fileset_metadata_file()
-                fileset_metadata_object_key = add_to_s3_repository(
-                    kg_id=file_set.kg_id,
-                    text=fileset_metadata_file,
-                    file_name=FILE_SET_METADATA_FILE,
-                    fileset_version=file_set.fileset_version
-                )
-                if fileset_metadata_object_key:
-                    logger.info(f"KgeFileSet.publish(): successfully created object key {fileset_metadata_object_key}")
-                else:
-                    msg = f"publish(): metadata '{FILE_SET_METADATA_FILE}" + \
-                          f"' file for KGE File Set version '{file_set.fileset_version}" + \
-                          f"' of knowledge graph '{file_set.kg_id}" + \
-                          "' not successfully posted to the Archive?"
-                    file_set.report_error(msg)
-                    raise RuntimeError(msg)
+    @staticmethod
+    async def publish_fileset_metadata(file_set: KgeFileSet):
+        """
+        Publishes a 'file_set.yaml' metadata file to the
+        versioned archive subdirectory containing the KGE File Set.
 
-            except Exception as exc:
-                msg = f"publish(): {file_set.kg_id} {file_set.fileset_version} {str(exc)}"
-                file_set.report_error(msg)
-                print_error_trace(msg)
+        :param file_set: KGE File Set being archived
+        """
+        logger.debug("Create and add the fileset.yaml to the KGE S3 repository")
+        try:
+            fileset_metadata_file = file_set.generate_fileset_metadata_file()
+            fileset_metadata_object_key = await get_running_loop().run_in_executor(
+                None,
+                add_to_s3_repository,
+                file_set.kg_id,
+                fileset_metadata_file,
+                FILE_SET_METADATA_FILE,
+                file_set.fileset_version
+            )
+            if fileset_metadata_object_key:
+                logger.info(f"KgeFileSet.publish(): successfully created object key {fileset_metadata_object_key}")
+            else:
+                msg = f"publish(): metadata '{FILE_SET_METADATA_FILE}" + \
+                      f"' file for KGE File Set version '{file_set.fileset_version}" + \
+                      f"' of knowledge graph '{file_set.kg_id}" + \
+                      "' not successfully posted to the Archive?"
                 raise RuntimeError(msg)
 
-            logger.debug("Aggregating nodes")
-            
-            # take a quick rest, to give other co-routines a chance?
-            await sleep(0.001)
-            
-            # 2. Aggregate each of all nodes and edges each
-            #    into their respective files in the archive folder
-            self.aggregate_to_archive(
-                file_set=file_set,
-                kgx_file_type="nodes",
-                file_object_keys=file_set.get_nodes()
-            )
-            self.aggregate_to_archive(
-                file_set=file_set,
-                kgx_file_type="edges",
-                file_object_keys=file_set.get_edges()
+        except Exception as exc:
+            msg = f"publish(): {file_set.kg_id} {file_set.fileset_version} {str(exc)}"
+            print_error_trace(msg)
+            raise RuntimeError(msg)
+
+    async def aggregate_nodes(self, file_set: KgeFileSet):
+        """
+        Aggregates all the node files into a single nodes file in the archive folder.
+
+        :param file_set: KGE File Set being archived
+        """
+        logger.debug("Aggregating nodes")
+        file_name, agg_path = await get_running_loop().run_in_executor(
+            None, self.aggregate_to_archive, file_set, "nodes", file_set.get_nodes()
+        )
+        # the file set is only updated from the event loop thread, not from concurrent executor threads
+        file_set.add_data_file(KgeFileType.KGX_DATA_FILE, file_name, 0, agg_path)
+
+    async def aggregate_edges(self, file_set: KgeFileSet):
+        """
+        Aggregates all the edge files into a single edges file in the archive folder.
+
+        :param file_set: KGE File Set being archived
+        """
+        logger.debug("Aggregating edges")
+        file_name, agg_path = await get_running_loop().run_in_executor(
+            None, self.aggregate_to_archive, file_set, "edges", file_set.get_edges()
+        )
+        file_set.add_data_file(KgeFileType.KGX_DATA_FILE, file_name, 0, agg_path)
+
+    async def copy_metadata(self, file_set: KgeFileSet):
+        """
+        Copies over the metadata files into the archive folder.
+
+        :param file_set: KGE File Set being archived
+        """
+        loop = get_running_loop()
+        await gather(*[
+            loop.run_in_executor(None, self.copy_to_kge_archive, file_set, file_name)
+            for file_name in [PROVIDER_METADATA_FILE, FILE_SET_METADATA_FILE, CONTENT_METADATA_FILE]
+        ])
+
+    @staticmethod
+    async def generate_content_metadata(file_set: KgeFileSet):
+        """
+        Computes the content metadata (meta knowledge graph) of the KGE File Set from its
+        aggregated nodes and edges files, replacing the (submitted) content metadata of the archive.
+        Discrepancies between the submitted and computed content metadata are reported as warnings.
+
+        :param file_set: KGE File Set being archived
+        """
+        # the data files of the archive are recorded by their 's3://' URLs, not by their S3 object keys
+        archive_file_names: List[str] = [
+            entry["file_name"] for object_key, entry in file_set.data_files.items() if "/archive/" in object_key
+        ]
+        node_keys, edge_keys = archive_data_keys(file_set.kg_id, file_set.fileset_version, archive_file_names)
+
+        logger.debug(f"Computing the content metadata of {file_set.id()} from {node_keys + edge_keys}")
+
+        loop = get_running_loop()
+        content_metadata: Dict[str, Any] = await loop.run_in_executor(
+            None, compute_content_metadata, node_keys, edge_keys
+        )
+
+        file_set_location, _ = with_version(func=get_object_location, version=file_set.fileset_version)(file_set.kg_id)
+        submitted: Optional[Dict] = await loop.run_in_executor(
+            None, get_content_metadata,
+            file_set.kg_id, file_set.fileset_version, file_set_location + CONTENT_METADATA_FILE
+        )
+        discrepancies = compare_content_metadata(content_metadata, submitted["metadata"] if submitted else None)
+        for discrepancy in discrepancies[:MAX_VALIDATION_ERROR_SAMPLE]:
+            logger.warning(f"KgeArchiver: content metadata of {file_set.id()}: {discrepancy}")
+        file_set.content_metadata["discrepancies"] = discrepancies[:MAX_VALIDATION_ERROR_SAMPLE]
+
+        object_key = await loop.run_in_executor(
+            None,
+            add_to_s3_repository,
+            file_set.kg_id,
+            json.dumps(content_metadata, indent=4),
+            f"archive/{CONTENT_METADATA_FILE}",
+            file_set.fileset_version
+        )
+        if not object_key:
+            raise RuntimeError(f"generate_content_metadata(): content metadata of {file_set.id()} not archived?")
+
+        # the computed content metadata is henceforth served in lieu of the submitted one
+        cache_content_metadata(file_set.kg_id, file_set.fileset_version, content_metadata)
+
+    @staticmethod
+    async def compress(file_set: KgeFileSet):
+        """
+        Tars and gzips a single <kg_id>_<fileset_version>.tar.gz archive file
+        containing the aggregated kgx nodes and edges files, plus metadata files.
+
+        :param file_set: KGE File Set being archived
+        """
+        logger.debug("Compressing total KGE file set...")
+        try:
+            await compress_fileset(
+                kg_id=file_set.kg_id,
+                version=file_set.fileset_version
             )
+        except Exception as e:
+            # Can't be more specific than this 'cuz not sure what errors may be thrown here...
+            print_error_trace("File set compression failure! "+str(e))
+            raise e
 
-            # 3. Copy over metadata files into the archive folder
-            self.copy_to_kge_archive(file_set, PROVIDER_METADATA_FILE)
-            self.copy_to_kge_archive(file_set, FILE_SET_METADATA_FILE)
-            self.copy_to_kge_archive(file_set, CONTENT_METADATA_FILE)
+        logger.debug("...File compression completed!")
 
-            # take a quick rest, to give other co-routines a chance?
-            await sleep(0.001)
-            
-            # 4. Tar and gzip a single <kg_id>.<fileset_version>.tar.gz archive file
-            #    containing the aggregated kgx nodes and edges files, Appending `file_set_root_key`
-            #    with 'aggregates/' and 'archive/'  to prevent multiple compress_fileset runs
-            #    from compressing the previous compression (so the source of files is distinct
-            #    from the target to which it is written)
-            logger.debug("Compressing total KGE file set...")
-            try:
-                s3_archive_key: str = await compress_fileset(
-                    kg_id=file_set.kg_id,
-                    version=file_set.fileset_version
+    @staticmethod
+    async def verify_sha1(file_set: KgeFileSet):
+        """
+        Checks that the tar.gz archive and its SHA1 hash sum 'manifest' are available
+        (the SHA1 hash sum is normally computed while the archive is compressed).
+
+        :param file_set: KGE File Set being archived
+        """
+        sha1_hash: str = await get_running_loop().run_in_executor(
+            None, verify_archive_manifest, file_set.kg_id, file_set.fileset_version
+        )
+        logger.debug(f"SHA1 hash sum of the {file_set.id()} archive: {sha1_hash}")
+
+    async def _run_step(self, file_set: KgeFileSet, step: str):
+        start_time = time.perf_counter()
+        await self._steps[step](file_set)
+        self.job_queue.checkpoint(file_set.id(), step, file_set.get_state(), time.perf_counter() - start_time)
+
+    async def archive(self, file_set: KgeFileSet, task_id=None):
+        """
+        Runs the archiving pipeline of a KGE File Set, stage by stage, the independent steps
+        of a stage (i.e. node aggregation, edge aggregation and metadata copies) running
+        concurrently. Each completed step is checkpointed, with its duration, in the job queue.
+        Steps already completed (i.e. before an interruption of the service) are skipped.
+
+        :param file_set: KGE File Set being archived
+        :param task_id: identifier of the worker task
+        """
+        job_id = file_set.id()
+        completed_steps: Dict[str, Optional[float]] = self.job_queue.get_completed_steps(job_id)
+
+        self.job_queue.start(job_id, f"{gethostname()}:{getpid()}:{task_id}")
+
+        start_time = time.perf_counter()
+        for stage in ARCHIVER_STAGES:
+            pending_steps = [step for step in stage if step not in completed_steps]
+            for step in stage:
+                if step in completed_steps:
+                    logger.info(f"KgeArchiver worker {task_id} skipping completed step '{step}' of {job_id}")
+            # all the steps of a stage are completed (and checkpointed) before any failure is raised
+            outcomes = await gather(
+                *[self._run_step(file_set, step) for step in pending_steps],
+                return_exceptions=True
+            )
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    raise outcome
+
+        self.report_timings(job_id, time.perf_counter() - start_time)
+
+    def report_timings(self, job_id: str, elapsed: float):
+        """
+        Logs the duration of each step of the archiving of a KGE File Set, and of the stages
+        of its critical path (the slowest step of each stage), against the total elapsed time.
+
+        :param job_id: job identifier, i.e. the KGE File Set identifier
+        :param elapsed: wall-clock duration (in seconds) of the archiving
+        """
+        timings: Dict[str, Optional[float]] = self.job_queue.get_completed_steps(job_id)
+        report: List[str] = list()
+        critical_path: float = 0.0
+        for stage in ARCHIVER_STAGES:
+            stage_timings = {step: timings.get(step) or 0.0 for step in stage}
+            slowest = max(stage_timings, key=stage_timings.get)
+            critical_path += stage_timings[slowest]
+            report.append(
+                " | ".join(
+                    f"{step}: {seconds:.1f}s" + (" *" if step == slowest and len(stage) > 1 else "")
+                    for step, seconds in stage_timings.items()
                 )
-            except Exception as e:
-                # Can't be more specific than this 'cuz not sure what errors may be thrown here...
-                print_error_trace("File set compression failure! "+str(e))
-                raise e
+            )
+        logger.info(
+            f"KgeArchiver: {job_id} archived in {elapsed:.1f} seconds " +
+            f"(critical path: {critical_path:.1f} seconds), step timings:\n\t" + "\n\t".join(report)
+        )
 
-            logger.debug("...File compression completed!")
+    async def _heartbeat(self, job_id: str):
+        while True:
+            await sleep(ARCHIVER_JOB_LEASE / 5)
+            self.job_queue.heartbeat(job_id)
+
+    async def archive_job(self, file_set: KgeFileSet, task_id=None):
+        """
+        Archives a KGE File Set, recording the outcome of its job in the job queue.
+
+        :param file_set: KGE File Set being archived
+        :param task_id: identifier of the worker task
+        """
+        logger.info(f"KgeArchiver worker {task_id} starting archive of {file_set.id()}")
+
+        # renew the lease of the job, while it is running
+        heartbeat: Task = create_task(self._heartbeat(file_set.id()))
+
+        # All the blocking (S3 and subprocess) operations of the pipeline steps are either
+        # run asynchronously or in a thread executor, to not block the event loop
+        try:
+            await self.archive(file_set, task_id)
 
-            # take a quick rest, to give other co-routines a chance?
-            await sleep(0.001)
-            
-            # 5. Compute the SHA1 hash sum for the resulting archive file.
-
-            # DEPRECATED LOCAL CODE: SHA1 hash creation now run in the bash CLI of the compress_fileset() method above.
-
-            # #  Hmm... since we are adding the file_set.yaml file to the archive, it would not
-            # #  really help to embed the hash sum into the fileset yaml itself, but we can store
-            # #  it in an extra small text file (e.g. sha1.txt?) and read it in during the catalog
-            # #  loading, for communication back to the user as part of the catalog metadata
-            # #  (once the archiving and hash generation is completed...)
-            # logger.debug("Computing SHA1 hash sum...")
-            # try:
-            #     # NOTE: We have to "disable" compression as smart_open auto-decompresses based off of the format
-            #     # of whatever is being opened. If we let this happen, then the hash function would run over
-            #     # a decompressed buffer; not the compressed file/buffer that we expect our users to use when
-            #     # they download and validate the archive.
-            #     with smart_open.open(s3_archive_key, 'rb', compression='disable') as archive_file_key:
-            #         sha1sum = sha1_manifest(archive_file_key)
-            #         sha1sum_value = sha1sum[archive_file_key.name]
-            #         sha1file = f"{file_set.kg_id}_{file_set.fileset_version}.sha1.txt"
-            #         manifest_object_location = f"kge-data/{file_set.kg_id}/{file_set.fileset_version}/manifest/"
-            #         sha1_s3_path = f"s3://{default_s3_bucket}/{manifest_object_location}{sha1file}"
-            #         with smart_open.open(sha1_s3_path, 'w') as sha1file:
-            #             sha1file.write(sha1sum_value)
-            #
-            # except Exception as e:
-            #     # Can't be more specific than this 'cuz not sure what errors may be thrown here...
-            #     print_error_trace("SHA1 hash sum computation failure! "+str(e))
-            #     raise e
-            #
-            # # take a quick rest, to give other co-routines a chance?
-            # await sleep(0.001)
-            
-            # 6. KGX validation of KGE compliant archive.
-            
             # TODO: Debug and/or redesign KGX validation of data files - doesn't yet work properly
             # TODO: need to managed multiple Biolink Model specific KGX validators
             logger.debug(
@@ -2203,15 +2712,123 @@ class KgeArchiver:
             )
             # validator: KgxValidator = KnowledgeGraphCatalog.catalog().get_validator()
             # KgxValidator.validate(self)
-            
+
             # Assume that the TAR.GZ archive of the
             # KGE File Set is validated by this point
             file_set.status = KgeFileSetStatusCode.VALIDATED
-            
+            self.job_queue.complete(file_set.id())
+
             logger.debug(f"KgeArchiver worker {task_id} finished archiving of {file_set.id()}")
 
+        except Exception as exc:
+            msg = f"KgeArchiver worker {task_id} failed to archive {file_set.id()}: {str(exc)}"
+            file_set.report_error(msg)
+            self.job_queue.fail(file_set.id(), msg)
+
+        finally:
+            heartbeat.cancel()
+
+    async def worker(self, task_id=None):
+        """
+        Local archiver worker task, archiving the KGE File Sets posted to this archiver.
+
+        :param task_id:
+        """
+        if task_id is None:
+            task_id = len(self._archiver_worker)
+
+        while True:
+            file_set: KgeFileSet = await self._archiver_queue.get()
+            await self.archive_job(file_set, task_id)
             self._archiver_queue.task_done()
 
+    async def serve(self, task_id=None, poll_interval: float = ARCHIVER_POLL_INTERVAL):
+        """
+        Archiver worker service task, archiving the KGE File Sets of the jobs
+        it claims from the shared archiver job queue (see kgea.server.archiver).
+
+        :param task_id: identifier of the worker task, unique within the process
+        :param poll_interval: seconds to wait before looking again for a job, when none is available
+        """
+        worker = f"{gethostname()}:{getpid()}:{task_id}"
+        loop = get_running_loop()
+        while True:
+            job: Optional[Tuple[str, Dict]] = await loop.run_in_executor(None, self.job_queue.claim, worker)
+            if not job:
+                await sleep(poll_interval)
+                continue
+            _, state = job
+            await self.archive_job(KgeFileSet.from_state(state), task_id)
+
+    async def monitor(self, file_set: KgeFileSet, poll_interval: float = ARCHIVER_POLL_INTERVAL):
+        """
+        Tracks the job of a KGE File Set run by a (remote) archiver worker service,
+        updating the status and data files of the file set, once the job is finished.
+
+        :param file_set: KGE File Set being archived
+        :param poll_interval: seconds between checks of the job status
+        """
+        loop = get_running_loop()
+        while True:
+            await sleep(poll_interval)
+            job: Optional[Dict] = await loop.run_in_executor(None, self.job_queue.get_job, file_set.id())
+            if not job:
+                file_set.report_error(f"KgeArchiver.monitor(): archiver job of {file_set.id()} is missing?")
+                return
+            if job["status"] == JOB_COMPLETED:
+                # the data files of the archived file set now include the aggregated files
+                archived_file_set = KgeFileSet.from_state(job["file_set"])
+                file_set.data_files = archived_file_set.data_files
+                file_set.content_metadata = archived_file_set.content_metadata
+                # the archived content metadata was computed by the worker service
+                invalidate_content_metadata(file_set.kg_id, file_set.fileset_version)
+                file_set.status = KgeFileSetStatusCode.VALIDATED
+                logger.debug(f"KgeArchiver.monitor(): {file_set.id()} archived by worker {job['worker']}")
+                return
+            elif job["status"] == JOB_FAILED:
+                file_set.report_error(job["error"])
+                return
+
+    def resume(self) -> int:
+        """
+        Queues again the unfinished jobs of the durable job queue, i.e. publications
+        of KGE File Sets interrupted by a restart of the service, which are resumed
+        from their last completed step (in 'remote' mode, by an archiver worker service,
+        the status of the jobs then simply being tracked).
+
+        :return: number of resumed jobs
+        """
+        jobs = self.job_queue.get_unfinished_jobs()
+        for job_id, state in jobs:
+            file_set = KgeFileSet.from_state(state)
+            file_set.status = KgeFileSetStatusCode.PROCESSING
+
+            knowledge_graph = KnowledgeGraphCatalog.catalog().get_knowledge_graph(file_set.kg_id)
+            if knowledge_graph:
+                knowledge_graph.add_file_set(file_set.fileset_version, file_set)
+            else:
+                logger.warning(f"KgeArchiver.resume(): knowledge graph of {job_id} not found in the catalog?")
+
+            logger.info(f"KgeArchiver.resume(): resuming the archiving of {job_id}")
+            if self.mode == 'local':
+                self._archiver_queue.put_nowait(file_set)
+            else:
+                # the job is (eventually) resumed by an archiver worker service
+                create_task(self.monitor(file_set))
+
+        return len(jobs)
+
+    @classmethod
+    async def resume_jobs(cls, app=None):
+        """
+        Web application startup hook, resuming any unfinished KGE Archiver jobs.
+
+        :param app: (unused) web application
+        """
+        resumed = cls.get_archiver().resume()
+        if resumed:
+            logger.info(f"KgeArchiver.resume_jobs(): {resumed} unfinished archiver jobs resumed")
+
     #
     # DEPRECATED: "creative" management of KgeArchiver tasks. K.I.S.S.
     #
@@ -2268,7 +2885,15 @@ class KgeArchiver:
         
         :return: None
         """
-        # Post the file set to the KgeArchiver task Queue for processing
+        # Record the job in the durable job queue, then...
+        self.job_queue.enqueue(file_set.id(), file_set.get_state())
+
+        if self.mode != 'local':
+            # ...leave the job to the archiver worker services, just tracking its status
+            create_task(self.monitor(file_set))
+            return True
+
+        # ...post the file set to the KgeArchiver task Queue for processing
         try:
             logger.debug("KgeArchiver.process(): adding '"+file_set.id()+"' to archiver work queue")
             self._archiver_queue.put_nowait(
@@ -2294,13 +2919,176 @@ class KgeArchiver:
         return True
 
 
+def _initialize_kgx_validation_process(biolink_model_release: str):
+    """
+    Initializer of the worker processes of a Biolink Model release specific KgxValidator.
+
+    :param biolink_model_release:
+    """
+    Validator.set_biolink_model(biolink_model_release)
+
+
+def _run_kgx_validation(
+        file_set_id: str,
+        input_files: List[str],
+        input_format: str,
+        input_compression: Optional[str] = None,
+        progress: Optional[Dict[str, int]] = None
+) -> Dict[str, Any]:
+    """
+    Runs the KGX validation of a file set, inside a KgxValidator worker process.
+
+    :param file_set_id: name of the file set
+    :param input_files: list of file path strings (or resolvable URLs) pointing to files to be validated
+    :param input_format: KGX file format (file extension) ... needs to be be consistent for all input_files
+    :param input_compression: currently expected to be 'tar.gz' or 'gz' - should be consistent for all input_files
+    :param progress: (optional) multiprocessing proxy dictionary into which the progress counts are reported
+    :return: dictionary with a sample of the 'errors', the 'error_count', 'node_count' and 'edge_count'
+    """
+    progress_monitor = ProgressMonitor(progress)
+    kgx_data_validator = Validator(progress_monitor=progress_monitor)
+
+    transformer = Transformer(stream=True)
+    transformer.transform(
+        input_args={
+            'name': file_set_id,
+            'filename': input_files,
+            'format': input_format,
+            'compression': input_compression
+        },
+        output_args={
+            # we don't keep the graph in memory...
+            # too RAM costly and not needed later
+            'format': 'null'
+        },
+        inspector=kgx_data_validator
+    )
+
+    errors: List[str] = list(kgx_data_validator.get_error_messages())
+
+    results: Dict[str, Any] = progress_monitor.get_counts()
+    results['error_count'] = len(errors)
+    results['errors'] = errors[:MAX_VALIDATION_ERROR_SAMPLE]
+
+    return results
+
+
+def _stream_shard(
+        file_url: str,
+        start: int,
+        end: int,
+        header: bytes,
+        fifo_path: str,
+        opened: threading.Event,
+        failure: List[BaseException]
+):
+    """
+    Streams a byte range of a (S3 signed URL) file, prefixed with a header line, into a named pipe,
+    until the end of the range, or until the reader of the pipe goes away.
+
+    :param opened: event set once the pipe is opened (i.e. once it has a reader)
+    :param failure: list into which the exception of a failed download is recorded
+    """
+    try:
+        with open(fifo_path, 'wb') as shard_pipe:
+            opened.set()
+            shard_pipe.write(header)
+            with requests.get(file_url, headers={'Range': f"bytes={start}-{end - 1}"}, stream=True) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=_SHARD_DOWNLOAD_CHUNK_SIZE):
+                    shard_pipe.write(chunk)
+    except BrokenPipeError:
+        pass  # the reader stopped early, e.g. on a failed validation
+    except Exception as exc:
+        failure.append(exc)
+
+
+def _run_kgx_shard_validation(
+        file_set_id: str,
+        file_url: str,
+        file_name: str,
+        start: int,
+        end: int,
+        header: bytes,
+        input_format: str
+) -> Dict[str, Any]:
+    """
+    Runs the KGX validation of one line aligned shard of an (uncompressed)
+    KGX data file, inside a KgxValidator worker process.
+
+    The shard is streamed into the validation through a named pipe (KGX only reads files
+    by name), hence without being written to local disk.
+
+    :param file_set_id: name of the file set
+    :param file_url: (S3 signed) URL of the KGX data file
+    :param file_name: name of the KGX data file (KGX tells node from edge files by their name)
+    :param start: offset of the first byte of the shard
+    :param end: offset of the byte just past the end of the shard
+    :param header: header line prepended to the shard (i.e. of TSV shards other than the first one)
+    :param input_format: KGX file format (file extension)
+    :return: dictionary with a sample of the 'errors', the 'error_count', 'node_count' and 'edge_count'
+    """
+    with tempfile.TemporaryDirectory() as shard_directory:
+        shard_pipe_path = f"{shard_directory}/{file_name}"
+        mkfifo(shard_pipe_path)
+
+        opened = threading.Event()
+        failure: List[BaseException] = list()
+        writer = threading.Thread(
+            target=_stream_shard,
+            args=(file_url, start, end, header, shard_pipe_path, opened, failure),
+            daemon=True
+        )
+        writer.start()
+
+        progress_monitor = ProgressMonitor()
+        kgx_data_validator = Validator(progress_monitor=progress_monitor)
+        try:
+            transformer = Transformer(stream=True)
+            transformer.transform(
+                input_args={
+                    'name': file_set_id,
+                    'filename': [shard_pipe_path],
+                    'format': input_format
+                },
+                output_args={'format': 'null'},
+                inspector=kgx_data_validator
+            )
+        finally:
+            if not opened.is_set():
+                # release the writer waiting for a reader of the pipe (the validation failed before reading it)
+                release = os_open(shard_pipe_path, O_RDONLY | O_NONBLOCK)
+                opened.wait(_SHARD_WRITER_TIMEOUT)
+                os_close(release)
+            # (a writer is otherwise stopped by a broken pipe, once the validation closes it)
+            writer.join(timeout=_SHARD_WRITER_TIMEOUT)
+
+    if failure:
+        raise RuntimeError(f"Download of the shard [{start}, {end}) of '{file_name}' failed: {str(failure[0])}")
+
+    errors: List[str] = list(kgx_data_validator.get_error_messages())
+
+    results: Dict[str, Any] = progress_monitor.get_counts()
+    results['error_count'] = len(errors)
+    results['errors'] = errors[:MAX_VALIDATION_ERROR_SAMPLE]
+
+    return results
+
+
 class KgxValidator:
     """
     KGX Validation wrapper.
+
+    The KGX validation of each KGE File Set is run in a pool of worker
+    processes, dedicated to the Biolink Model release of this validator.
     """
-    def __init__(self, biolink_model_release: str):
-        Validator.set_biolink_model(biolink_model_release)
-        self.kgx_data_validator = Validator(progress_monitor=ProgressMonitor())
+    def __init__(self, biolink_model_release: str, max_processes: int = Number_of_Validator_Processes):
+        self.biolink_model_release = biolink_model_release
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_processes,
+            initializer=_initialize_kgx_validation_process,
+            initargs=(biolink_model_release,)
+        )
         self._validation_queue: Queue = Queue()
 
         # Do I still need a list of task objects here,
@@ -2310,6 +3098,18 @@ class KgxValidator:
 
     # Catalog of Biolink Model version specific validators
     _biolink_validator = dict()
+
+    # Multiprocessing manager of the validation progress dictionaries shared with the worker processes
+    _progress_manager = None
+
+    @classmethod
+    def get_progress_tracker(cls) -> Dict[str, int]:
+        """
+        :return: new (multiprocessing proxy) validation progress dictionary
+        """
+        if not cls._progress_manager:
+            cls._progress_manager = Manager()
+        return cls._progress_manager.dict()
     
     def get_validation_queue(self) -> Queue:
         """
@@ -2356,12 +3156,18 @@ class KgxValidator:
                     task.cancel()
 
                 # Wait until all worker tasks are cancelled.
-                await gather(*validator.get_validation_tasks().values(), return_exceptions=True)
+                await gather(*validator.get_validation_tasks(), return_exceptions=True)
 
             except Exception as exc:
                 msg = "KgxValidator() KGX worker task exception: " + str(exc)
                 logger.error(msg)
 
+            validator._executor.shutdown(wait=False)
+
+        if cls._progress_manager:
+            cls._progress_manager.shutdown()
+            cls._progress_manager = None
+
     @classmethod
     def validate(cls, file_set: KgeFileSet):
         """
@@ -2443,15 +3249,37 @@ class KgxValidator:
                 #
                 # Run validation of KGX knowledge graph data files here
                 #
-                validation_errors: List[str] = \
-                    await self.validate_file_set(
-                        file_set_id=file_set.id(),
-                        input_files=input_files,
-                        input_format=input_format,
-                        input_compression=input_compression
+                # the worker process reports its progress into a shared dictionary...
+                file_set.validation_progress = self.get_progress_tracker()
+                try:
+                    if self.is_shardable(file_set):
+                        # ...unless large, uncompressed files are validated in parallel shards
+                        validation = self.validate_file_set_sharded(file_set)
+                    else:
+                        validation = self.validate_file_set(
+                            file_set_id=file_set.id(),
+                            input_files=input_files,
+                            input_format=input_format,
+                            input_compression=input_compression,
+                            progress=file_set.validation_progress
+                        )
+                    # the node cross-references of the edges are checked alongside
+                    # the validation, in the same way whether it is sharded or not
+                    results, cross_reference_results = \
+                        await gather(validation, self.check_cross_references(file_set))
+                    results['error_count'] = results.get('error_count', 0) + cross_reference_results['error_count']
+                    results['errors'].extend(
+                        cross_reference_results['errors'][:MAX_VALIDATION_ERROR_SAMPLE - len(results['errors'])]
                     )
-                if validation_errors:
-                    file_set.report_error(validation_errors)
+                except Exception as exc:
+                    results = {'errors': [f"KGX validation of {file_set.id()} failed: {str(exc)}"]}
+
+                # ...replaced by the final counts, once the validation is completed
+                file_set.validation_progress = {
+                    key: value for key, value in results.items() if key.endswith('_count')
+                }
+                if results['errors']:
+                    file_set.report_error(results['errors'])
 
             elif file_type_opt == KgeFileType.KGE_ARCHIVE:
                 # TODO: perhaps need more work to properly dissect and
@@ -2475,16 +3303,18 @@ class KgxValidator:
             file_set_id: str,
             input_files: List[str],
             input_format: str,
-            input_compression: Optional[str] = None
-    ) -> List:
+            input_compression: Optional[str] = None,
+            progress: Optional[Dict[str, int]] = None
+    ) -> Dict[str, Any]:
         """
-        Validates KGX compliance of a specified data file.
+        Validates KGX compliance of a specified data file, in a worker process of the validator.
 
         :param file_set_id: name of the file set, generally a composite identifier of the kg_id plus fileset_version?
         :param input_files: list of file path strings pointing to files to be validated (could be a resolvable URL?)
         :param input_format: KGX file format (file extension) ... needs to be be consistent for all input_files
         :param input_compression: currently expected to be 'tar.gz' or 'gz' - should be consistent for all input_files
-        :return: (possibly empty) List of errors returned
+        :param progress: (optional) multiprocessing proxy dictionary into which the progress counts are reported
+        :return: dictionary with a sample of the 'errors', the 'error_count', 'node_count' and 'edge_count'
         """
         logger.setLevel(logging.DEBUG)
         logger.debug(
@@ -2499,42 +3329,144 @@ class KgxValidator:
             # The putative KGX 'source' input files are currently sitting
             # at the end of S3 signed URLs for streaming into the validation.
 
-            logger.debug("KgxValidator.validate_data_file(): creating the Transformer...")
-
-            transformer = Transformer(stream=True)
-
-            logger.debug("KgxValidator.validate_data_file(): running the Transformer.transform...")
+            logger.debug("KgxValidator.validate_data_file(): running the Transformer.transform in a worker process...")
 
-            transformer.transform(
-                input_args={
-                    'name': file_set_id,
-                    'filename': input_files,
-                    'format': input_format,
-                    'compression': input_compression
-                },
-                output_args={
-                    # we don't keep the graph in memory...
-                    # too RAM costly and not needed later
-                    'format': 'null'
-                },
-                inspector=self.kgx_data_validator
+            results: Dict[str, Any] = await get_running_loop().run_in_executor(
+                self._executor,
+                _run_kgx_validation,
+                file_set_id,
+                input_files,
+                input_format,
+                input_compression,
+                progress
             )
 
             logger.debug("KgxValidator.validate_data_file(): transform validation completed")
 
-            errors: List[str] = self.kgx_data_validator.get_error_messages()
-
+            errors: List[str] = results['errors']
             if errors:
                 n = len(errors)
                 n = 9 if n >= 10 else n
-                logger.error("Sample of errors seen:\n"+'\n'.join(errors[0:n]))
+                logger.error(
+                    f"{results['error_count']} errors seen, for example:\n" + '\n'.join(errors[0:n])
+                )
 
             logger.debug("KgxValidator.validate_data_file(): Exiting validate_file_set()")
 
-            return errors
+            return results
 
         else:
-            return ["Missing file name inputs for validation?"]
+            return {'errors': ["Missing file name inputs for validation?"]}
+
+    async def check_cross_references(self, file_set: KgeFileSet) -> Dict[str, Any]:
+        """
+        Checks, in a worker process of the validator, that the subject and object nodes of the
+        edges of the (uncompressed, or gzip compressed, TSV or JSON lines) KGX data files of
+        a file set are found in its node files (other data files are not checked).
+
+        :param file_set: KgeFileSet to be validated
+        :return: dictionary with a sample of the 'errors' and the 'error_count'
+        """
+        entries = file_set.data_files.values()
+        if not entries or not all(
+            entry["input_format"] in ['tsv', 'jsonl'] and entry["input_compression"] in [None, 'gz']
+            for entry in entries
+        ):
+            return {'error_count': 0, 'errors': []}
+
+        # KGX tells node from edge files by their name
+        node_keys: List[str] = [entry["object_key"] for entry in entries if 'nodes' in entry["file_name"]]
+        edge_keys: List[str] = [entry["object_key"] for entry in entries if 'edges' in entry["file_name"]]
+
+        results: Dict[str, Any] = await get_running_loop().run_in_executor(
+            self._executor, check_cross_references, node_keys, edge_keys, default_s3_bucket
+        )
+        if results['error_count']:
+            logger.warning(
+                f"KgxValidator.check_cross_references(): {results['error_count']} edge references " +
+                f"to missing nodes in {str(file_set)}"
+            )
+        return results
+
+    @staticmethod
+    def is_shardable(file_set: KgeFileSet, shard_size: int = Validation_Shard_Size) -> bool:
+        """
+        :param file_set: KgeFileSet to be validated
+        :param shard_size: nominal size (in bytes) of the validation shards
+        :return: True if all the data files of the file set are uncompressed (TSV or JSON Lines)
+                 KGX files, and at least one of them is larger than the validation shard size
+        """
+        if not shard_size or not file_set.data_files:
+            return False
+        entries = file_set.data_files.values()
+        return all(
+            entry["input_format"] in ['tsv', 'jsonl'] and not entry["input_compression"] for entry in entries
+        ) and any(
+            (entry["file_size"] or 0) > shard_size for entry in entries
+        )
+
+    async def validate_file_set_sharded(
+            self,
+            file_set: KgeFileSet,
+            shard_size: int = Validation_Shard_Size
+    ) -> Dict[str, Any]:
+        """
+        Validates KGX compliance of the data files of a file set, split into line aligned byte range
+        shards (found by S3 ranged GETs), each validated in a worker process of the validator.
+        The per-shard errors and counts are merged (the node cross-references of the edges
+        are checked separately, see check_cross_references()).
+
+        :param file_set: KgeFileSet with uncompressed KGX data files
+        :param shard_size: nominal size (in bytes) of the validation shards
+        :return: dictionary with a sample of the 'errors', the 'error_count', 'node_count' and 'edge_count'
+        """
+        loop = get_running_loop()
+
+        shards: List[Tuple[str, str, int, int, bytes, str]] = list()
+        for entry in file_set.data_files.values():
+            object_key = entry["object_key"]
+            ranges: List[Tuple[int, int]] = await loop.run_in_executor(
+                None, get_line_aligned_ranges, default_s3_bucket, object_key, shard_size
+            )
+            header: bytes = b''
+            if entry["input_format"] == 'tsv' and len(ranges) > 1:
+                header = await loop.run_in_executor(None, get_first_line, default_s3_bucket, object_key)
+            file_url = create_presigned_url(object_key=object_key)
+            for start, end in ranges:
+                shards.append(
+                    (file_url, entry["file_name"], start, end, header if start else b'', entry["input_format"])
+                )
+
+        logger.debug(
+            f"KgxValidator.validate_file_set_sharded(): validating {str(file_set)} " +
+            f"as {len(shards)} shards of {len(file_set.data_files)} data files"
+        )
+
+        results: Dict[str, Any] = {'node_count': 0, 'edge_count': 0, 'error_count': 0, 'errors': []}
+
+        # the shard counts are merged into the (plain dictionary) validation progress, as they complete
+        file_set.validation_progress = {'node_count': 0, 'edge_count': 0}
+
+        for shard_validation in as_completed([
+            loop.run_in_executor(self._executor, _run_kgx_shard_validation, file_set.id(), *shard)
+            for shard in shards
+        ]):
+            shard_results: Dict[str, Any] = await shard_validation
+            for count in ['node_count', 'edge_count', 'error_count']:
+                results[count] += shard_results[count]
+            results['errors'].extend(
+                shard_results['errors'][:MAX_VALIDATION_ERROR_SAMPLE - len(results['errors'])]
+            )
+            file_set.validation_progress.update(
+                {'node_count': results['node_count'], 'edge_count': results['edge_count']}
+            )
+
+        if results['errors']:
+            logger.error(
+                f"{results['error_count']} errors seen, for example:\n" + '\n'.join(results['errors'][0:9])
+            )
+
+        return results
 
 
 # This is a simple test of the KgxArchive queue/task.
@@ -0,0 +1,522 @@
+"""
+Computation of the KGX content metadata (meta knowledge graph) of a KGE File Set,
+by a streaming pass over its (aggregated) KGX nodes and edges files.
+
+The files are split into line aligned shards, summarized in parallel by worker processes:
+first the node shards - yielding the node categories, identifier prefixes and provenance counts,
+and the categories of each node - then the edge shards, whose (subject category, predicate,
+object category) triples are resolved against the node categories.
+
+The categories of the nodes are not kept as a dictionary, but as a node index: the (sorted) 64-bit
+hashes of the node identifiers, with the codes of their (distinct combinations of) categories,
+i.e. 12 bytes per node. The index is merged in the parent process (peak memory use of about
+32 bytes per node, while sorting) then saved in the (configured) Content_Metadata_Index_Directory,
+from which it is memory mapped - hence shared through the page cache - by the edge worker processes.
+A (very unlikely) hash collision between two node identifiers may mix up their categories.
+"""
+from typing import Dict, List, Optional, Tuple, Any, Iterator, Set, Callable
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter
+from itertools import repeat, islice
+from tempfile import TemporaryDirectory
+from hashlib import blake2b
+from array import array
+from os import path
+from sys import intern
+import json
+
+import numpy as np
+
+from kgea.config import get_app_config
+
+from kgea.server.web_services.kgea_file_ops import (
+    default_s3_bucket,
+    s3_client,
+    get_object_location,
+    with_version,
+    get_line_aligned_ranges,
+    get_first_line
+)
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Opaquely access the configuration dictionary
+_KGEA_APP_CONFIG = get_app_config()
+
+# Number of worker processes computing the content metadata of a KGE File Set
+Number_of_Content_Metadata_Processes = \
+    _KGEA_APP_CONFIG['Number_of_Content_Metadata_Processes'] \
+    if 'Number_of_Content_Metadata_Processes' in _KGEA_APP_CONFIG else 2
+
+# Directory of the (temporary) node index files of the KGE File Sets, about 12 bytes
+# per node (default: None, i.e. the system temporary directory)
+Content_Metadata_Index_Directory = \
+    _KGEA_APP_CONFIG['Content_Metadata_Index_Directory'] \
+    if 'Content_Metadata_Index_Directory' in _KGEA_APP_CONFIG else None
+
+# Nominal size (in bytes) of the line aligned shards of the KGX files summarized in parallel
+CONTENT_METADATA_SHARD_SIZE = 2**28
+
+# Number of edge records whose subject and object nodes are looked up together in the node index
+EDGE_LOOKUP_BATCH_SIZE = 2**16
+
+# Category of nodes without any (or unknown) category
+DEFAULT_CATEGORY = "biolink:NamedThing"
+
+# Node category sets are coded by their index in a list of which the default categories are the first
+_DEFAULT_CATEGORY_CODE = 0
+
+# Provenance columns of KGX edges, mapped onto their 'count_by_source' content metadata tag
+_EDGE_SOURCE_TAGS = {
+    "provided_by": "provided_by",
+    "knowledge_source": "knowledge_source",
+    "aggregator_knowledge_source": "aggregating_knowledge_source",
+    "aggregating_knowledge_source": "aggregating_knowledge_source",
+    "original_knowledge_source": "original_knowledge_source"
+}
+
+# Node index (sorted node identifier hashes and their category set codes) and
+# the category sets (by code), set in each edge summarizing worker process
+_node_hashes: np.ndarray = np.zeros(0, dtype='<u8')
+_node_codes: np.ndarray = np.zeros(0, dtype='<u4')
+_category_sets: List[Tuple[str, ...]] = [(DEFAULT_CATEGORY,)]
+
+# Node index of a shard: identifier hashes, category set codes (local to the shard) and the category sets
+NodeIndex = Tuple[np.ndarray, np.ndarray, List[Tuple[str, ...]]]
+
+# Node summary: category => [count, set of identifier prefixes, Counter of the 'provided_by' sources]
+NodeSummary = Dict[str, List[Any]]
+
+# Edge summary: (subject category, predicate, object category) =>
+#               [count, set of relations, dictionary of Counters of sources, by 'count_by_source' tag]
+EdgeSummary = Dict[Tuple[str, str, str], List[Any]]
+
+
+def _values(value) -> List[str]:
+    """
+    :return: list of the (non-empty) values of a KGX field: a JSON list, or a '|' delimited TSV string
+    """
+    if not value:
+        return []
+    if isinstance(value, list):
+        return [str(v) for v in value if v]
+    return [v for v in str(value).split('|') if v]
+
+
+def _id_hash(node_id: str) -> bytes:
+    """
+    :return: (process independent) 64-bit hash of a node identifier, as 8 little-endian bytes
+    """
+    return blake2b(node_id.encode('utf-8'), digest_size=8).digest()
+
+
+def archive_data_keys(kg_id: str, fileset_version: str, file_names: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    :param kg_id:
+    :param fileset_version:
+    :param file_names: names of the aggregated KGX files of the KGE File Set archive
+    :return: 2-tuple of the S3 object keys of the KGX nodes and of the KGX edges files of the archive
+    """
+    file_set_location, _ = with_version(func=get_object_location, version=fileset_version)(kg_id)
+    node_keys = [f"{file_set_location}archive/{name}" for name in ("nodes.tsv", "nodes.jsonl") if name in file_names]
+    edge_keys = [f"{file_set_location}archive/{name}" for name in ("edges.tsv", "edges.jsonl") if name in file_names]
+    return node_keys, edge_keys
+
+
+def _read_records(bucket: str, object_key: str, start: int, end: int, header: List[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Streams the records of a line aligned shard of a KGX (TSV or JSON lines) file.
+
+    :param header: TSV column names (empty for JSON lines files)
+    :return: iterator of the records, as dictionaries
+    """
+    response = s3_client().get_object(Bucket=bucket, Key=object_key, Range=f"bytes={start}-{end - 1}")
+    lines = response['Body'].iter_lines()
+    if header and start == 0:
+        # skip the header line itself
+        next(lines, None)
+    for line in lines:
+        line = line.decode('utf-8').rstrip('\r')
+        if not line.strip():
+            continue
+        if header:
+            yield dict(zip(header, line.split('\t')))
+        else:
+            yield json.loads(line)
+
+
+def summarize_nodes(
+        object_key: str,
+        start: int,
+        end: int,
+        header: List[str],
+        bucket: str = default_s3_bucket
+) -> Tuple[NodeSummary, NodeIndex]:
+    """
+    Summarizes one shard of a KGX nodes file, inside a worker process.
+
+    :param object_key: S3 object key of the KGX nodes file
+    :param start: offset of the first byte of the shard
+    :param end: offset of the byte just past the end of the shard
+    :param header: TSV column names (empty for JSON lines files)
+    :param bucket:
+    :return: 2-tuple of the node summary, by category, and of the (unsorted) node index of the shard
+    """
+    summary: NodeSummary = dict()
+
+    node_hashes = bytearray()
+    node_codes = array('I')
+
+    # codes (local to the shard) of the distinct combinations of categories
+    category_codes: Dict[Tuple[str, ...], int] = dict()
+
+    for record in _read_records(bucket, object_key, start, end, header):
+        node_id: str = str(record.get('id', ''))
+        categories = tuple(intern(c) for c in _values(record.get('category'))) or (DEFAULT_CATEGORY,)
+        node_hashes.extend(_id_hash(node_id))
+        node_codes.append(category_codes.setdefault(categories, len(category_codes)))
+
+        prefix = intern(node_id.split(':', 1)[0]) if ':' in node_id else ''
+        sources = [intern(s) for s in _values(record.get('provided_by'))]
+        for category in categories:
+            entry = summary.get(category)
+            if not entry:
+                entry = summary[category] = [0, set(), Counter()]
+            entry[0] += 1
+            if prefix:
+                entry[1].add(prefix)
+            entry[2].update(sources)
+
+    node_index: NodeIndex = (
+        np.frombuffer(node_hashes, dtype='<u8'),
+        np.array(node_codes, dtype='<u4'),
+        list(category_codes)
+    )
+    return summary, node_index
+
+
+def _load_node_index(hashes_file: str, codes_file: str, category_sets: List[Tuple[str, ...]]):
+    """
+    Edge summarizing worker process initializer: memory maps the node index files.
+
+    :param hashes_file: path of the (sorted) node identifier hashes file
+    :param codes_file: path of the (matching) node category set codes file
+    :param category_sets: category sets, by code
+    """
+    global _node_hashes, _node_codes, _category_sets
+    _node_hashes = np.load(hashes_file, mmap_mode='r')
+    _node_codes = np.load(codes_file, mmap_mode='r')
+    _category_sets = [tuple(intern(c) for c in categories) for categories in category_sets]
+
+
+def _unload_node_index():
+    """
+    Releases the node index loaded (in this process) by _load_node_index().
+    """
+    global _node_hashes, _node_codes, _category_sets
+    _node_hashes = np.zeros(0, dtype='<u8')
+    _node_codes = np.zeros(0, dtype='<u4')
+    _category_sets = [(DEFAULT_CATEGORY,)]
+
+
+def _node_categories(node_ids: List[str]) -> List[Tuple[str, ...]]:
+    """
+    :return: categories of the nodes (default categories, for nodes not found) looked up in the node index
+    """
+    hashes = np.frombuffer(b''.join(_id_hash(node_id) for node_id in node_ids), dtype='<u8')
+    codes = np.full(len(hashes), _DEFAULT_CATEGORY_CODE, dtype='<u4')
+    if len(_node_hashes) and len(hashes):
+        positions = np.minimum(np.searchsorted(_node_hashes, hashes), len(_node_hashes) - 1)
+        found = _node_hashes[positions] == hashes
+        codes[found] = _node_codes[positions[found]]
+    return [_category_sets[code] for code in codes.tolist()]
+
+
+def summarize_edges(
+        object_key: str,
+        start: int,
+        end: int,
+        header: List[str],
+        bucket: str = default_s3_bucket
+) -> EdgeSummary:
+    """
+    Summarizes one shard of a KGX edges file, inside a worker process
+    (whose node index was loaded by the _load_node_index() initializer).
+
+    :param object_key: S3 object key of the KGX edges file
+    :param start: offset of the first byte of the shard
+    :param end: offset of the byte just past the end of the shard
+    :param header: TSV column names (empty for JSON lines files)
+    :param bucket:
+    :return: edge summary, by (subject category, predicate, object category)
+    """
+    summary: EdgeSummary = dict()
+
+    records = _read_records(bucket, object_key, start, end, header)
+    while True:
+        batch = list(islice(records, EDGE_LOOKUP_BATCH_SIZE))
+        if not batch:
+            break
+        _summarize_edge_batch(summary, batch)
+
+    return summary
+
+
+def _summarize_edge_batch(summary: EdgeSummary, records: List[Dict[str, Any]]):
+    """
+    Adds a batch of KGX edge records to an edge summary.
+    """
+    node_categories = _node_categories(
+        [str(record.get(node, '')) for record in records for node in ('subject', 'object')]
+    )
+    for i, record in enumerate(records):
+        subject_categories = node_categories[2 * i]
+        object_categories = node_categories[2 * i + 1]
+        predicate = intern(str(record.get('predicate', '')) or "biolink:related_to")
+        relations = _values(record.get('relation'))
+        sources: Dict[str, List[str]] = {
+            tag: [intern(s) for s in _values(record.get(column))]
+            for column, tag in _EDGE_SOURCE_TAGS.items() if record.get(column)
+        }
+        for subject_category in subject_categories:
+            for object_category in object_categories:
+                key = (subject_category, predicate, object_category)
+                entry = summary.get(key)
+                if not entry:
+                    entry = summary[key] = [0, set(), dict()]
+                entry[0] += 1
+                entry[1].update(relations)
+                for tag, tag_sources in sources.items():
+                    entry[2].setdefault(tag, Counter()).update(tag_sources)
+
+
+def _merge_node_summaries(summaries: List[NodeSummary]) -> NodeSummary:
+    merged: NodeSummary = dict()
+    for summary in summaries:
+        for category, (count, prefixes, sources) in summary.items():
+            entry = merged.get(category)
+            if not entry:
+                merged[category] = [count, prefixes, sources]
+            else:
+                entry[0] += count
+                entry[1].update(prefixes)
+                entry[2].update(sources)
+    return merged
+
+
+def _merge_edge_summaries(summaries: List[EdgeSummary]) -> EdgeSummary:
+    merged: EdgeSummary = dict()
+    for summary in summaries:
+        for key, (count, relations, sources) in summary.items():
+            entry = merged.get(key)
+            if not entry:
+                merged[key] = [count, relations, sources]
+            else:
+                entry[0] += count
+                entry[1].update(relations)
+                for tag, tag_sources in sources.items():
+                    entry[2].setdefault(tag, Counter()).update(tag_sources)
+    return merged
+
+
+def _shards(bucket: str, object_key: str) -> Tuple[List[Tuple[int, int]], List[str]]:
+    """
+    :return: 2-tuple of the line aligned [start, end) byte ranges of a KGX file,
+             and of its TSV column names (empty for JSON lines files)
+    """
+    client = s3_client()
+    ranges = get_line_aligned_ranges(bucket, object_key, CONTENT_METADATA_SHARD_SIZE, client=client)
+    header: List[str] = list()
+    if ranges and not object_key.endswith('.jsonl'):
+        header = get_first_line(bucket, object_key, client=client).decode('utf-8').rstrip('\r\n').split('\t')
+    return ranges, header
+
+
+def _summarize_shards(
+        summarize: Callable,
+        shards: List[Tuple[str, int, int, List[str]]],
+        bucket: str,
+        processes: int,
+        initializer: Optional[Callable] = None,
+        initargs: Tuple = ()
+) -> List[Any]:
+    """
+    :return: list of the summaries of the shards, by worker processes (or in this process, if processes is 0)
+    """
+    if not shards:
+        return list()
+    if processes < 1:
+        if initializer:
+            initializer(*initargs)
+        return [summarize(*shard, bucket) for shard in shards]
+    with ProcessPoolExecutor(
+            max_workers=min(processes, len(shards)), initializer=initializer, initargs=initargs
+    ) as executor:
+        return list(executor.map(summarize, *zip(*shards), repeat(bucket)))
+
+
+def _save_node_index(
+        shard_indices: List[NodeIndex],
+        hashes_file: str,
+        codes_file: str
+) -> List[Tuple[str, ...]]:
+    """
+    Merges the node indices of the node shards, then saves the node index, sorted by node identifier hash.
+
+    :param shard_indices: node indices of the node shards (released as they are merged)
+    :param hashes_file: path of the node identifier hashes file
+    :param codes_file: path of the node category set codes file
+    :return: category sets of the node index, by code
+    """
+    category_sets: List[Tuple[str, ...]] = [(DEFAULT_CATEGORY,)]
+    category_codes: Dict[Tuple[str, ...], int] = {(DEFAULT_CATEGORY,): _DEFAULT_CATEGORY_CODE}
+
+    hashes: List[np.ndarray] = list()
+    codes: List[np.ndarray] = list()
+    while shard_indices:
+        shard_hashes, shard_codes, shard_category_sets = shard_indices.pop(0)
+        global_codes = np.zeros(len(shard_category_sets), dtype='<u4')
+        for code, categories in enumerate(shard_category_sets):
+            if categories not in category_codes:
+                category_codes[categories] = len(category_sets)
+                category_sets.append(categories)
+            global_codes[code] = category_codes[categories]
+        hashes.append(shard_hashes)
+        codes.append(global_codes[shard_codes] if len(shard_codes) else shard_codes)
+
+    node_hashes = np.concatenate(hashes) if hashes else np.zeros(0, dtype='<u8')
+    node_codes = np.concatenate(codes) if codes else np.zeros(0, dtype='<u4')
+    del hashes, codes
+
+    order = np.argsort(node_hashes, kind='stable')
+    np.save(hashes_file, node_hashes[order])
+    np.save(codes_file, node_codes[order])
+
+    return category_sets
+
+
+def compute_content_metadata(
+        node_keys: List[str],
+        edge_keys: List[str],
+        bucket: str = default_s3_bucket,
+        processes: int = Number_of_Content_Metadata_Processes,
+        index_directory: Optional[str] = Content_Metadata_Index_Directory
+) -> Dict[str, Any]:
+    """
+    Computes the KGX content metadata (meta knowledge graph) of KGX nodes and edges files.
+
+    :param node_keys: S3 object keys of the (uncompressed) KGX nodes files
+    :param edge_keys: S3 object keys of the (uncompressed) KGX edges files
+    :param bucket:
+    :param processes: maximum number of worker processes summarizing the file shards in parallel
+                      (if 0, the shards are summarized in this process)
+    :param index_directory: directory of the (temporary) node index files (None: system temporary directory)
+    :return: content metadata JSON, as a Python dictionary
+    """
+    node_shards: List[Tuple[str, int, int, List[str]]] = list()
+    for object_key in node_keys:
+        ranges, header = _shards(bucket, object_key)
+        node_shards.extend((object_key, start, end, header) for start, end in ranges)
+
+    node_summaries: List[NodeSummary] = list()
+    shard_indices: List[NodeIndex] = list()
+    for summary, shard_index in _summarize_shards(summarize_nodes, node_shards, bucket, processes):
+        node_summaries.append(summary)
+        shard_indices.append(shard_index)
+
+    edge_shards: List[Tuple[str, int, int, List[str]]] = list()
+    for object_key in edge_keys:
+        ranges, header = _shards(bucket, object_key)
+        edge_shards.extend((object_key, start, end, header) for start, end in ranges)
+
+    with TemporaryDirectory(prefix="kgea-content-metadata-", dir=index_directory) as node_index_directory:
+        hashes_file = path.join(node_index_directory, "node_hashes.npy")
+        codes_file = path.join(node_index_directory, "node_codes.npy")
+        category_sets = _save_node_index(shard_indices, hashes_file, codes_file)
+
+        # each worker process memory maps the node index files
+        edge_summaries: List[EdgeSummary] = _summarize_shards(
+            summarize_edges, edge_shards, bucket, processes,
+            initializer=_load_node_index, initargs=(hashes_file, codes_file, category_sets)
+        )
+        if processes < 1:
+            _unload_node_index()
+
+    nodes = _merge_node_summaries(node_summaries)
+    edges = _merge_edge_summaries(edge_summaries)
+
+    content_metadata: Dict[str, Any] = {"nodes": dict(), "edges": list()}
+    for category in sorted(nodes):
+        count, prefixes, sources = nodes[category]
+        meta_node: Dict[str, Any] = {"id_prefixes": sorted(prefixes), "count": count}
+        if sources:
+            meta_node["count_by_source"] = {"provided_by": dict(sources)}
+        content_metadata["nodes"][category] = meta_node
+    for (subject_category, predicate, object_category) in sorted(edges):
+        count, relations, sources = edges[(subject_category, predicate, object_category)]
+        meta_edge: Dict[str, Any] = {
+            "subject": subject_category,
+            "predicate": predicate,
+            "object": object_category,
+            "relations": sorted(relations),
+            "count": count
+        }
+        if sources:
+            meta_edge["count_by_source"] = {tag: dict(tag_sources) for tag, tag_sources in sources.items()}
+        content_metadata["edges"].append(meta_edge)
+
+    return content_metadata
+
+
+def compare_content_metadata(computed: Dict[str, Any], submitted: Optional[Dict[str, Any]]) -> List[str]:
+    """
+    Compares the (submitted) content metadata of a KGE File Set against the content metadata computed from its data.
+
+    :param computed: content metadata computed from the KGX data files
+    :param submitted: content metadata submitted with the KGE File Set (if any)
+    :return: list of the discrepancies found (empty if none)
+    """
+    if not submitted:
+        return ["No content metadata submitted"]
+
+    discrepancies: List[str] = list()
+
+    computed_nodes: Dict[str, Dict] = computed.get("nodes", dict())
+    submitted_nodes: Dict[str, Dict] = submitted.get("nodes", dict())
+    for category in sorted(set(computed_nodes) | set(submitted_nodes)):
+        if category not in submitted_nodes:
+            discrepancies.append(f"Node category '{category}' is not reported")
+        elif category not in computed_nodes:
+            discrepancies.append(f"Node category '{category}' is not found in the data")
+        else:
+            count = submitted_nodes[category].get("count", -1)
+            if count not in (-1, computed_nodes[category]["count"]):
+                discrepancies.append(
+                    f"Node category '{category}' count is reported as {count}, " +
+                    f"but is {computed_nodes[category]['count']}"
+                )
+            missing: Set[str] = \
+                set(computed_nodes[category]["id_prefixes"]) - set(submitted_nodes[category].get("id_prefixes", []))
+            if missing:
+                discrepancies.append(f"Node category '{category}' id_prefixes {sorted(missing)} are not reported")
+
+    def _triples(content_metadata: Dict[str, Any]) -> Dict[Tuple[str, str, str], int]:
+        return {
+            (edge.get("subject"), edge.get("predicate"), edge.get("object")): edge.get("count", -1)
+            for edge in content_metadata.get("edges", list())
+        }
+
+    computed_edges = _triples(computed)
+    submitted_edges = _triples(submitted)
+    for triple in sorted(set(computed_edges) | set(submitted_edges)):
+        if triple not in submitted_edges:
+            discrepancies.append(f"Edge {triple} is not reported")
+        elif triple not in computed_edges:
+            discrepancies.append(f"Edge {triple} is not found in the data")
+        elif submitted_edges[triple] not in (-1, computed_edges[triple]):
+            discrepancies.append(
+                f"Edge {triple} count is reported as {submitted_edges[triple]}, but is {computed_edges[triple]}"
+            )
+
+    return discrepancies
@@ -1,10 +1,14 @@
+from typing import Optional
+
 from aiohttp import web
 
 from ..kgea_handlers import (
     get_kge_file_set_metadata,
     kge_meta_knowledge_graph,
     download_kge_file_set_archive,
-    download_kge_file_set_archive_sha1hash
+    download_kge_file_set_archive_sha1hash,
+    get_kge_file_set_files,
+    download_kge_file_set_file
 )
 
 
@@ -26,7 +30,10 @@ async def meta_knowledge_graph(
         request: web.Request,
         kg_id: str,
         fileset_version: str,
-        downloading: bool = True
+        downloading: bool = True,
+        inline: bool = False,
+        category: Optional[str] = None,
+        predicate: Optional[str] = None
 ) -> web.Response:
     """Meta knowledge graph representation of this KGX knowledge graph.
 
@@ -38,9 +45,17 @@ async def meta_knowledge_graph(
     :type fileset_version: str
     :param downloading: Boolean flag indicating whether data is to be downloaded as an attachment or rather if a signed URL (string) is to be returned to the caller, for direct access to the data file (default: true).
     :type downloading: bool
+    :param inline: Boolean flag indicating whether the (cached) content metadata JSON is to be returned directly in the response, rather than downloaded (default: false).
+    :type inline: bool
+    :param category: Comma separated list of the node categories (and their edges) to which the inline content metadata is restricted.
+    :type category: str
+    :param predicate: Comma separated list of the edge predicates to which the inline content metadata is restricted.
+    :type predicate: str
 
     """
-    return await kge_meta_knowledge_graph(request, kg_id, fileset_version, downloading)
+    return await kge_meta_knowledge_graph(
+        request, kg_id, fileset_version, downloading, inline, category, predicate
+    )
 
 
 async def download_file_set_archive(request: web.Request, kg_id: str, fileset_version: str):
@@ -71,3 +86,34 @@ async def download_file_set_archive_sha1hash(request: web.Request, kg_id, filese
     :return: None - redirection responses triggered
     """
     await download_kge_file_set_archive_sha1hash(request, kg_id, fileset_version)
+
+
+async def get_file_set_files(request: web.Request, kg_id: str, fileset_version: str) -> web.Response:
+    """Lists the individually downloadable files of the archive of a KGE File Set
+
+    :param request:
+    :type request: web.Request
+    :param kg_id: Identifier of the knowledge graph of the KGE File Set a file set version for which is being accessed.
+    :type kg_id: str
+    :param fileset_version: Version of file set of the knowledge graph being accessed.
+    :type fileset_version: str
+
+    """
+    return await get_kge_file_set_files(request, kg_id, fileset_version)
+
+
+async def download_file_set_file(request: web.Request, kg_id: str, fileset_version: str, file_name: str):
+    """Returns a single file of the archive of a KGE File Set
+
+    :param request:
+    :type request: web.Request
+    :param kg_id: Identifier of the knowledge graph of the KGE File Set a file set version for which is being accessed.
+    :type kg_id: str
+    :param fileset_version: Version of file set of the knowledge graph being accessed.
+    :type fileset_version: str
+    :param file_name: Name of a file of the KGE File Set archive (e.g. 'nodes.tsv')
+    :type file_name: str
+
+    :return: None - redirection responses triggered
+    """
+    await download_kge_file_set_file(request, kg_id, fileset_version, file_name)
@@ -0,0 +1,152 @@
+"""
+Node cross-reference check of the KGX data files of a KGE File Set: the subject and object
+node identifiers of the edges are checked against the identifiers of the nodes, by two
+streaming passes over the (uncompressed, or gzip compressed, TSV or JSON lines) files.
+
+The node identifiers are recorded in a Bloom filter of a configured, fixed size (rather than
+in a set), such that the memory used is bounded whatever the size of the knowledge graph.
+Edge references reported as missing are certainly missing; conversely, a missing node may
+be taken as present (and its references left unreported) with the false positive probability
+of the filter, which grows with the number of nodes (see NodeIdFilter.false_positive_rate()).
+"""
+from typing import Dict, List, Any, Iterator, Set
+from math import exp
+import json
+
+import smart_open
+
+from kgea.config import get_app_config
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Opaquely access the configuration dictionary
+_KGEA_APP_CONFIG = get_app_config()
+
+# Size (in bytes) of the Bloom filter of the node identifiers of a KGE File Set (default: 128 megabytes,
+# i.e. a false positive probability of about 1% with 100 million nodes)
+Cross_Reference_Filter_Size = \
+    _KGEA_APP_CONFIG['Cross_Reference_Filter_Size'] if 'Cross_Reference_Filter_Size' in _KGEA_APP_CONFIG \
+    else 2**27
+
+# Number of (derived) hash functions of the Bloom filter
+CROSS_REFERENCE_FILTER_HASHES = 4
+
+# Maximum number of missing node identifiers sampled in the reported errors
+MAX_MISSING_NODE_SAMPLE = 100
+
+
+class NodeIdFilter:
+    """
+    Bloom filter of node identifiers. The bit positions of an identifier are derived
+    (by double hashing) from its built-in (process specific) string hash, hence a filter
+    may only be queried within the process in which it was filled.
+    """
+    def __init__(self, size: int = Cross_Reference_Filter_Size, hashes: int = CROSS_REFERENCE_FILTER_HASHES):
+        """
+        :param size: size (in bytes) of the filter
+        :param hashes: number of bit positions set per identifier
+        """
+        self._bits = bytearray(max(size, 1))
+        self._m = len(self._bits) * 8
+        self._k = hashes
+        self.count = 0
+
+    def _positions(self, node_id: str) -> Iterator[int]:
+        h = hash(node_id) & 0xFFFFFFFFFFFFFFFF
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        for i in range(self._k):
+            yield (h1 + i * h2) % self._m
+
+    def add(self, node_id: str):
+        """
+        :param node_id: node identifier to be recorded
+        """
+        for position in self._positions(node_id):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, node_id: str) -> bool:
+        for position in self._positions(node_id):
+            if not self._bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def false_positive_rate(self) -> float:
+        """
+        :return: (estimated) probability of an unrecorded identifier being taken as recorded
+        """
+        return (1.0 - exp(-self._k * self.count / self._m)) ** self._k
+
+
+def _read_columns(bucket: str, object_key: str, columns: List[str]) -> Iterator[List[str]]:
+    """
+    Streams given columns of the records of a KGX (TSV or JSON lines, possibly gzip compressed) file.
+
+    :param bucket:
+    :param object_key:
+    :param columns: names of the columns (fields) to be read
+    :return: iterator of the values of the columns (empty strings if missing) of each record
+    """
+    jsonl: bool = '.jsonl' in object_key
+    with smart_open.open(f"s3://{bucket}/{object_key}", 'r', encoding="utf-8", newline="\n") as kgx_file:
+        indices: List[int] = list()
+        if not jsonl:
+            header = next(kgx_file, '').rstrip("\r\n").split("\t")
+            indices = [header.index(column) if column in header else -1 for column in columns]
+        for line in kgx_file:
+            line = line.rstrip("\r\n")
+            if not line.strip():
+                continue
+            if jsonl:
+                record: Dict[str, Any] = json.loads(line)
+                yield [str(record.get(column) or '') for column in columns]
+            else:
+                values = line.split("\t")
+                yield [values[index] if 0 <= index < len(values) else '' for index in indices]
+
+
+def check_cross_references(
+        node_keys: List[str],
+        edge_keys: List[str],
+        bucket: str,
+        filter_size: int = Cross_Reference_Filter_Size
+) -> Dict[str, Any]:
+    """
+    Checks that the subject and object nodes of the edges of KGX files are found in the node files,
+    (e.g. inside a worker process of the KgxValidator), with a memory use bounded by the filter_size.
+
+    :param node_keys: S3 object keys of the KGX node files
+    :param edge_keys: S3 object keys of the KGX edge files
+    :param bucket:
+    :param filter_size: size (in bytes) of the Bloom filter of the node identifiers
+    :return: dictionary with a sample of the 'errors' and the 'error_count' (number of edge references
+             to missing nodes), plus the estimated 'false_positive_rate' of the node identifier filter
+    """
+    node_ids = NodeIdFilter(filter_size)
+    for object_key in node_keys:
+        for node_id, in _read_columns(bucket, object_key, ['id']):
+            node_ids.add(node_id)
+
+    error_count: int = 0
+    missing: Set[str] = set()
+    for object_key in edge_keys:
+        for references in _read_columns(bucket, object_key, ['subject', 'object']):
+            for node_id in references:
+                if node_id not in node_ids:
+                    error_count += 1
+                    if len(missing) < MAX_MISSING_NODE_SAMPLE:
+                        missing.add(node_id)
+
+    false_positive_rate = node_ids.false_positive_rate()
+    logger.debug(
+        f"check_cross_references(): {node_ids.count} nodes recorded (false positive rate {false_positive_rate:.2e}), " +
+        f"{error_count} edge references to missing nodes"
+    )
+
+    return {
+        'error_count': error_count,
+        'errors': [f"Edge subject or object node '{node_id}' not found in the node files" for node_id in sorted(missing)],
+        'false_positive_rate': false_positive_rate
+    }
@@ -0,0 +1,143 @@
+"""
+Block-parallel ("pigz" style) gzip compression
+"""
+from typing import Deque, Dict, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from os import cpu_count
+import time
+import zlib
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# size of the uncompressed blocks, each compressed into its own gzip member
+_GZIP_BLOCK_SIZE = 4 * 2**20
+
+# zlib 'wbits' value selecting a gzip (header and trailer) wrapped deflate stream
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def gzip_block(block: bytes, compresslevel: int = 6) -> bytes:
+    """
+    :param block: uncompressed data
+    :param compresslevel: zlib compression level (1-9)
+    :return: complete, standalone gzip member of the block
+    """
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, _GZIP_WBITS)
+    return compressor.compress(block) + compressor.flush()
+
+
+class ParallelGzipWriter:
+    """
+    Write-only file-like object, gzip compressing the data written to it into a target file-like object.
+
+    The data is split into fixed size blocks, each compressed (by zlib, which releases the GIL) in a pool
+    of threads, into a separate gzip member. The members are written to the target in order, resulting
+    in a standard multi-member gzip stream, which 'gunzip' and 'tar xzf' read as a single file.
+    Memory use is bounded by the number of blocks in flight (twice the number of worker threads).
+    """
+    def __init__(
+            self,
+            target,
+            block_size: int = _GZIP_BLOCK_SIZE,
+            max_workers: Optional[int] = None,
+            compresslevel: int = 6
+    ):
+        self.target = target
+        self.block_size = block_size
+        self.max_workers = max_workers if max_workers else (cpu_count() or 1)
+        self.compresslevel = compresslevel
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._pending: Deque[Future] = deque()
+        self._buffer = bytearray()
+        self._closed: bool = False
+
+        self.bytes_in: int = 0
+        self.bytes_out: int = 0
+        self.members: int = 0
+        self._start_time = time.perf_counter()
+        self.elapsed: float = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """
+        :return: True if the writer is closed
+        """
+        return self._closed
+
+    def write(self, data: bytes) -> int:
+        """
+        :param data: uncompressed data to be written
+        :return: number of (uncompressed) bytes written
+        """
+        if self._closed:
+            raise ValueError("ParallelGzipWriter.write(): writer is closed")
+
+        self._buffer.extend(data)
+        self.bytes_in += len(data)
+        while len(self._buffer) >= self.block_size:
+            self._submit(bytes(self._buffer[:self.block_size]))
+            del self._buffer[:self.block_size]
+
+        return len(data)
+
+    def _submit(self, block: bytes):
+        self._pending.append(self._executor.submit(gzip_block, block, self.compresslevel))
+        while len(self._pending) > 2 * self.max_workers:
+            self._write_member(self._pending.popleft())
+
+    def _write_member(self, future: Future):
+        member: bytes = future.result()
+        self.target.write(member)
+        self.bytes_out += len(member)
+        self.members += 1
+
+    def close(self):
+        """
+        Compresses any remaining data, writes all the pending gzip members
+        to the target (which is not closed) and reports the compression throughput.
+        """
+        if self._closed:
+            return
+
+        if self._buffer or not self.members and not self._pending:
+            # flush the last block (an empty gzip member, if nothing was written at all)
+            self._submit(bytes(self._buffer))
+            self._buffer.clear()
+
+        while self._pending:
+            self._write_member(self._pending.popleft())
+
+        self._executor.shutdown()
+        self._closed = True
+
+        self.elapsed = time.perf_counter() - self._start_time
+        statistics = self.get_statistics()
+        logger.info(
+            f"ParallelGzipWriter: compressed {statistics['bytes_in']} bytes " +
+            f"into {statistics['bytes_out']} bytes ({statistics['members']} gzip members) " +
+            f"in {statistics['seconds']:.2f} seconds, i.e. {statistics['mb_per_second']:.1f} MB/second " +
+            f"using {self.max_workers} threads"
+        )
+
+    def get_statistics(self) -> Dict:
+        """
+        :return: dictionary of compression statistics of the writer
+        """
+        elapsed = self.elapsed if self._closed else time.perf_counter() - self._start_time
+        return {
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            'members': self.members,
+            'seconds': elapsed,
+            'mb_per_second': self.bytes_in / 2**20 / elapsed if elapsed > 0 else 0.0
+        }
@@ -8,23 +8,31 @@ o  Test the system (both manually, by visual inspection of uploads)
 Stress test using SRI SemMedDb: https://github.com/NCATSTranslator/semmeddb-biolink-kg
 """
 from sys import stderr, exc_info
-from typing import Union, List, Tuple, Dict, Optional
-from subprocess import Popen, PIPE, STDOUT
+from typing import Union, List, Tuple, Dict, Optional, Iterator, Iterable, Any
 from os import getenv
-from os.path import sep, splitext, basename, dirname, abspath
+from os.path import sep, splitext, basename, dirname, abspath, commonprefix
 import io
+import shutil
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 
 from pprint import PrettyPrinter
 
 import random
 
 import re
-import itertools
 
 import traceback
 import logging
 
+import json
+import hashlib
+import asyncio
+
 import requests
+from aiohttp import ClientSession
 import smart_open
 from datetime import datetime
 
@@ -39,13 +47,17 @@ except ImportError:
     from yaml import Loader, Dumper
 
 from botocore.config import Config
+from botocore.exceptions import ClientError
 from boto3.s3.transfer import TransferConfig
 
 from kgea.aws.assume_role import AssumeRole, aws_config
+from kgea.server.web_services.gzip_utils import ParallelGzipWriter
 
 from kgea.config import (
+    get_app_config,
     PROVIDER_METADATA_FILE,
-    FILE_SET_METADATA_FILE
+    FILE_SET_METADATA_FILE,
+    CONTENT_METADATA_FILE
 )
 
 logger = logging.getLogger(__name__)
@@ -60,6 +72,18 @@ default_s3_region = s3_config['region']
 default_s3_bucket = s3_config['bucket']
 default_s3_root_key = s3_config['archive-directory']
 
+# S3 object key of the persisted snapshot of the KGE Archive catalog metadata,
+# stored beside (but outside of) the 'archive-directory' folder of the bucket
+default_archive_index_key = \
+    s3_config['archive-index'] if 'archive-index' in s3_config \
+    else f"{default_s3_root_key}-index/archive_contents.json"
+
+# bump whenever the layout of the persisted KGE Archive index changes
+_ARCHIVE_INDEX_VERSION = 2
+
+# maximum number of KGE Archive metadata files fetched concurrently from S3
+_METADATA_FETCH_CONCURRENCY = 16
+
 # TODO: may need to fix script paths below - may not resolve under Microsoft Windows
 # if sys.platform is 'win32':
 #     archive_script = archive_script.replace('\\', '/').replace('C:', '/mnt/c/')
@@ -73,6 +97,26 @@ _EDA_OUTPUT_DATA_PREFIX = "file_entry="  # the Decompress-In-Place bash script c
 
 _KGEA_URL_TRANSFER_SCRIPT = "kge_direct_url_transfer.bash"
 
+# Opaquely access the configuration dictionary
+_KGEA_APP_CONFIG = get_app_config()
+
+# Set the 'Use_Archive_Scripts' configuration tag to True, to use the (local disk
+# based) bash scripts above, instead of in-process S3 streaming, to build KGE File Set archives
+_USE_ARCHIVE_SCRIPTS: bool = \
+    _KGEA_APP_CONFIG['Use_Archive_Scripts'] if 'Use_Archive_Scripts' in _KGEA_APP_CONFIG else False
+
+# Maximum run time (in seconds) of the archive bash scripts (default: no time limit)
+_ARCHIVE_SCRIPT_TIMEOUT: Optional[float] = \
+    _KGEA_APP_CONFIG['Archive_Script_Timeout'] if 'Archive_Script_Timeout' in _KGEA_APP_CONFIG else None
+
+# Files of the 'archive' subfolder of a KGE File Set which are
+# bundled into its tar.gz archive (if present), in archive order
+_ARCHIVED_FILES = [
+    PROVIDER_METADATA_FILE, FILE_SET_METADATA_FILE, CONTENT_METADATA_FILE,
+    "nodes.tsv", "edges.tsv", "nodes/nodes.tsv", "edges/edges.tsv",
+    "nodes.jsonl", "edges.jsonl", "nodes/nodes.jsonl", "edges/edges.jsonl"
+]
+
 
 def print_error_trace(err_msg: str):
     """
@@ -86,20 +130,58 @@ def print_error_trace(err_msg: str):
 #############################################
 # General Utility Functions for this Module #
 #############################################
+# Size (in bytes) of the reads of the output of scripts (see run_script())
+_SCRIPT_OUTPUT_CHUNK_SIZE = 64 * 1024
+
+# Maximum length (in bytes) of a line of script output: longer lines are passed on in pieces of this length
+_SCRIPT_OUTPUT_MAX_LINE = 1024 * 1024
+
+
+async def _read_output_lines(stream: asyncio.StreamReader):
+    """
+    Reads the lines of (script) output from a stream, in chunks, such that lines of any length are
+    tolerated (unlike by StreamReader.readline(), which fails on lines longer than the stream limit),
+    while memory use is bounded, with overlong lines being yielded in _SCRIPT_OUTPUT_MAX_LINE pieces.
+
+    :param stream: output stream of a subprocess
+    :return: async iterator of the (raw, binary) lines of output
+    """
+    pending = b''
+    while True:
+        chunk = await stream.read(_SCRIPT_OUTPUT_CHUNK_SIZE)
+        if not chunk:
+            break
+        lines = (pending + chunk).split(b'\n')
+        pending = lines.pop()
+        for line in lines:
+            yield line
+        while len(pending) >= _SCRIPT_OUTPUT_MAX_LINE:
+            yield pending[:_SCRIPT_OUTPUT_MAX_LINE]
+            pending = pending[_SCRIPT_OUTPUT_MAX_LINE:]
+    if pending:
+        yield pending
+
+
 async def run_script(
         script,
         args: Tuple = (),
         # env: Optional = None
-        stdout_parser=None
+        stdout_parser=None,
+        timeout: Optional[float] = None
 ) -> int:
     """
     Run a given script in the background, with
      specified arguments and environment variables.
 
+    The script is run as an asyncio subprocess, whose output is streamed back
+    line by line (lines of any length), so the event loop is never blocked while the script runs.
+    The script process is killed if it times out or if the calling task is cancelled.
+
     :param script: full OS path to the executable script.
     :param args: command line arguments for the script
     :param stdout_parser: (optional) single string argument function to parse lines piped back from stdout of the script
-    :return: return code of the script
+    :param timeout: (optional) maximum number of seconds for the script to run (default: no time limit)
+    :return: return code of the script (-1 if the script could not be run or timed out)
     """
     cmd: List = list()
     cmd.append(script)
@@ -107,26 +189,49 @@ async def run_script(
     
     logger.debug(f"run_script(cmd: '{cmd}')")
     try:
-        with Popen(
-                args=cmd,
-                # env=env,
-                bufsize=1,
-                universal_newlines=True,
-                stdout=PIPE,
-                stderr=STDOUT
-        ) as proc:
-            logger.info(f"run_script({script}) log:")
-            for line in proc.stdout:
-                line = line.strip()
-                if stdout_parser:
-                    stdout_parser(line)
-                logger.debug(line)
-                
-    except RuntimeError:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT
+        )
+    except (OSError, RuntimeError):
         logger.error(f"run_script({script}) exception: {exc_info()}")
         return -1
-    
-    return proc.returncode
+
+    async def _process_output() -> int:
+        logger.info(f"run_script({script}) log:")
+        async for raw_line in _read_output_lines(proc.stdout):
+            line = raw_line.decode('utf-8', errors='replace').strip()
+            if stdout_parser:
+                stdout_parser(line)
+            logger.debug(line)
+        return await proc.wait()
+
+    try:
+        return await asyncio.wait_for(_process_output(), timeout=timeout)
+
+    except asyncio.TimeoutError:
+        logger.error(f"run_script({script}) timed out after {timeout} seconds?")
+        _kill_process(proc)
+        await proc.wait()
+        return -1
+
+    except asyncio.CancelledError:
+        logger.warning(f"run_script({script}) cancelled!")
+        _kill_process(proc)
+        await proc.wait()
+        raise
+
+
+def _kill_process(proc):
+    """
+    :param proc: asyncio subprocess to be killed (if still running)
+    """
+    if proc.returncode is None:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass  # already gone
 
 
 # https://www.askpython.com/python/examples/generate-random-strings-in-python
@@ -291,6 +396,7 @@ def create_location(bucket, kg_id):
     :param kg_id:
     :return:
     """
+    invalidate_object_keys(get_object_location(kg_id), bucket)
     return s3_client().put_object(Bucket=bucket, Key=get_object_location(kg_id))
 
 
@@ -301,6 +407,7 @@ def delete_location(bucket, kg_id):
     :param kg_id:
     :return:
     """
+    invalidate_object_keys(get_object_location(kg_id), bucket)
     return s3_client().delete(Bucket=bucket, Key=get_object_location(kg_id))
 
 
@@ -371,30 +478,107 @@ def match_objects_from_bucket(bucket_name, object_key, assumed_role=None):
     return [w.key == key for w in objs]
 
 
+# Object existence checks are briefly cached, both positive and negative results, as
+# a map of (bucket_name, object_key) to (existence flag, monotonic time of the check)
+_OBJECT_EXISTS_CACHE_TTL = 10.0  # seconds
+_object_exists_cache: Dict[Tuple[str, str], Tuple[bool, float]] = dict()
+_object_exists_lock = threading.Lock()
+
+
+def _cache_object_exists(bucket_name: str, object_key: str, exists: bool):
+    with _object_exists_lock:
+        _object_exists_cache[(bucket_name, object_key)] = (exists, time.monotonic())
+
+
+def invalidate_object_keys(object_location: str, bucket_name=default_s3_bucket):
+    """
+    Discards any cached existence checks of object keys in a given location,
+    to be called whenever objects in that location are written or deleted.
+
+    :param object_location: object key or object key prefix of the location
+    :param bucket_name: The bucket
+    """
+    with _object_exists_lock:
+        for cached in [
+            cached for cached in _object_exists_cache
+            if cached[0] == bucket_name and cached[1].startswith(object_location)
+        ]:
+            del _object_exists_cache[cached]
+
+
 def object_key_exists(
         object_key,
         bucket_name=default_s3_bucket,
-        assumed_role=None
+        assumed_role=None,
+        use_cache: bool = True
 ) -> bool:
     """
-    Checks for the existence of the specified object key
+    Checks for the existence of the specified object key, with a single S3 HEAD request.
+    The result of the check is briefly cached (see invalidate_object_keys()).
 
     :param bucket_name: The bucket
     :param object_key: Target object key in the bucket
     :param assumed_role: (optional) Assumed IAM Role with authority to make this inquiry
+    :param use_cache: (optional) set to False to bypass any cached result of a recent check
 
     :return: True if the object is in the bucket, False if it is not in the bucket (False also if empty object key)
     """
     if not object_key:
         return False
-    return any(
-        match_objects_from_bucket(
-            bucket_name=bucket_name,
-            object_key=object_key,
-            assumed_role=assumed_role
+
+    if use_cache:
+        with _object_exists_lock:
+            cached = _object_exists_cache.get((bucket_name, object_key))
+        if cached and time.monotonic() - cached[1] < _OBJECT_EXISTS_CACHE_TTL:
+            return cached[0]
+
+    try:
+        s3_client(assumed_role=assumed_role).head_object(Bucket=bucket_name, Key=object_key)
+        exists = True
+    except ClientError as ce:
+        if ce.response['Error']['Code'] not in ['404', 'NoSuchKey', 'NotFound']:
+            raise
+        exists = False
+
+    _cache_object_exists(bucket_name, object_key, exists)
+
+    return exists
+
+
+def object_keys_exist(
+        object_keys: List[str],
+        bucket_name=default_s3_bucket,
+        assumed_role=None
+) -> Dict[str, bool]:
+    """
+    Checks for the existence of a batch of object keys, using a
+    single S3 listing of the longest prefix common to all the keys.
+
+    :param object_keys: Target object keys in the bucket
+    :param bucket_name: The bucket
+    :param assumed_role: (optional) Assumed IAM Role with authority to make this inquiry
+
+    :return: dictionary of existence flags, indexed by object key
+    """
+    object_keys = [key for key in object_keys if key]
+    if not object_keys:
+        return dict()
+
+    found = set(
+        entry['Key'] for entry in iterate_object_entries(
+            bucket_name,
+            prefix=commonprefix(object_keys),
+            client=s3_client(assumed_role=assumed_role)
         )
     )
 
+    key_exists: Dict[str, bool] = dict()
+    for object_key in object_keys:
+        key_exists[object_key] = object_key in found
+        _cache_object_exists(bucket_name, object_key, key_exists[object_key])
+
+    return key_exists
+
 
 def location_available(bucket_name, object_key) -> bool:
     """
@@ -415,27 +599,76 @@ def location_available(bucket_name, object_key) -> bool:
         return True
 
 
-def object_entries_in_location(bucket, object_location='') -> Dict[str, int]:
+def iterate_object_entries(
+        bucket,
+        prefix: str = '',
+        delimiter: Optional[str] = None,
+        client=None
+) -> Iterator[Dict]:
     """
+    Lazily streams the object entries of a bucket, page by page, with the
+    prefix (and optional delimiter) of the listing pushed down to S3.
+
     :param bucket:
-    :param object_location:
+    :param prefix: object key prefix of the listed object entries (all bucket entries if empty)
+    :param delimiter: (optional) object key delimiter, usually '/', to only list entries 'directly' in the prefix
+    :param client: (optional) S3 client to use (default: s3_client())
+    :return: iterator of S3 'Contents' entries (dictionaries with 'Key', 'Size', 'ETag', etc.)
+    """
+    for page in _list_objects_pages(bucket, prefix=prefix, delimiter=delimiter, client=client):
+        for entry in page.get('Contents', []):
+            yield entry
+
+
+def iterate_object_folders(
+        bucket,
+        prefix: str = '',
+        delimiter: str = '/',
+        client=None
+) -> Iterator[str]:
+    """
+    Lazily streams the 'folders' (S3 CommonPrefixes) directly inside a given prefix of a bucket,
+    without walking the object keys of the files inside those folders.
+
+    :param bucket:
+    :param prefix: object key prefix of the folder being listed, usually ending with the delimiter
+    :param delimiter: object key delimiter (default: '/')
+    :param client: (optional) S3 client to use (default: s3_client())
+    :return: iterator of subfolder prefixes (each ending with the delimiter)
+    """
+    for page in _list_objects_pages(bucket, prefix=prefix, delimiter=delimiter, client=client):
+        for common_prefix in page.get('CommonPrefixes', []):
+            yield common_prefix['Prefix']
+
+
+def _list_objects_pages(bucket, prefix: str = '', delimiter: Optional[str] = None, client=None) -> Iterator[Dict]:
+    """
+    :param bucket:
+    :param prefix:
+    :param delimiter:
+    :param client:
+    :return: iterator of list_objects_v2 response pages
+    """
+    if not client:
+        client = s3_client()
+    list_args = {'Bucket': bucket, 'Prefix': prefix}
+    if delimiter:
+        list_args['Delimiter'] = delimiter
+    return client.get_paginator("list_objects_v2").paginate(**list_args)
+
+
+def object_entries_in_location(bucket, object_location='', delimiter: Optional[str] = None) -> Dict[str, int]:
+    """
+    :param bucket:
+    :param object_location: object key prefix of the location
+    :param delimiter: (optional) object key delimiter, to exclude entries in subfolders of the location
     :return: dictionary of object entries with their size in specified
              object location in a bucket (all bucket entries if object_location is empty)
     """
-    bucket_listings: Dict = dict()
-    # logger.debug(s3_client().get_paginator("list_objects_v2").paginate(Bucket=bucket_name))
-    for p in s3_client().get_paginator("list_objects_v2").paginate(Bucket=bucket):
-        if 'Contents' in p:
-            for entry in p['Contents']:
-                bucket_listings[entry['Key']] = entry['Size']
-        else:
-            return {}  # empty bucket?
-
-    # If object_location is the empty string, then each object
-    # listed passes (since the empty string is part of every string)
-    object_matches = {key: bucket_listings[key] for key in bucket_listings if object_location in key}
-    
-    return object_matches
+    return {
+        entry['Key']: entry['Size']
+        for entry in iterate_object_entries(bucket, prefix=object_location, delimiter=delimiter)
+    }
 
 
 def object_keys_in_location(bucket, object_location='') -> List[str]:
@@ -446,16 +679,15 @@ def object_keys_in_location(bucket, object_location='') -> List[str]:
     :return: all object keys in specified object location of a
              specified bucket (all bucket keys if object_location is empty)
     """
-    key_catalog = object_entries_in_location(bucket, object_location=object_location)
-    
-    return list(key_catalog.keys())
+    return [entry['Key'] for entry in iterate_object_entries(bucket, prefix=object_location)]
 
 
 def object_keys_for_fileset_version(
         kg_id: str,
         fileset_version: str,
         bucket=default_s3_bucket,
-        match_function=lambda x: True
+        match_function=lambda x: True,
+        object_subfolder=''
 ) -> Tuple[List[str], str]:
     """
     Returns a list of all the files associated with a
@@ -465,6 +697,7 @@ def object_keys_for_fileset_version(
     :param fileset_version: semantic version ('major.minor') of the file set
     :param bucket: target S3 bucket (default: current config.yaml bucket)
     :param match_function: (optional) lambda filter for list of file object keys returned
+    :param object_subfolder: (optional) subfolder path from root fileset path, to narrow the S3 listing
 
     :return: Tuple [ matched list of file object keys, file set version ] found
     """
@@ -473,7 +706,7 @@ def object_keys_for_fileset_version(
     object_key_list: List[str] = \
         object_keys_in_location(
             bucket=bucket,
-            object_location=target_fileset,
+            object_location=f"{target_fileset}{object_subfolder}",
         )
     filtered_file_key_list = list(filter(match_function, object_key_list))
     
@@ -498,25 +731,13 @@ def object_folder_contents_size(
     target_folder = f"{target_fileset}{object_subfolder}"
     
     logger.debug(f"object_folder_contents_size({target_folder})")
-    
-    object_key_catalog: Dict[str, int] = \
-        object_entries_in_location(
-            bucket=bucket,
-            object_location=target_folder,
-        )
 
-    total_size = 0
-    for size in object_key_catalog.values():
-        total_size += int(size)
-    
-    return total_size
+    return sum(int(entry['Size']) for entry in iterate_object_entries(bucket, prefix=target_folder))
 
 
-# for an s3 key, match on kg_id
-kg_ids_pattern = re.compile(rf"{default_s3_root_key}/([a-zA-Z\d \-]+)/.+")
 
-# for an s3 key, match on kg_id and fileset version
-kg_ids_with_versions_pattern = re.compile(rf"{default_s3_root_key}/([\S]+)/(\d+.\d+)/")
+# for the name of an S3 'folder' under a kg_id, match on a fileset version
+fileset_version_pattern = re.compile(r"^\d+.\d+$")
 
 
 def get_fileset_versions_available(bucket_name):
@@ -524,79 +745,131 @@ def get_fileset_versions_available(bucket_name):
     A roster of all the versions that all knowledge graphs have been updated to.
 
     Input:
-        - A list of object keys in S3 encoding knowledge graph objects
+        - The 'folders' (S3 CommonPrefixes) of the KGE Archive, encoding knowledge graph objects
     Output:
         - A map of knowledge graph names to a list of their versions
     Tasks:
-        - Extract the version from the knowledge graph path
-        - Reduce the versions by knowledge graph name (a grouping)
+        - List the kg_id folders of the KGE Archive
+        - List the fileset version subfolders of each kg_id folder
         - Filter out crud data (like NoneTypes) to guarantee portability between server and client
 
+    Only folder prefixes are listed, so the (many) data files
+    of the KGE File Sets are never walked by this function.
+
     :param bucket_name:
     :return versions_per_kg: dict
     """
+    client = s3_client()
 
-    all_kge_archive_files = \
-        object_entries_in_location(
-            bucket=bucket_name,
-            object_location=default_s3_root_key
-        )
-
-    # create a map of kg_ids and their versions
-    kg_ids = set(kg_ids_pattern.match(kg_file).group(1) for kg_file in all_kge_archive_files if
-                 kg_ids_pattern.match(kg_file) is not None)  # some kg_ids don't have versions
-    
     versions_per_kg = {}
-    version_kg_pairs = set(
-        (
-            kg_ids_with_versions_pattern.match(kg_file).group(1),
-            kg_ids_with_versions_pattern.match(kg_file).group(2)
-        ) for kg_file in all_kge_archive_files if kg_ids_with_versions_pattern.match(kg_file) is not None)
-
-    pp.pprint({"Knowledge Graphs": kg_ids, "File Set Versions": version_kg_pairs})
-
-    for key, group in itertools.groupby(version_kg_pairs, lambda x: x[0]):
-        versions_per_kg[key] = []
-        for thing in group:
-            versions_per_kg[key].append(thing[1])
+    for kg_folder in iterate_object_folders(bucket_name, prefix=f"{default_s3_root_key}/", client=client):
+        kg_id = kg_folder.split('/')[-2]
+        if not kg_id:
+            continue
+        versions_per_kg[kg_id] = [
+            version for version in (
+                version_folder.split('/')[-2]
+                for version_folder in iterate_object_folders(bucket_name, prefix=kg_folder, client=client)
+            )
+            if fileset_version_pattern.match(version)
+        ]
 
-    # add kg_ids that became filtered
-    for kg_id in kg_ids:
-        if kg_id not in versions_per_kg:
-            versions_per_kg[kg_id] = []
+    pp.pprint({"File Set Versions": versions_per_kg})
 
     return versions_per_kg
 
 
 # TODO: clarify expiration time - default to 1 day (in seconds)
-def create_presigned_url(object_key, bucket=default_s3_bucket, expiration=86400) -> Optional[str]:
+# Signed URLs are reused (see create_presigned_url()) until this fraction of their lifetime has passed
+Presigned_URL_Reuse_Fraction = \
+    _KGEA_APP_CONFIG['Presigned_URL_Reuse_Fraction'] if 'Presigned_URL_Reuse_Fraction' in _KGEA_APP_CONFIG else 0.5
+
+# maximum number of signed URLs cached
+_PRESIGNED_URL_CACHE_SIZE = 4096
+
+# (least recently used ordered) cache of signed URLs, keyed on (bucket, object key, disposition,
+# expiration), with values of the signed URL and the (time.monotonic()) time until it may be reused
+_presigned_url_cache: "OrderedDict[Tuple[str, str, Optional[str], int], Tuple[str, float]]" = OrderedDict()
+_presigned_url_lock = threading.Lock()
+_presigned_url_statistics: Dict[str, int] = {'hits': 0, 'misses': 0}
+
+
+def get_presigned_url_cache_statistics() -> Dict[str, Union[int, float]]:
+    """
+    :return: dictionary of the number of signed URL cache 'hits' and 'misses', the 'hit_rate' and the cache 'size'
+    """
+    with _presigned_url_lock:
+        hits = _presigned_url_statistics['hits']
+        misses = _presigned_url_statistics['misses']
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+            'size': len(_presigned_url_cache)
+        }
+
+
+def create_presigned_url(
+        object_key,
+        bucket=default_s3_bucket,
+        expiration=86400,
+        disposition: Optional[str] = 'attachment'
+) -> Optional[str]:
     """Generate a pre-signed URL to share an S3 object
 
+    Signed URLs are cached and reused, until the (configurable) Presigned_URL_Reuse_Fraction
+    of their lifetime has passed. The lifetime of a URL is the given expiration, or the remaining
+    lifetime of the (temporary, assumed role) credentials signing it, whichever is shorter.
+
     :param object_key: string
     :param bucket: string
     :param expiration: Time in seconds for the pre-signed URL to remain valid
+    :param disposition: (optional) HTTP Content-Disposition of the response to the pre-signed URL
     :return: Presigned URL as string. If error, returns None.
     """
+    key = (bucket, object_key, disposition, expiration)
+    now = time.monotonic()
+    with _presigned_url_lock:
+        cached = _presigned_url_cache.get(key)
+        if cached and now < cached[1]:
+            _presigned_url_cache.move_to_end(key)
+            _presigned_url_statistics['hits'] += 1
+            return cached[0]
+        _presigned_url_statistics['misses'] += 1
 
     # Generate a pre-signed URL for the S3 object
     # https://stackoverflow.com/a/52642792
     #
     # This may throw a Boto related exception - assume that it will be caught by the caller
     #
+    params = {'Bucket': bucket, 'Key': object_key}
+    if disposition:
+        params['ResponseContentDisposition'] = disposition
     try:
         endpoint = s3_client().generate_presigned_url(
             ClientMethod='get_object',
-            Params={
-                'Bucket': bucket,
-                'Key': object_key,
-                'ResponseContentDisposition': 'attachment',
-            },
+            Params=params,
             ExpiresIn=expiration
         )
     except Exception as e:
         logger.error("create_presigned_url() error: " + str(e))
         return None
 
+    lifetime: float = expiration
+    credentials_lifetime: Optional[float] = the_role.get_credentials_lifetime()
+    if credentials_lifetime is not None:
+        lifetime = min(lifetime, credentials_lifetime)
+
+    with _presigned_url_lock:
+        _presigned_url_cache[key] = (endpoint, now + lifetime * Presigned_URL_Reuse_Fraction)
+        _presigned_url_cache.move_to_end(key)
+        while len(_presigned_url_cache) > _PRESIGNED_URL_CACHE_SIZE:
+            _presigned_url_cache.popitem(last=False)
+        lookups = _presigned_url_statistics['hits'] + _presigned_url_statistics['misses']
+
+    if lookups % 1000 == 0:
+        logger.debug(f"create_presigned_url() cache statistics: {get_presigned_url_cache_statistics()}")
+
     # The endpoint contains the pre-signed URL
     return endpoint
 
@@ -674,6 +947,8 @@ def upload_file(bucket, object_key, source, client=s3_client(), config=None, cal
     except Exception as exc:
         logger.warning("kgea_file_ops.upload_file(): " + str(exc))
         # TODO: what sort of post-cancellation processing is needed here?
+    finally:
+        invalidate_object_keys(object_key, bucket)
 
 
 def upload_file_multipart(
@@ -734,6 +1009,261 @@ def upload_file_multipart(
     return object_key
 
 
+class HashingWriter:
+    """
+    Write-only file-like wrapper, computing the
+    SHA1 hash of all the data written through it.
+    """
+    def __init__(self, target):
+        self.target = target
+        self.sha1 = hashlib.sha1()
+        self.size: int = 0
+
+    def write(self, data: bytes) -> int:
+        """
+        :param data: bytes to be written to the wrapped target
+        :return: number of bytes written
+        """
+        self.sha1.update(data)
+        self.size += len(data)
+        self.target.write(data)
+        return len(data)
+
+    def hexdigest(self) -> str:
+        """
+        :return: SHA1 hash (in hexadecimal) of all the data written
+        """
+        return self.sha1.hexdigest()
+
+
+class HashingReader:
+    """
+    Read-only file-like wrapper, computing the
+    SHA1 hash of all the data read through it.
+    """
+    def __init__(self, source):
+        self.source = source
+        self.sha1 = hashlib.sha1()
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        :param size: maximum number of bytes to read from the wrapped source (all remaining bytes, if negative)
+        :return: bytes read
+        """
+        data = self.source.read(size)
+        self.sha1.update(data)
+        return data
+
+    def hexdigest(self) -> str:
+        """
+        :return: SHA1 hash (in hexadecimal) of all the data read
+        """
+        return self.sha1.hexdigest()
+
+
+def archive_file_manifest_key(kg_id: str, version: str, root: str = default_s3_root_key) -> str:
+    """
+    :return: object key of the manifest of the SHA1 hashes of the individual files of a KGE File Set archive
+    """
+    return f"{root}/{kg_id}/{version}/manifest/{kg_id}_{version}_files.sha1sum"
+
+
+def archive_fileset(
+        kg_id: str,
+        version: str,
+        bucket: str = default_s3_bucket,
+        root: str = default_s3_root_key
+) -> Tuple[str, str]:
+    """
+    Builds the tar.gz archive of a KGE File Set, in a single streaming pass: each file
+    of the 'archive' subfolder of the file set is read from S3 as a stream, into a tar
+    stream which is (block-parallel) gzip compressed straight into an S3 multipart upload. The SHA1 hash
+    of the archive, and of each of its files, are computed on the fly, then written into the file set 'manifest'.
+    No local disk is used and memory use is bounded (by the S3 multipart upload part size).
+
+    :param kg_id:
+    :param version:
+    :param bucket:
+    :param root:
+    :return: 2-tuple of the S3 object key and the SHA1 hash of the tar.gz archive
+    """
+    fileset_key = f"{root}/{kg_id}/{version}"
+    archive_folder = f"{fileset_key}/archive/"
+    fileset_name = f"{kg_id}_{version}"
+    archive_name = f"{fileset_name}.tar.gz"
+    archive_key = f"{archive_folder}{archive_name}"
+
+    client = s3_client()
+    transport_params = {'client': client}
+
+    file_sizes: Dict[str, int] = object_entries_in_location(bucket, archive_folder)
+    file_hashes: Dict[str, str] = dict()
+
+    start_time = time.perf_counter()
+    with smart_open.open(
+            f"s3://{bucket}/{archive_key}", 'wb',
+            compression='disable',
+            transport_params=transport_params
+    ) as archive_file:
+        hashing_writer = HashingWriter(archive_file)
+        with ParallelGzipWriter(hashing_writer) as gzip_writer, \
+                tarfile.open(name=archive_name, fileobj=gzip_writer, mode='w|') as tar:
+            for file_name in _ARCHIVED_FILES:
+                file_key = f"{archive_folder}{file_name}"
+                if file_key not in file_sizes:
+                    logger.debug(f"archive_fileset(): {file_name} unavailable for archiving?")
+                    continue
+                tar_info = tarfile.TarInfo(name=file_name)
+                tar_info.size = file_sizes[file_key]
+                tar_info.mtime = int(time.time())
+                tar_info.mode = 0o644
+                with smart_open.open(
+                        f"s3://{bucket}/{file_key}", 'rb',
+                        compression='disable',
+                        transport_params=transport_params
+                ) as archived_file:
+                    hashing_reader = HashingReader(archived_file)
+                    tar.addfile(tar_info, fileobj=hashing_reader)
+                file_hashes[file_name] = hashing_reader.hexdigest()
+                logger.debug(f"archive_fileset(): {file_name} archived!")
+
+    sha1_hash = hashing_writer.hexdigest()
+    logger.info(
+        f"archive_fileset(): {archive_key} of {hashing_writer.size} bytes " +
+        f"built in {time.perf_counter() - start_time:.1f} seconds"
+    )
+
+    # same format as the 'sha1sum' command line output
+    client.put_object(
+        Bucket=bucket,
+        Key=f"{fileset_key}/manifest/{fileset_name}.sha1.txt",
+        Body=f"{sha1_hash}  {archive_name}\n".encode('utf-8')
+    )
+    client.put_object(
+        Bucket=bucket,
+        Key=archive_file_manifest_key(kg_id, version, root),
+        Body="".join(f"{file_hash}  {file_name}\n" for file_name, file_hash in file_hashes.items()).encode('utf-8')
+    )
+
+    return archive_key, sha1_hash
+
+
+def _parse_sha1sum(text: Optional[str]) -> Dict[str, str]:
+    """
+    :param text: 'sha1sum' formatted text, i.e. lines of a SHA1 hash, two spaces and a file name
+    :return: dictionary of the SHA1 hashes, indexed by file name
+    """
+    hashes: Dict[str, str] = dict()
+    for line in (text or '').splitlines():
+        part = line.split(maxsplit=1)
+        if len(part) == 2:
+            hashes[part[1].lstrip('*')] = part[0]
+    return hashes
+
+
+def get_archive_file_entries(
+        kg_id: str,
+        version: str,
+        bucket: str = default_s3_bucket,
+        root: str = default_s3_root_key
+) -> List[Dict[str, Any]]:
+    """
+    Lists the (aggregated data, metadata and tar.gz archive) files of the 'archive'
+    subfolder of a KGE File Set, for individual (parallel or resumable) downloads.
+
+    :param kg_id:
+    :param version:
+    :param bucket:
+    :param root:
+    :return: list of file entries, with the 'file_name', 'object_key', 'size', 'etag'
+             and 'sha1' (None, if not recorded in the manifest) of each file
+    """
+    fileset_key = f"{root}/{kg_id}/{version}"
+    archive_folder = f"{fileset_key}/archive/"
+
+    client = s3_client()
+
+    # the file manifest is not written by the archive bash script
+    hashes: Dict[str, str] = dict()
+    file_manifest_key = archive_file_manifest_key(kg_id, version, root)
+    if object_key_exists(file_manifest_key, bucket):
+        hashes = _parse_sha1sum(load_s3_text_file(bucket, file_manifest_key, client=client))
+    hashes.update(
+        _parse_sha1sum(
+            load_s3_text_file(bucket, f"{fileset_key}/manifest/{kg_id}_{version}.sha1.txt", client=client)
+        )
+    )
+
+    entries: List[Dict[str, Any]] = list()
+    for entry in iterate_object_entries(bucket, prefix=archive_folder, delimiter='/', client=client):
+        file_name = entry['Key'][len(archive_folder):]
+        if not file_name:
+            continue
+        entries.append({
+            'file_name': file_name,
+            'object_key': entry['Key'],
+            'size': entry['Size'],
+            'etag': entry['ETag'].strip('"'),
+            'sha1': hashes.get(file_name)
+        })
+
+    return entries
+
+
+def verify_archive_manifest(
+        kg_id: str,
+        version: str,
+        bucket: str = default_s3_bucket,
+        root: str = default_s3_root_key
+) -> str:
+    """
+    Checks that the tar.gz archive of a KGE File Set and its SHA1 'manifest' are available,
+    (re-)computing the SHA1 hash of the archive, streamed from S3, if the manifest is missing.
+
+    :param kg_id:
+    :param version:
+    :param bucket:
+    :param root:
+    :return: SHA1 hash of the tar.gz archive
+    """
+    fileset_key = f"{root}/{kg_id}/{version}"
+    fileset_name = f"{kg_id}_{version}"
+    archive_name = f"{fileset_name}.tar.gz"
+    archive_key = f"{fileset_key}/archive/{archive_name}"
+    manifest_key = f"{fileset_key}/manifest/{fileset_name}.sha1.txt"
+
+    if not object_key_exists(archive_key, bucket, use_cache=False):
+        raise RuntimeError(f"verify_archive_manifest(): archive '{archive_key}' not found?")
+
+    client = s3_client()
+
+    if object_key_exists(manifest_key, bucket, use_cache=False):
+        manifest = load_s3_text_file(bucket, manifest_key, client=client)
+        if manifest and manifest.split():
+            return manifest.split()[0]
+
+    logger.warning(f"verify_archive_manifest(): computing missing SHA1 manifest of '{archive_key}'")
+
+    sha1 = hashlib.sha1()
+    with smart_open.open(
+            f"s3://{bucket}/{archive_key}", 'rb',
+            compression='disable',
+            transport_params={'client': client}
+    ) as archive_file:
+        for chunk in iter(lambda: archive_file.read(_MPU_BUFFER_PART_SIZE), b''):
+            sha1.update(chunk)
+    sha1_hash = sha1.hexdigest()
+
+    client.put_object(
+        Bucket=bucket,
+        Key=manifest_key,
+        Body=f"{sha1_hash}  {archive_name}\n".encode('utf-8')
+    )
+    invalidate_object_keys(manifest_key, bucket)
+
+    return sha1_hash
+
+
 async def compress_fileset(
         kg_id,
         version,
@@ -752,20 +1282,138 @@ async def compress_fileset(
     logger.info(f"Initiating execution of compress_fileset({s3_archive_key})")
 
     try:
-        return_code = await run_script(
-            script=_KGEA_ARCHIVER_SCRIPT,
-            args=(bucket, root, kg_id, version)
-        )
-        logger.info(f"Finished archive script build {s3_archive_key}, return code: {str(return_code)}")
+        if _USE_ARCHIVE_SCRIPTS:
+            return_code = await run_script(
+                script=_KGEA_ARCHIVER_SCRIPT,
+                args=(bucket, root, kg_id, version),
+                timeout=_ARCHIVE_SCRIPT_TIMEOUT
+            )
+            logger.info(f"Finished archive script build {s3_archive_key}, return code: {str(return_code)}")
+        else:
+            _, sha1_hash = await asyncio.get_running_loop().run_in_executor(
+                None, archive_fileset, kg_id, version, bucket, root
+            )
+            logger.info(f"Finished archive build {s3_archive_key}, SHA1 hash: {sha1_hash}")
         
     except Exception as e:
         logger.error(f"compress_fileset({s3_archive_key}) exception: {str(e)}")
 
+    # the archive and its manifest are written behind the back of this module
+    invalidate_object_keys(f"{root}/{kg_id}/{version}/", bucket)
+
     logger.info(f"Exiting compress_fileset({s3_archive_key})")
     
     return s3_archive_key
 
 
+# Heuristic classification of the (meta-)data files found inside an uploaded
+# KGX data archive, using the KgeFileType codes of the KGE File Set Catalog:
+# 3 - KGX node data file, 4 - KGX edge data file, 1 - KGX content metadata file
+_KGX_FILE_EXT = "(tsv|jsonl)"
+_archive_node_file_pattern = re.compile(rf"node[s]?.{_KGX_FILE_EXT}")
+_archive_node_folder_pattern = re.compile("nodes/")
+_archive_edge_file_pattern = re.compile(rf"edge[s]?.{_KGX_FILE_EXT}")
+_archive_edge_folder_pattern = re.compile("edges/")
+_archive_metadata_pattern = re.compile(r"content_metadata\.json|metadata/")
+
+# size of the S3 multipart upload parts of files extracted from a data archive
+_EXTRACT_PART_SIZE = 8 * 2**20
+
+
+def typed_core_file_object_key(file_path: str) -> Optional[Tuple[str, int]]:
+    """
+    Heuristically assigns the (core) object key and file type of a file of a KGX data archive.
+
+    :param file_path: path of the file inside of the archive
+    :return: 2-tuple of the core object key and (KgeFileType) file type code, None if the file is ignored
+    """
+    if _archive_node_file_pattern.search(file_path):
+        return f"nodes/{file_path}", 3
+    elif _archive_node_folder_pattern.search(file_path):
+        return file_path, 3
+    elif _archive_edge_file_pattern.search(file_path):
+        return f"edges/{file_path}", 4
+    elif _archive_edge_folder_pattern.search(file_path):
+        return file_path, 4
+    elif _archive_metadata_pattern.search(file_path):
+        # place the singleton(?) content metadata file
+        # into the main versioned file set directory
+        return CONTENT_METADATA_FILE, 1
+    else:
+        return None
+
+
+def extract_archive_members(
+        kg_id: str,
+        file_set_version: str,
+        archive_filename: str,
+        bucket: str = default_s3_bucket,
+        root_directory: str = default_s3_root_key
+) -> List[Dict[str, str]]:
+    """
+    Extracts the KGX (meta-)data files of a tar.gz data archive of a KGE File Set, in a single streaming
+    pass: the archive is read once from S3 as a 'r|gz' tar stream and each (classified) member file is
+    piped into its own S3 multipart upload, in fixed size parts. No local disk is used.
+
+    :param kg_id: knowledge graph identifier to which the archive belongs
+    :param file_set_version: file set version to which the archive belongs
+    :param archive_filename: base name of the tar.gz archive (i.e. without the '.tar.gz' extension)
+    :param bucket: in S3
+    :param root_directory: KGE data folder in the bucket
+
+    :return: list of file entries
+    """
+    file_set_key_prefix = f"{root_directory}/{kg_id}/{file_set_version}"
+    archive_object_key = f"{file_set_key_prefix}/{archive_filename}.tar.gz"
+
+    client = s3_client()
+
+    file_entries: List[Dict[str, str]] = []
+    with smart_open.open(
+            f"s3://{bucket}/{archive_object_key}", 'rb',
+            compression='disable',
+            transport_params={'client': client}
+    ) as archive_file:
+        with tarfile.open(fileobj=archive_file, mode='r|gz') as tar:
+            for member in tar:
+                if not member.isfile():
+                    continue
+
+                file_path = member.name[2:] if member.name.startswith('./') else member.name
+                file_name = basename(file_path)
+
+                typed_key = typed_core_file_object_key(file_path)
+                if not typed_key:
+                    logger.debug(f"File '{file_path}' is not a KGX graph (meta-)data file... ignored!")
+                    continue
+                core_file_object_key, file_type = typed_key
+
+                # We prefix the names of the copied files with the archive name to avoid
+                # name collisions with files previously posted from other sources, to S3,
+                # except for the content_metadata.json, which is assumed unique(!)
+                if core_file_object_key != CONTENT_METADATA_FILE:
+                    core_file_object_key = f"{archive_filename}_{core_file_object_key}"
+
+                file_object_key = f"{file_set_key_prefix}/{core_file_object_key}"
+
+                logger.debug(f"Uploading archive file '{file_path}' to '{file_object_key}'")
+                with smart_open.open(
+                        f"s3://{bucket}/{file_object_key}", 'wb',
+                        compression='disable',
+                        transport_params={'client': client, 'min_part_size': _EXTRACT_PART_SIZE}
+                ) as extracted_file:
+                    shutil.copyfileobj(tar.extractfile(member), extracted_file, _EXTRACT_PART_SIZE)
+
+                file_entries.append({
+                    "file_name": file_name,
+                    "file_type": str(file_type),
+                    "file_size": str(member.size),
+                    "object_key": file_object_key
+                })
+
+    return file_entries
+
+
 async def extract_data_archive(
         kg_id: str,
         file_set_version: str,
@@ -778,6 +1426,7 @@ async def extract_data_archive(
     
     Version 1.0 - decompress_in_place() below used Smart_Open... not scalable
     Version 2.0 - this version uses an external bash shell script to perform this operation...
+    Version 3.0 - extract_archive_members() streams the archive from and to S3 (unless 'Use_Archive_Scripts')
 
     :param kg_id: knowledge graph identifier to which the archive belongs
     :param file_set_version: file set version to which the archive belongs
@@ -787,7 +1436,7 @@ async def extract_data_archive(
     
     :return: list of file entries
     """
-    # one step decompression - bash level script operations on the local disk
+    # one step decompression - streamed in process, or bash level script operations on the local disk
     logger.debug(f"Initiating execution of extract_data_archive({archive_filename})")
     
     if not archive_filename.endswith('.tar.gz'):
@@ -819,21 +1468,35 @@ async def extract_data_archive(
                 "object_key": file_object_key
             })
     try:
-        return_code = await run_script(
-            script=_KGEA_EDA_SCRIPT,
-            args=(
-                bucket,
-                root_directory,
-                kg_id,
-                file_set_version,
-                archive_filename
-            ),
-            stdout_parser=output_parser
-        )
-        logger.debug(f"Completed extract_data_archive({archive_filename}.tar.gz), with return code {str(return_code)}")
+        if _USE_ARCHIVE_SCRIPTS:
+            return_code = await run_script(
+                script=_KGEA_EDA_SCRIPT,
+                args=(
+                    bucket,
+                    root_directory,
+                    kg_id,
+                    file_set_version,
+                    archive_filename
+                ),
+                stdout_parser=output_parser,
+                timeout=_ARCHIVE_SCRIPT_TIMEOUT
+            )
+            logger.debug(
+                f"Completed extract_data_archive({archive_filename}.tar.gz), with return code {str(return_code)}"
+            )
+        else:
+            file_entries = await asyncio.get_running_loop().run_in_executor(
+                None,
+                extract_archive_members,
+                kg_id, file_set_version, archive_filename, bucket, root_directory
+            )
+            logger.debug(f"Completed extract_data_archive({archive_filename}.tar.gz)")
         
     except Exception as e:
         logger.error(f"decompress_in_place({archive_filename}.tar.gz): exception {str(e)}")
+
+    # the extracted files are written behind the back of this module
+    invalidate_object_keys(f"{root_directory}/{kg_id}/{file_set_version}/", bucket)
     
     logger.debug(f"Exiting decompress_in_place({archive_filename}.tar.gz)")
 
@@ -1043,21 +1706,406 @@ def decompress_to_kgx(gzipped_key, location, strict=False, prefix=True):
     return decompress_in_place(gzipped_key, location, traversal_func_kgx)
 
 
+# S3 multipart upload part size limits (except that the last part may be smaller)
+_MPU_MIN_PART_SIZE = 5 * 2**20
+_MPU_MAX_PART_SIZE = 5 * 2**30
+_MPU_MAX_PARTS = 10000
+
+# size beyond which re-streamed (small) pieces are uploaded as a multipart upload part
+_MPU_BUFFER_PART_SIZE = 8 * 2**20
+
+# maximum number of multipart upload parts copied or uploaded at the same time
+_MPU_COPY_CONCURRENCY = 8
+
+# source files with these extensions are transparently (de)compressed
+# by smart_open, hence cannot be aggregated by server side copying
+_COMPRESSED_FILE_EXTENSIONS = ('.gz', '.bz2', '.xz', '.zst', '.zip')
+
+# An aggregation segment is either a byte range (object key, start, end) of
+# a source object, with 'end' exclusive, or a (small) literal piece of bytes
+AggregateSegment = Union[Tuple[str, int, int], bytes]
+
+
+def _object_tail(client, bucket: str, object_key: str) -> Tuple[int, bytes]:
+    """
+    :return: 2-tuple of the size and the last byte of the object (0 and empty bytes, if the object is empty)
+    """
+    try:
+        response = client.get_object(Bucket=bucket, Key=object_key, Range='bytes=-1')
+    except ClientError as ce:
+        if ce.response['Error']['Code'] == 'InvalidRange':
+            return 0, b''
+        raise
+    size = int(response['ContentRange'].split('/')[-1])
+    return size, response['Body'].read()
+
+
+def _read_object_range(client, bucket: str, object_key: str, start: int, end: int) -> bytes:
+    """
+    :return: bytes [start, end) of the object
+    """
+    response = client.get_object(Bucket=bucket, Key=object_key, Range=f"bytes={start}-{end - 1}")
+    return response['Body'].read()
+
+
+# size of the ranged GET probes used to find the line boundaries inside an S3 object
+_LINE_PROBE_SIZE = 64 * 2**10
+
+
+def _next_line_boundary(client, bucket: str, object_key: str, offset: int, size: int) -> int:
+    """
+    :return: offset just past the first newline at or after the given offset of the object (size, if none)
+    """
+    while offset < size:
+        probe = _read_object_range(client, bucket, object_key, offset, min(offset + _LINE_PROBE_SIZE, size))
+        if not probe:
+            break
+        newline = probe.find(b"\n")
+        if newline >= 0:
+            return offset + newline + 1
+        offset += len(probe)
+    return size
+
+
+def get_line_aligned_ranges(
+        bucket: str,
+        object_key: str,
+        shard_size: int,
+        client=None
+) -> List[Tuple[int, int]]:
+    """
+    Splits an S3 object into (roughly) shard_size byte ranges, each ending on a line boundary,
+    by ranged GET probes of the object at the nominal shard boundaries.
+
+    :param bucket:
+    :param object_key:
+    :param shard_size: nominal size, in bytes, of the ranges
+    :param client: (optional) S3 client
+    :return: list of [start, end) byte ranges covering the whole object (empty, if the object is empty)
+    """
+    if not client:
+        client = s3_client()
+
+    size = client.head_object(Bucket=bucket, Key=object_key)['ContentLength']
+
+    boundaries: List[int] = [0]
+    for nominal in range(shard_size, size, shard_size):
+        if nominal <= boundaries[-1]:
+            # the previous range overran this nominal boundary, i.e. a very long line
+            continue
+        boundary = _next_line_boundary(client, bucket, object_key, nominal - 1, size)
+        if boundary < size:
+            boundaries.append(boundary)
+    if size:
+        boundaries.append(size)
+
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def get_first_line(bucket: str, object_key: str, client=None) -> bytes:
+    """
+    :return: the first line (e.g. TSV header), with its newline, of an S3 object
+    """
+    if not client:
+        client = s3_client()
+
+    size = client.head_object(Bucket=bucket, Key=object_key)['ContentLength']
+    end = _next_line_boundary(client, bucket, object_key, 0, size)
+
+    return _read_object_range(client, bucket, object_key, 0, end) if end else b''
+
+
+def _plan_multipart_copy(
+        segments: List[AggregateSegment],
+        min_part_size: int = _MPU_MIN_PART_SIZE,
+        max_part_size: int = _MPU_MAX_PART_SIZE,
+        buffer_part_size: int = _MPU_BUFFER_PART_SIZE
+) -> Iterator[Tuple[str, List[AggregateSegment]]]:
+    """
+    Plans the parts of a multipart upload concatenating a sequence of segments.
+
+    Source object ranges of at least min_part_size are copied server side (in parts no larger than
+    max_part_size). Literal pieces and smaller ranges are buffered - topped up, if need be, with the
+    head of the next large range - into 'upload' parts of at least min_part_size (but the last).
+
+    :return: iterator of ('copy', [range]) or ('upload', [segments]) parts, in order
+    """
+    pending: List[AggregateSegment] = []
+    pending_size = 0
+
+    for segment in segments:
+
+        if isinstance(segment, bytes):
+            if segment:
+                pending.append(segment)
+                pending_size += len(segment)
+
+        else:
+            object_key, start, end = segment
+
+            if pending_size and end - start >= min_part_size and pending_size + end - start >= 2 * min_part_size:
+                # top up the pending buffer with the head of this range
+                top_up = max(0, min_part_size - pending_size)
+                if top_up:
+                    pending.append((object_key, start, start + top_up))
+                yield 'upload', pending
+                pending, pending_size = [], 0
+                start += top_up
+
+            length = end - start
+            if not pending_size and length >= min_part_size:
+                # split into equal sized parts no larger than max_part_size
+                parts = -(-length // max_part_size)
+                for i in range(parts):
+                    yield 'copy', [(object_key, start + i * length // parts, start + (i + 1) * length // parts)]
+            elif length > 0:
+                pending.append((object_key, start, end))
+                pending_size += length
+
+        if pending_size >= buffer_part_size:
+            yield 'upload', pending
+            pending, pending_size = [], 0
+
+    if pending:
+        yield 'upload', pending
+
+
+def _multipart_copy_aggregate(
+        bucket: str,
+        target_key: str,
+        segments: List[AggregateSegment],
+        client=None,
+        max_workers: int = _MPU_COPY_CONCURRENCY
+) -> int:
+    """
+    Concatenates segments into a target object of a bucket, mostly by server side
+    UploadPartCopy, with the parts of a multipart upload copied or uploaded in parallel.
+
+    :return: number of multipart upload parts
+    :raises RuntimeError if the multipart upload fails (in which case, it is aborted)
+    """
+    if not client:
+        client = s3_client(
+            config=Config(
+                signature_version='s3v4',
+                region_name=default_s3_region,
+                max_pool_connections=max_workers
+            )
+        )
+
+    parts = list(_plan_multipart_copy(segments))
+    if not parts:
+        client.put_object(Bucket=bucket, Key=target_key, Body=b'')
+        return 0
+    elif len(parts) > _MPU_MAX_PARTS:
+        raise RuntimeError(f"_multipart_copy_aggregate(): too many ({len(parts)}) parts for '{target_key}'")
+
+    mpu = client.create_multipart_upload(Bucket=bucket, Key=target_key)
+    upload_id = mpu['UploadId']
+
+    def _transfer_part(part_number: int, part_type: str, pieces: List[AggregateSegment]) -> Dict:
+        if part_type == 'copy':
+            object_key, start, end = pieces[0]
+            response = client.upload_part_copy(
+                Bucket=bucket,
+                Key=target_key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                CopySource={'Bucket': bucket, 'Key': object_key},
+                CopySourceRange=f"bytes={start}-{end - 1}"
+            )
+            etag = response['CopyPartResult']['ETag']
+        else:
+            body = b''.join(
+                piece if isinstance(piece, bytes) else _read_object_range(client, bucket, *piece)
+                for piece in pieces
+            )
+            response = client.upload_part(
+                Bucket=bucket,
+                Key=target_key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body
+            )
+            etag = response['ETag']
+        return {'PartNumber': part_number, 'ETag': etag}
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            completed_parts = list(
+                executor.map(
+                    lambda numbered_part: _transfer_part(numbered_part[0], *numbered_part[1]),
+                    enumerate(parts, start=1)
+                )
+            )
+        client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=target_key,
+            UploadId=upload_id,
+            MultipartUpload={'Parts': completed_parts}
+        )
+    except Exception as e:
+        client.abort_multipart_upload(Bucket=bucket, Key=target_key, UploadId=upload_id)
+        raise RuntimeError(f"_multipart_copy_aggregate('{target_key}'): multipart copy failed: {str(e)}")
+
+    return len(parts)
+
+
+def _aggregate_by_copying(
+        bucket: str,
+        target_key: str,
+        file_object_keys: List[str],
+        header_lengths: Optional[Dict[str, int]] = None
+):
+    """
+    Server side aggregation of files, ensuring that each file
+    but the last one is terminated by a newline character.
+
+    :param header_lengths: (optional) number of (header) bytes to skip at the start of given files
+    """
+    if header_lengths is None:
+        header_lengths = dict()
+
+    client = s3_client(
+        config=Config(
+            signature_version='s3v4',
+            region_name=default_s3_region,
+            max_pool_connections=_MPU_COPY_CONCURRENCY
+        )
+    )
+    segments: List[AggregateSegment] = []
+    for index, file_object_key in enumerate(file_object_keys):
+        size, last_byte = _object_tail(client, bucket, file_object_key)
+        start = min(header_lengths.get(file_object_key, 0), size)
+        segments.append((file_object_key, start, size))
+        if size > start and last_byte != b"\n" and index < (len(file_object_keys) - 1):
+            segments.append(b"\n")
+
+    parts = _multipart_copy_aggregate(bucket, target_key, segments, client=client)
+
+    logger.debug(f"_aggregate_by_copying(): {len(file_object_keys)} files aggregated in {parts} parts")
+
+
+def _aggregate_by_streaming(
+        bucket: str,
+        target_key: str,
+        file_object_keys: List[str],
+        skip_header: bool = False
+):
+    """
+    Aggregation of files by streaming their lines through this process,
+    ensuring that each file but the last one is terminated by a newline character.
+
+    :param skip_header: (optional) skip the first (header) line of all the files but the first one
+    """
+    with smart_open.open(f"s3://{bucket}/{target_key}", 'w', encoding="utf-8", newline="\n") as aggregated_file:
+        for index, file_object_key in enumerate(file_object_keys):
+            target_key_uri = f"s3://{bucket}/{file_object_key}"
+            line = "\n"
+            with smart_open.open(target_key_uri, 'r', encoding="utf-8", newline="\n") as subfile:
+                if skip_header and index > 0:
+                    next(subfile, None)
+                for line in subfile:
+                    aggregated_file.write(line)
+                # only add newline if it isn't the last file. -1 for zero index
+                if not line.endswith("\n") and index < (len(file_object_keys) - 1):
+                    aggregated_file.write("\n")
+
+
+def _read_tsv_header(bucket: str, object_key: str) -> Tuple[List[str], int]:
+    """
+    :return: 2-tuple of the column names of the (first line) header of a TSV file,
+             and the length in bytes of the header line (empty list and 0 if the file is empty)
+    """
+    with smart_open.open(f"s3://{bucket}/{object_key}", 'rb') as tsv_file:
+        header = tsv_file.readline()
+    if not header:
+        return [], 0
+    return header.decode('utf-8').rstrip('\r\n').split('\t'), len(header)
+
+
+def _merge_tsv_files(
+        bucket: str,
+        target_key: str,
+        file_object_keys: List[str],
+        headers: List[List[str]]
+):
+    """
+    Merges TSV files with distinct headers, in a single streaming pass: a header with the
+    union of all the columns (in order of first appearance) is written, then the rows of
+    each file, with its columns remapped onto the merged header (missing values left empty).
+
+    Rows with more fields than the header of their file are malformed: their extra
+    fields have no column to be merged into, hence are dropped, and the rows are
+    counted and reported (as a warning, per file).
+
+    :param headers: list of the header column names of each file
+    :return: number of malformed rows found
+    """
+    merged_columns: Dict[str, int] = dict()
+    for columns in headers:
+        for column in columns:
+            if column not in merged_columns:
+                merged_columns[column] = len(merged_columns)
+    width = len(merged_columns)
+
+    total_malformed: int = 0
+    with smart_open.open(f"s3://{bucket}/{target_key}", 'w', encoding="utf-8", newline="\n") as aggregated_file:
+        aggregated_file.write("\t".join(merged_columns) + "\n")
+        for file_object_key, columns in zip(file_object_keys, headers):
+            column_map = [merged_columns[column] for column in columns]
+            malformed: int = 0
+            first_malformed: int = 0
+            with smart_open.open(f"s3://{bucket}/{file_object_key}", 'r', encoding="utf-8", newline="\n") as subfile:
+                next(subfile, None)
+                # line numbers count the header as line 1
+                for line_number, line in enumerate(subfile, start=2):
+                    line = line.rstrip("\r\n")
+                    if not line:
+                        continue
+                    values = line.split("\t")
+                    if len(values) > len(column_map):
+                        malformed += 1
+                        if not first_malformed:
+                            first_malformed = line_number
+                    row = [''] * width
+                    for index, value in zip(column_map, values):
+                        row[index] = value
+                    aggregated_file.write("\t".join(row) + "\n")
+            if malformed:
+                logger.warning(
+                    f"_merge_tsv_files(): {malformed} row(s) of '{file_object_key}' (first at line {first_malformed}) " +
+                    f"have more fields than its {len(column_map)} header columns; their extra fields were dropped"
+                )
+                total_malformed += malformed
+
+    return total_malformed
+
+
 def aggregate_files(
         target_folder,
         target_name,
         file_object_keys,
         bucket=default_s3_bucket,
-        match_function=lambda x: True
+        match_function=lambda x: True,
+        server_side: bool = True
 ) -> str:
     """
     Aggregates files matching a match_function.
 
+    Unless the files are compressed, they are aggregated server side, with S3 multipart
+    copying, only re-streaming small boundary pieces (like a missing trailing newline).
+
+    TSV files (i.e. a target_name with a '.tsv' extension) are aggregated under a single
+    header: if all the files have the same header, the headers of all files but the
+    first are simply skipped, otherwise the files are merged by their header columns.
+
     :param bucket:
     :param target_folder:
     :param target_name: target data file format(s)
     :param file_object_keys:
     :param match_function:
+    :param server_side: (optional) set to False to stream all the files through this process
     :return:
     """
     if not file_object_keys:
@@ -1065,15 +2113,42 @@ def aggregate_files(
 
     agg_path = f"s3://{bucket}/{target_folder}/{target_name}"
     logger.debug(f"agg_path: {agg_path}")
-    with smart_open.open(agg_path, 'w', encoding="utf-8", newline="\n") as aggregated_file:
-        file_object_keys = list(filter(match_function, file_object_keys))
-        for index, file_object_key in enumerate(file_object_keys):
-            target_key_uri = f"s3://{bucket}/{file_object_key}"
-            with smart_open.open(target_key_uri, 'r', encoding="utf-8", newline="\n") as subfile:
-                for line in subfile:
-                    aggregated_file.write(line)
-                if index < (len(file_object_keys) - 1):  # only add newline if it isn't the last file. -1 for zero index
-                    aggregated_file.write("\n")
+
+    target_key = f"{target_folder}/{target_name}"
+    file_object_keys = list(filter(match_function, file_object_keys))
+
+    header_lengths: Dict[str, int] = dict()
+    if target_name.endswith('.tsv'):
+        with ThreadPoolExecutor(max_workers=_METADATA_FETCH_CONCURRENCY) as executor:
+            tsv_headers = list(executor.map(lambda key: _read_tsv_header(bucket, key), file_object_keys))
+
+        # ignore empty files
+        file_object_keys = [key for key, header in zip(file_object_keys, tsv_headers) if header[1]]
+        tsv_headers = [header for header in tsv_headers if header[1]]
+
+        if any(columns != tsv_headers[0][0] for columns, _ in tsv_headers):
+            logger.debug(f"aggregate_files(): merging TSV files with distinct headers into '{target_key}'")
+            _merge_tsv_files(bucket, target_key, file_object_keys, [columns for columns, _ in tsv_headers])
+            invalidate_object_keys(target_key, bucket)
+            return agg_path
+
+        # Fast path: identical headers, hence only the first one is kept
+        header_lengths = {key: header[1] for key, header in list(zip(file_object_keys, tsv_headers))[1:]}
+
+    aggregated = False
+    if server_side and not any(
+            key.endswith(_COMPRESSED_FILE_EXTENSIONS) for key in file_object_keys + [target_key]
+    ):
+        try:
+            _aggregate_by_copying(bucket, target_key, file_object_keys, header_lengths=header_lengths)
+            aggregated = True
+        except Exception as e:
+            logger.warning(f"aggregate_files(): server side aggregation failed, streaming instead: {str(e)}")
+
+    if not aggregated:
+        _aggregate_by_streaming(bucket, target_key, file_object_keys, skip_header=bool(header_lengths))
+
+    invalidate_object_keys(target_key, bucket)
 
     return agg_path
 
@@ -1104,21 +2179,31 @@ def copy_file(
         'Key': source_key
     }
     s3_client().copy(copy_source, bucket, target_key)
+    invalidate_object_keys(target_key, bucket)
 
     logger.debug(f"...copy completed!")
 
 
-def load_s3_text_file(bucket_name: str, object_name: str, mode: str = 'text') -> Union[None, bytes, str]:
+def load_s3_text_file(
+        bucket_name: str,
+        object_name: str,
+        mode: str = 'text',
+        client=None
+) -> Union[None, bytes, str]:
     """
     Given an S3 object key name, load the specific file.
     The return value defaults to being decoded from utf-8 to a text string.
     Return None the object is inaccessible.
+    An S3 client may be given, to share it between many calls.
     """
     data_string: Union[None, bytes, str] = None
 
+    if not client:
+        client = s3_client()
+
     try:
         mf = io.BytesIO()
-        s3_client().download_fileobj(
+        client.download_fileobj(
             bucket_name,
             object_name,
             mf
@@ -1133,7 +2218,168 @@ def load_s3_text_file(bucket_name: str, object_name: str, mode: str = 'text') ->
     return data_string
 
 
-def get_archive_contents(bucket_name: str) -> \
+def load_s3_text_files(
+        bucket_name: str,
+        object_names: List[str],
+        max_workers: int = _METADATA_FETCH_CONCURRENCY
+) -> Dict[str, Optional[str]]:
+    """
+    Loads a collection of (small) S3 text files concurrently, using a bounded pool
+    of threads sharing a single S3 client. The latency of each fetch is logged.
+
+    :param bucket_name: The bucket
+    :param object_names: list of object keys of the text files to load
+    :param max_workers: maximum number of text files being fetched at the same time
+    :return: dictionary of text file contents (None if the object is inaccessible), indexed by object key
+    """
+    if not object_names:
+        return dict()
+
+    # the shared client needs (at least) one pooled HTTP connection per worker thread
+    client = s3_client(
+        config=Config(
+            signature_version='s3v4',
+            region_name=default_s3_region,
+            max_pool_connections=max_workers
+        )
+    )
+
+    def _timed_load(object_name: str) -> Optional[str]:
+        start = time.perf_counter()
+        text = load_s3_text_file(bucket_name=bucket_name, object_name=object_name, client=client)
+        logger.debug(f"load_s3_text_files(): '{object_name}' fetched in {time.perf_counter() - start:.3f} seconds")
+        return text
+
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        texts = dict(zip(object_names, executor.map(_timed_load, object_names)))
+    logger.debug(
+        f"load_s3_text_files(): {len(object_names)} files fetched " +
+        f"in {time.perf_counter() - start_time:.3f} seconds"
+    )
+
+    return texts
+
+
+def object_etags_in_location(bucket, object_location='') -> Dict[str, str]:
+    """
+    :param bucket:
+    :param object_location: object key prefix of the location (all bucket entries if object_location is empty)
+    :return: dictionary of object keys with their ETag, for all objects in the specified location in a bucket
+    """
+    return {entry['Key']: entry['ETag'] for entry in iterate_object_entries(bucket, prefix=object_location)}
+
+
+def _is_archive_metadata_key(object_key: str) -> bool:
+    """
+    :param object_key: object key in the KGE Archive
+    :return: True if the object key is a PROVIDER_METADATA_FILE or FILE_SET_METADATA_FILE of a knowledge graph
+    """
+    file_part = object_key.split('/')
+    if file_part[0] != default_s3_root_key:
+        return False
+    if len(file_part) == 3:
+        return file_part[2] == PROVIDER_METADATA_FILE
+    elif len(file_part) == 4:
+        return file_part[3] == FILE_SET_METADATA_FILE
+    return False
+
+
+def load_archive_index(bucket_name: str, index_key: str = default_archive_index_key) -> Dict:
+    """
+    Loads the persisted snapshot of the KGE Archive index from S3.
+
+    :param bucket_name: The bucket
+    :param index_key: object key of the KGE Archive index snapshot
+    :return: KGE Archive index (empty if the index snapshot is missing or unreadable)
+    """
+    index_text = load_s3_text_file(bucket_name=bucket_name, object_name=index_key)
+    if not index_text:
+        return dict()
+    try:
+        index = json.loads(index_text)
+    except json.JSONDecodeError as jde:
+        logger.warning(f"load_archive_index(): ignoring corrupt KGE Archive index '{index_key}': {str(jde)}")
+        return dict()
+    if index.get('version') != _ARCHIVE_INDEX_VERSION:
+        return dict()
+    return index
+
+
+def save_archive_index(index: Dict, bucket_name: str, index_key: str = default_archive_index_key):
+    """
+    Persists a snapshot of the KGE Archive index to S3.
+
+    :param index: KGE Archive index, i.e. the ETags of all the KGE Archive objects, by object key ('entries'),
+                  plus the ETag and text of the provider and file set metadata files, by object key ('metadata')
+    :param bucket_name: The bucket
+    :param index_key: object key of the KGE Archive index snapshot
+    """
+    index['version'] = _ARCHIVE_INDEX_VERSION
+    index['timestamp'] = get_default_date_stamp()
+    try:
+        s3_client().put_object(
+            Bucket=bucket_name,
+            Key=index_key,
+            Body=json.dumps(index).encode('utf-8'),
+            ContentType='application/json'
+        )
+    except Exception as e:
+        logger.error(f"save_archive_index(): could not save KGE Archive index '{index_key}': {str(e)}")
+
+
+def refresh_archive_index(
+        bucket_name: str,
+        archive_entries: Dict[str, str],
+        index_key: str = default_archive_index_key,
+        use_index: bool = True
+) -> Dict[str, str]:
+    """
+    Incrementally refreshes the KGE Archive index, given a current listing of the archive:
+    provider and file set metadata files which are new, or whose ETag differs from the one
+    recorded in the persisted index snapshot, are reloaded from S3; metadata files
+    no longer present in the archive are dropped. The index snapshot, which also records
+    the listing itself, is only saved back to S3 if something changed.
+
+    :param bucket_name: The bucket
+    :param archive_entries: dictionary of KGE Archive object keys with their current ETags
+    :param index_key: object key of the KGE Archive index snapshot
+    :param use_index: if False, all metadata files are loaded directly from S3 and the index is not updated
+    :return: dictionary of metadata file text blobs, indexed by their object key
+    """
+    index: Dict = load_archive_index(bucket_name, index_key) if use_index else {}
+    cached_entries: Dict[str, Dict[str, str]] = index.get('metadata', {})
+
+    metadata: Dict[str, Dict[str, str]] = dict()
+    stale_keys: List[str] = list()
+    for object_key, etag in archive_entries.items():
+        if not _is_archive_metadata_key(object_key):
+            continue
+        entry = cached_entries.get(object_key)
+        if entry and entry.get('etag') == etag and entry.get('text') is not None:
+            metadata[object_key] = entry
+        else:
+            stale_keys.append(object_key)
+
+    from_index = len(metadata)
+    for object_key, text in load_s3_text_files(bucket_name, stale_keys).items():
+        if text is not None:
+            metadata[object_key] = {'etag': archive_entries[object_key], 'text': text}
+
+    logger.debug(
+        f"refresh_archive_index(): {from_index} metadata files " +
+        f"from index, {len(stale_keys)} reloaded from S3"
+    )
+
+    if use_index and (
+            stale_keys or len(metadata) != len(cached_entries) or index.get('entries') != archive_entries
+    ):
+        save_archive_index({'entries': archive_entries, 'metadata': metadata}, bucket_name, index_key)
+
+    return {object_key: entry['text'] for object_key, entry in metadata.items()}
+
+
+def get_archive_contents(bucket_name: str, use_index: bool = True) -> \
         Dict[
             str,  # kg_id's of every KGE archived knowledge graph
             Dict[
@@ -1157,11 +2403,58 @@ def get_archive_contents(bucket_name: str) -> \
     Get contents of KGE Archive from the
     AWS S3 bucket folder names and metadata file contents.
 
+    The provider and file set metadata file blobs are taken from the persisted
+    KGE Archive index, such that only those metadata files which are new or
+    whose ETag has changed since the last snapshot, are (re-)loaded from S3.
+    The archive itself is listed, hence this is O(number of archive objects):
+    see load_archive_contents() for the contents of the last snapshot.
+
     :param bucket_name: The bucket
+    :param use_index: (optional) set to False to ignore (and not update) the persisted KGE Archive index
     :return: multi-level catalog of KGE knowledge graphs and associated versioned file sets from S3 storage
     """
-    all_object_keys = object_keys_in_location(bucket=bucket_name)
+    archive_entries: Dict[str, str] = \
+        object_etags_in_location(
+            bucket=bucket_name,
+            object_location=f"{default_s3_root_key}/"
+        )
+
+    metadata_blobs: Dict[str, str] = \
+        refresh_archive_index(
+            bucket_name=bucket_name,
+            archive_entries=archive_entries,
+            use_index=use_index
+        )
+
+    return _archive_contents(archive_entries, metadata_blobs)
+
+
+def load_archive_contents(bucket_name: str, index_key: str = default_archive_index_key) -> Optional[Dict]:
+    """
+    Get contents of KGE Archive, as recorded by the last persisted KGE Archive index snapshot,
+    without listing the archive (nor loading any metadata file) from S3.
+
+    :param bucket_name: The bucket
+    :param index_key: object key of the KGE Archive index snapshot
+    :return: multi-level catalog of KGE knowledge graphs and associated versioned file sets
+             (see get_archive_contents()), None if there is no (usable) snapshot
+    """
+    index: Dict = load_archive_index(bucket_name, index_key)
+    if 'entries' not in index:
+        return None
+    metadata_blobs: Dict[str, str] = {
+        object_key: entry['text'] for object_key, entry in index.get('metadata', {}).items()
+    }
+    return _archive_contents(index['entries'], metadata_blobs)
+
 
+def _archive_contents(archive_entries: Iterable[str], metadata_blobs: Dict[str, str]) -> Dict:
+    """
+    :param archive_entries: object keys of the KGE Archive
+    :param metadata_blobs: dictionary of metadata file text blobs, indexed by their object key
+    :return: multi-level catalog of KGE knowledge graphs and associated versioned file sets
+             (see get_archive_contents())
+    """
     contents: Dict[
         str,  # kg_id's of every KGE archived knowledge graph
         Dict[
@@ -1182,7 +2475,7 @@ def get_archive_contents(bucket_name: str) -> \
         ]
     ] = dict()
 
-    for file_path in all_object_keys:
+    for file_path in archive_entries:
 
         file_part = file_path.split('/')
 
@@ -1205,15 +2498,15 @@ def get_archive_contents(bucket_name: str) -> \
             contents[kg_id] = dict()  # dictionary of kg's, indexed by kg_id
             contents[kg_id]['versions'] = dict()  # dictionary of versions, indexed by fileset_version
 
+        # ignore object keys naming the knowledge graph folder itself
+        if len(file_part) == 2:
+            continue
+
         if file_part[2] == PROVIDER_METADATA_FILE:
             # Get the provider 'kg_id' associated metadata file just stored
             # as a blob of text, for content parsing by the function caller
             # Unlike the kg_id versions, there should only be one such file?
-            contents[kg_id]['metadata'] = \
-                load_s3_text_file(
-                    bucket_name=bucket_name,
-                    object_name=file_path
-                )
+            contents[kg_id]['metadata'] = metadata_blobs.get(file_path)
             # we ignore this file in the main versioned file list
             # since it is global to the knowledge graph.  In fact,
             # sometimes, the fileset_version may not yet be properly set!
@@ -1232,11 +2525,7 @@ def get_archive_contents(bucket_name: str) -> \
                     # Get the provider 'kg_id' associated metadata file just stored
                     # as a blob of text, for content parsing by the function caller
                     # Unlike the kg_id versions, there should only be one such file?
-                    contents[kg_id]['versions'][fileset_version]['metadata'] = \
-                        load_s3_text_file(
-                            bucket_name=bucket_name,
-                            object_name=file_path
-                        )
+                    contents[kg_id]['versions'][fileset_version]['metadata'] = metadata_blobs.get(file_path)
                     continue
 
                 # simple first iteration just records the list of data file paths
@@ -1246,78 +2535,47 @@ def get_archive_contents(bucket_name: str) -> \
     return contents
 
 
-# Curl Bytes Received
-_cbr_pattern = re.compile(r"^(?P<num>\d+(\.\d+)?)(?P<mag>[KMGTP])?$", flags=re.IGNORECASE)
-_cbr_magnitude = {
-    'K': 2**10,
-    'M': 2**20,
-    'G': 2**30,
-    'T': 2**40,
-    'P': 2**50,
-}
-
-
-def _cbr(value) -> int:
-    """
-    Symbolic Curl Bytes Received string, parsed to int
-    :param value:
-    :return:
-    """
-    m = _cbr_pattern.match(value)
-    if m:
-        if m.group('mag'):
-            return round(float(m.group('num')) * _cbr_magnitude[m.group('mag').upper()])
-        else:
-            return round(float(m.group('num')))
-    else:
-        return -1
-
-
 def upload_from_link(
         bucket,
         object_key,
         source,
-        client=None,  # not used here. EC2 level aws cli used instead
+        client=None,
         callback=None
 ):
     """
     Transfers a file resource to S3 from a URL location. Note that this
     method is totally agnostic as to specific (KGX) file format and content.
 
+    This is a synchronous wrapper (i.e. for worker threads) of the asynchronous
+    kgea_stream.transfer_from_url() pipe from the URL into an S3 multipart upload.
+
     :param bucket: in S3
     :param object_key: of target S3 object
     :param source: url of resource to be uploaded to S3
     :param callback: e.g. progress monitor
-    :param client: for S3 - ignored (aws CLI used instead)
+    :param client: (optional) S3 client
     """
     # make sure we're getting a valid url
     assert(valid_url(source))
-    
+
+    # deferred import, the kgea_stream module itself depending on this module
+    from kgea.server.web_services.kgea_stream import transfer_from_url, URL_STREAM_TIMEOUT
+
+    async def _transfer():
+        async with ClientSession(timeout=URL_STREAM_TIMEOUT) as session:
+            await transfer_from_url(
+                url=source,
+                bucket=bucket,
+                object_key=object_key,
+                callback=callback,
+                session=session,
+                client=client
+            )
+
     try:
-        
-        s3_object_target = f"s3://{bucket}/{object_key}"
-        cmd = f"curl -L {source}| aws s3 cp - {s3_object_target}"
-        with Popen(
-            cmd,
-            bufsize=1,
-            universal_newlines=True,
-            stderr=PIPE,
-            shell=True
-        ).stderr as proc_stderr:
-            previous: int = 0
+        if callback:
             callback(0)
-            for line in proc_stderr:
-                # The 'line' is the full curl progress meter
-                field = line.split()
-                if not field:
-                    continue
-                current: int = _cbr(field[3])
-                if current < 0:
-                    continue
-                if previous < current:
-                    callback(current-previous)
-                    previous = current
-        
+        asyncio.run(_transfer())
     except RuntimeWarning:
         logger.warning("URL transfer cancelled by exception?")
 
@@ -1333,6 +2591,14 @@ def ec2_client(assumed_role=the_role):
     """
     return assumed_role.get_client('ec2')
 
+
+def dynamodb_client(assumed_role=the_role):
+    """
+    :param assumed_role:
+    :return: DynamoDB client (of the region of the S3 bucket)
+    """
+    return assumed_role.get_client('dynamodb', config=Config(region_name=default_s3_region))
+
 ###################################################################################################
 # Dynamic EBS provisioning steps, orchestrated by the KgeArchiver.worker() task which
 # direct calls methods using S3 and EC2 clients, plus an (steps 1.3, 1.4 plus 3.1) enhanced
@@ -3,7 +3,7 @@ Knowledge Graph Exchange Archive backend web service handlers.
 """
 from os import getenv, path
 from pathlib import Path
-from typing import Dict, Tuple, Any
+from typing import Dict, Tuple, Any, List, Optional, Set
 import logging
 
 import uuid
@@ -15,7 +15,6 @@ from .models import (
     UploadProgressToken, KgeFileSetStatusCode
 )
 from .models.kge_upload_progress_status_code import KgeUploadProgressStatusCode
-from ...aws.assume_role import AssumeRole
 
 try:
     from yaml import CLoader as Loader, CDumper as Dumper
@@ -53,6 +52,14 @@ from .kgea_session import (
     report_not_found
 )
 
+from .kgea_stream import (
+    transfer_from_url,
+    transfer_from_stream,
+    get_upload_checkpoints,
+    discard_multipart_upload,
+    cleanup_multipart_uploads
+)
+
 from .kgea_file_ops import (
     default_s3_bucket,
     create_presigned_url,
@@ -68,14 +75,17 @@ from .kgea_file_ops import (
     get_pathless_file_size,
     get_url_file_size,
     upload_file,
-    upload_from_link,
-    object_keys_in_location
+    object_keys_in_location,
+    get_archive_file_entries
 )
 
 from kgea.server.web_services.catalog import (
     KnowledgeGraphCatalog,
     KgeKnowledgeGraph,
-    KgeFileSet, KgeFileType
+    KgeFileSet, KgeFileType,
+    get_content_metadata,
+    filter_content_metadata,
+    serialize_json
 )
 
 logger = logging.getLogger(__name__)
@@ -107,23 +117,70 @@ KGX_FILE_CONTENT_TYPES = ['metadata', 'nodes', 'edges', 'archive']
 _upload_tracker = {'upload': {}}
 
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Checks an HTTP If-None-Match request header against the (current) ETag of a resource.
+
+    :param if_none_match: value of the If-None-Match header: '*' or a comma separated list of (weak or strong) ETags
+    :param etag: (quoted) ETag of the resource
+    :return: True if the ETag of the resource matches the header
+    """
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        if tag == '*' or tag == etag:
+            return True
+    return False
+
+
+def _json_payload_response(request: web.Request, body: bytes, gzip_body: bytes, etag: str) -> web.Response:
+    """
+    Response with a pre-serialized JSON payload: gzip compressed to clients accepting it,
+    or a '304 Not Modified' to clients revalidating a cached copy (i.e. by its ETag) of the payload.
+
+    :param request:
+    :param body: JSON payload
+    :param gzip_body: gzip compressed JSON payload
+    :param etag: (quoted) ETag of the JSON payload
+    :return: web.Response
+    """
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding"
+    }
+
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return web.Response(status=304, headers=headers)
+
+    if "gzip" in request.headers.get("Accept-Encoding", "").lower():
+        headers["Content-Encoding"] = "gzip"
+        body = gzip_body
+
+    return web.Response(status=200, body=body, content_type="application/json", headers=headers)
+
+
 async def get_kge_knowledge_graph_catalog(request: web.Request) -> web.Response:
     """Returns the catalog of available KGE File Sets
 
+    The (JSON) catalog is serialized once, then served from the cache of the
+    KnowledgeGraphCatalog, gzip compressed to clients accepting it, until the catalog changes.
+    Clients revalidating a cached copy of the catalog (i.e. by its ETag) receive a '304 Not Modified'.
+
     :param request:
     :type request: web.json_response
     """
-    catalog: Dict = dict()
-
     # Paranoia: can't see the catalog without being logged in a user session
     session = await get_session(request)
-    if not session.empty:
-        
-        catalog = KnowledgeGraphCatalog.catalog().get_kg_entries()
+    if session.empty:
+        # but don't need to propagate the user session to the output
+        return web.json_response(dict(), status=200)
+
+    body, gzip_body, etag = KnowledgeGraphCatalog.catalog().get_kg_entries_payload()
 
-    # but don't need to propagate the user session to the output
-    response = web.json_response(catalog, status=200)
-    return response
+    return _json_payload_response(request, body, gzip_body, etag)
 
 
 _known_licenses = {
@@ -600,6 +657,7 @@ async def _initialize_upload_token(
         
         if token not in _upload_tracker['upload']:
             _upload_tracker['upload'][token] = {
+                "upload_token": token,
                 "kg_id": kg_id,
                 "fileset_version": fileset_version,
                 "file_set_location": file_set_location,
@@ -756,6 +814,49 @@ _num_s3_threads = 16
 _s3_transfer_cfg = Config(signature_version='s3v4', max_pool_connections=_num_s3_threads)
 
 
+def _add_to_kge_file_set(tracker: Dict, content_name: str, object_key: str, file_size: int):
+    """
+    Adds a newly uploaded (or transferred) file to its KGE File Set in the Catalog.
+
+    :param tracker: upload tracker of the file
+    :param content_name: name of the file
+    :param object_key: S3 object key of the file
+    :param file_size: size of the file
+    """
+    # TODO: this sc_file_url has an expiration time associated with it. How does this impact the system?
+    #       How is this later used? Should it rather be generated "just-in-time", when it is needed?
+    try:
+        #
+        # RMB (15-Oct-2021): Deprecating long term persistence of the s3_file_url in the file set
+        #
+        # s3_file_url = create_presigned_url(object_key=object_key)
+
+        # This action adds a file to the given knowledge graph,
+        # identified by the 'kg_id', initiating or continuing a
+        # the assembly process for the 'fileset_version' KGE file set.
+        # May raise an Exception if something goes wrong.
+        #
+        # Note: aside from general file "type" (i.e. metadata, nodes, edges, archive)
+        #       this operation is agnostic as to KGX file format and content.
+        KnowledgeGraphCatalog.catalog().add_to_kge_file_set(
+            kg_id=tracker["kg_id"],
+            fileset_version=tracker["fileset_version"],
+            file_type=tracker["file_type"],
+            file_name=content_name,
+            file_size=file_size,
+            object_key=object_key
+        )
+
+    except Exception as exc:
+        exc_msg: str = "_add_to_kge_file_set(" + \
+                       "kg_id: " + tracker["kg_id"] + ", " + \
+                       "fileset_version: " + tracker["fileset_version"] + ", " + \
+                       "file_type: " + str(tracker["file_type"]) + ", " + \
+                       "object_key: " + str(object_key) + ") threw exception: " + str(exc)
+        logger.error(exc_msg)
+        raise RuntimeError(exc_msg)
+
+
 async def threaded_file_transfer(filename, tracker, transfer_function, source):
     """
 
@@ -771,8 +872,8 @@ async def threaded_file_transfer(filename, tracker, transfer_function, source):
         :return:
         """
         
-        local_role = AssumeRole()
-        client = s3_client(assumed_role=local_role, config=_s3_transfer_cfg)
+        # pooled client of the shared module AssumeRole, safe to use across threads
+        client = s3_client(config=_s3_transfer_cfg)
         
         if 'content_name' in tracker:
             content_name = tracker['content_name']
@@ -805,41 +906,114 @@ async def threaded_file_transfer(filename, tracker, transfer_function, source):
         
         # Assuming success, the new file should be
         # added to into the file set in the Catalog.
-        # TODO: this sc_file_url has an expiration time associated with it. How does this impact the system?
-        #       How is this later used? Should it rather be generated "just-in-time", when it is needed?
+        _add_to_kge_file_set(tracker, content_name, object_key, int(progress_monitor.get_file_size()))
+
+    loop = asyncio.get_event_loop()
+    loop.run_in_executor(None, threaded_upload)
+
+
+# Number of attempts at a URL transfer, each resuming from the parts completed by the previous attempts
+URL_TRANSFER_ATTEMPTS = 3
+
+# Delay (in seconds) between the attempts at a URL transfer
+URL_TRANSFER_RETRY_DELAY = 30
+
+
+def _transfer_context(tracker: Dict, content_url: str) -> Dict:
+    """
+    :return: (JSON serializable) context of a URL transfer, checkpointed with its
+             multipart upload, from which the transfer is resumed after a restart
+             (under the same upload token, hence still monitored, or cancelled, by its client)
+    """
+    return {
+        "upload_token": tracker.get("upload_token"),
+        "kg_id": tracker["kg_id"],
+        "fileset_version": tracker["fileset_version"],
+        "file_set_location": tracker["file_set_location"],
+        "kgx_file_content": tracker["kgx_file_content"],
+        "file_type": tracker["file_type"].value,
+        "content_name": tracker["content_name"],
+        "content_url": content_url
+    }
+
+
+async def url_file_transfer(tracker: Dict, content_name: str, content_url: str):
+    """
+    Transfers a file from a URL into the KGE Archive, by an asynchronous (event loop hosted)
+    pipe from the URL, read on the global KGE Archive Client Session, into an S3 multipart upload.
+    The completed parts of the upload are checkpointed: failed attempts at the transfer are
+    retried (as are transfers interrupted by a restart, see resume_url_transfers()) from them.
+
+    :param tracker: upload tracker of the file
+    :param content_name: name of the file
+    :param content_url: URL of the file
+    """
+    if 'content_name' in tracker:
+        content_name = tracker['content_name']
+    object_key = get_object_key(tracker['file_set_location'], content_name)
+    loop = asyncio.get_event_loop()
+    transferred: bool = False
+    for attempt in range(URL_TRANSFER_ATTEMPTS):
+        # progress is reported afresh by each attempt, including the resumed parts
+        progress_monitor = ProgressPercentage(filename=content_name, transfer_tracker=tracker)
         try:
-            #
-            # RMB (15-Oct-2021): Deprecating long term persistence of the s3_file_url in the file set
-            #
-            # s3_file_url = create_presigned_url(object_key=object_key)
-            
-            # This action adds a file to the given knowledge graph,
-            # identified by the 'kg_id', initiating or continuing a
-            # the assembly process for the 'fileset_version' KGE file set.
-            # May raise an Exception if something goes wrong.
-            #
-            # Note: aside from general file "type" (i.e. metadata, nodes, edges, archive)
-            #       this operation is agnostic as to KGX file format and content.
-            KnowledgeGraphCatalog.catalog().add_to_kge_file_set(
-                kg_id=tracker["kg_id"],
-                fileset_version=tracker["fileset_version"],
-                file_type=tracker["file_type"],
-                file_name=content_name,
-                file_size=int(progress_monitor.get_file_size()),
-                object_key=object_key
+            await transfer_from_url(
+                url=content_url,
+                bucket=default_s3_bucket,
+                object_key=object_key,
+                callback=progress_monitor,
+                client=s3_client(config=_s3_transfer_cfg),
+                checkpoints=get_upload_checkpoints(),
+                context=_transfer_context(tracker, content_url)
             )
-        
+            transferred = True
+            await loop.run_in_executor(
+                None, _add_to_kge_file_set, tracker, content_name, object_key, int(progress_monitor.get_file_size())
+            )
+            tracker['status'] = KgeUploadProgressStatusCode.COMPLETED
+            return
+        except RuntimeWarning:
+            # cancelled transfer (see ProgressPercentage), already aborted
+            tracker['status'] = KgeUploadProgressStatusCode.ERROR
+            return
         except Exception as exc:
-            exc_msg: str = "threaded_file_transfer(" + \
-                           "kg_id: " + tracker["kg_id"] + ", " + \
-                           "fileset_version: " + tracker["fileset_version"] + ", " + \
-                           "file_type: " + str(tracker["file_type"]) + ", " + \
-                           "object_key: " + str(object_key) + ") threw exception: " + str(exc)
-            logger.error(exc_msg)
-            raise RuntimeError(exc_msg)
+            logger.error(
+                f"url_file_transfer(kg_id: {tracker['kg_id']}, fileset_version: {tracker['fileset_version']}, " +
+                f"file_type: {str(tracker['file_type'])}) attempt {attempt + 1} threw exception: {str(exc)}"
+            )
+            # a file transferred, but not added to its KGE File Set, is not transferred again
+            if transferred or attempt + 1 == URL_TRANSFER_ATTEMPTS:
+                tracker['status'] = KgeUploadProgressStatusCode.ERROR
+                return
+            await asyncio.sleep(URL_TRANSFER_RETRY_DELAY)
 
-    loop = asyncio.get_event_loop()
-    loop.run_in_executor(None, threaded_upload)
+
+# URL transfers running in the background (referenced until done, lest they be garbage collected)
+_url_transfer_tasks: Set[asyncio.Task] = set()
+
+
+def _url_transfer_done(task: asyncio.Task):
+    """
+    Done callback of a background URL transfer task.
+    """
+    _url_transfer_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.error(f"URL transfer task threw exception: {str(task.exception())}")
+
+
+def _start_url_transfer(tracker: Dict, content_name: str, content_url: str) -> asyncio.Task:
+    """
+    Starts a URL transfer in the background, its progress being reported through its tracker.
+
+    :param tracker: upload tracker of the file
+    :param content_name: name of the file
+    :param content_url: URL of the file
+    :return: URL transfer task
+    """
+    task = asyncio.ensure_future(url_file_transfer(tracker, content_name, content_url))
+    _url_transfer_tasks.add(task)
+    task.add_done_callback(_url_transfer_done)
+    return task
 
 
 async def kge_upload_file(
@@ -894,6 +1068,91 @@ async def kge_upload_file(
         await redirect(request, LANDING_PAGE)
 
 
+async def kge_stream_upload_file(request: web.Request) -> web.Response:
+    """
+    Uploading of a specified file from a local computer, streamed from the multipart/form-data
+    request body ('uploaded_file' field) directly into an S3 multipart upload, as it arrives,
+    rather than first being spooled to a temporary file.
+
+    This handler is registered as a plain aiohttp route (see UPLOAD_FILE_STREAM), since connexion
+    reads the whole request body before calling its handlers. The upload token (and, optionally,
+    the 'file_size' for progress monitoring) is therefore given as a query parameter, not as a form field.
+    The response is only returned once the file is uploaded.
+
+    :param request: POST request, with 'upload_token' (and 'file_size') query parameters
+    :rtype: web.Response
+    """
+    logger.debug("Entering kge_stream_upload_file()")
+
+    session = await get_session(request)
+    if user_permitted(session):
+
+        upload_token: str = request.query.get('upload_token', '')
+        if upload_token not in _upload_tracker.get('upload', dict()):
+            await report_bad_request(request, f"kge_stream_upload_file(): unknown upload token '{upload_token}'?")
+
+        tracker: Dict = get_upload_tracker_details(upload_token)
+
+        # the content length of the request body is a (close) upper bound of the file size
+        file_size: str = request.query.get('file_size', '')
+        tracker['end_position'] = int(file_size) if file_size.isdigit() else (request.content_length or 0)
+
+        reader = await request.multipart()
+        field = await reader.next()
+        while field is not None and field.name != 'uploaded_file':
+            field = await reader.next()
+        if field is None:
+            await report_bad_request(request, "kge_stream_upload_file(): no 'uploaded_file' in the request?")
+
+        if 'content_name' in tracker:
+            content_name = tracker['content_name']
+        else:
+            content_name = field.filename
+        if not content_name:
+            await report_bad_request(request, "kge_stream_upload_file(): no file name for the 'uploaded_file'?")
+
+        object_key = get_object_key(tracker['file_set_location'], content_name)
+
+        tracker['status'] = KgeUploadProgressStatusCode.ONGOING
+
+        try:
+            file_size: int = await transfer_from_stream(
+                field,
+                bucket=default_s3_bucket,
+                object_key=object_key,
+                callback=ProgressPercentage(filename=content_name, transfer_tracker=tracker),
+                client=s3_client(config=_s3_transfer_cfg),
+                size_hint=tracker['end_position']
+            )
+            tracker['end_position'] = tracker['current_position'] = file_size
+
+            await asyncio.get_event_loop().run_in_executor(
+                None, _add_to_kge_file_set, tracker, content_name, object_key, file_size
+            )
+        except RuntimeWarning:
+            # cancelled upload (see ProgressPercentage), already aborted
+            tracker['status'] = KgeUploadProgressStatusCode.ERROR
+            raise web.HTTPBadRequest(reason=f"Upload of '{content_name}' cancelled")
+        except Exception as exc:
+            tracker['status'] = KgeUploadProgressStatusCode.ERROR
+            logger.error(
+                f"kge_stream_upload_file(kg_id: {tracker['kg_id']}, fileset_version: {tracker['fileset_version']}, " +
+                f"file_type: {str(tracker['file_type'])}) threw exception: {str(exc)}"
+            )
+            raise web.HTTPInternalServerError(reason=f"Upload of '{content_name}' failed: {str(exc)}")
+
+        tracker['status'] = KgeUploadProgressStatusCode.COMPLETED
+
+        response = web.Response(text=str(file_size), status=200)
+
+        return await with_session(request, response)
+
+    else:
+        # If session is not active, then just a redirect
+        # directly back to unauthenticated landing page
+        await redirect(request, LANDING_PAGE)
+
+
 async def kge_transfer_from_url(
         request: web.Request,
         kg_id: str,
@@ -936,21 +1195,7 @@ async def kge_transfer_from_url(
             
         tracker['status'] = KgeUploadProgressStatusCode.ONGOING
 
-        # create a wrapper of the upload_from_link function to modify status codes
-        def _upload_from_link(*args, **kwargs):
-            try:
-                upload_from_link(*args, **kwargs)
-                tracker['status'] = KgeUploadProgressStatusCode.COMPLETED
-            except Exception as e:
-                tracker['status'] = KgeUploadProgressStatusCode.ERROR
-                raise e
-
-        await threaded_file_transfer(
-            filename=content_name,
-            tracker=tracker,
-            transfer_function=_upload_from_link,
-            source=content_url
-        )
+        _start_url_transfer(tracker, content_name, content_url)
         
         response = web.json_response(upload_token_object.to_dict())
         
@@ -976,7 +1221,87 @@ def abort_upload(upload_token: str):
         return
 
     _upload_tracker['upload'][upload_token]['active'] = False
-    
+
+
+async def discard_upload(upload_token: str):
+    """
+    Discards the (checkpointed) multipart upload of a cancelled upload or transfer, which is no longer running
+    (a running upload or transfer is aborted by itself, once it notices its cancellation).
+
+    :param upload_token:
+    """
+    tracker: Dict = _upload_tracker['upload'].get(upload_token, dict())
+    if not tracker.get('object_key') or tracker.get('status') == KgeUploadProgressStatusCode.ONGOING:
+        return
+    checkpoints = get_upload_checkpoints()
+    upload: Optional[Dict] = await asyncio.get_event_loop().run_in_executor(
+        None, checkpoints.get_upload, default_s3_bucket, tracker['object_key']
+    )
+    if upload:
+        await discard_multipart_upload(upload, checkpoints)
+
+
+def _file_set_cataloged(kg_id: str, fileset_version: str) -> bool:
+    """
+    :return: True if the KGE File Set is (still) in the Catalog
+    """
+    knowledge_graph = KnowledgeGraphCatalog.catalog().get_knowledge_graph(kg_id)
+    return bool(knowledge_graph and knowledge_graph.get_file_set(fileset_version=fileset_version))
+
+
+async def resume_url_transfers(app=None):
+    """
+    Aborts the orphaned multipart uploads of the KGE Archive, then resumes the
+    (checkpointed) URL transfers interrupted by a previous shutdown of the service,
+    under their original upload tokens. The transfers to KGE File Sets no longer
+    in the Catalog (e.g. unpublished file sets not reloaded after the restart) are
+    discarded instead, since their files could not be added to them.
+
+    Only URL transfers are resumed: streamed (browser) uploads are not checkpointed
+    (see transfer_from_stream()), hence are to be uploaded again by their clients.
+
+    :param app: (optional) web application, when called as an on_startup signal handler
+    """
+    loop = asyncio.get_event_loop()
+    checkpoints = get_upload_checkpoints()
+    await cleanup_multipart_uploads(default_s3_bucket, checkpoints=checkpoints)
+
+    uploads: List[Dict] = await loop.run_in_executor(None, checkpoints.get_uploads)
+    for upload in uploads:
+        context: Optional[Dict] = upload['context']
+        if not (context and upload['source']):
+            continue
+
+        if not await loop.run_in_executor(
+                None, _file_set_cataloged, context["kg_id"], context["fileset_version"]
+        ):
+            logger.warning(
+                f"resume_url_transfers(): KGE File Set '{context['kg_id']}' version " +
+                f"'{context['fileset_version']}' is not in the Catalog: " +
+                f"the transfer of {context['content_url']} is discarded"
+            )
+            await discard_multipart_upload(upload, checkpoints)
+            continue
+
+        token = context.get("upload_token") or str(uuid.uuid4())
+        tracker: Dict = {
+            "upload_token": token,
+            "kg_id": context["kg_id"],
+            "fileset_version": context["fileset_version"],
+            "file_set_location": context["file_set_location"],
+            "object_key": upload['object_key'],
+            "kgx_file_content": context["kgx_file_content"],
+            "file_type": KgeFileType(context["file_type"]),
+            "content_name": context["content_name"],
+            "active": True,
+            "end_position": await loop.run_in_executor(None, get_url_file_size, context["content_url"]),
+            "status": KgeUploadProgressStatusCode.ONGOING
+        }
+        _upload_tracker['upload'][token] = tracker
+
+        logger.info(f"resume_url_transfers(): resuming the transfer of {context['content_url']} (token '{token}')")
+        _start_url_transfer(tracker, context["content_name"], context["content_url"])
+
 
 async def cancel_kge_upload(request: web.Request, upload_token):
     """Cancel uploading of a specific file of a KGE File Set.
@@ -1002,6 +1327,9 @@ async def cancel_kge_upload(request: web.Request, upload_token):
         logger.info(f"cancel_kge_upload() called for upload token '{upload_token}'")
         
         abort_upload(upload_token)
+
+        # discard the parts uploaded by a (cancelled) interrupted transfer
+        await discard_upload(upload_token)
         
         # Standard success response for upload file
         # operation deletion, without any returned content
@@ -1105,9 +1433,20 @@ async def get_kge_file_set_metadata(request: web.Request, kg_id: str, fileset_ve
         await redirect(request, LANDING_PAGE)
 
 
-async def kge_meta_knowledge_graph(request: web.Request, kg_id: str, fileset_version: str, downloading: bool = True):
+async def kge_meta_knowledge_graph(
+        request: web.Request,
+        kg_id: str,
+        fileset_version: str,
+        downloading: bool = True,
+        inline: bool = False,
+        category: Optional[str] = None,
+        predicate: Optional[str] = None
+):
     """Get supported relationships by source and target
 
+    If 'inline' is set, the (cached) content metadata JSON is returned directly,
+    optionally filtered by node categories and/or edge predicates.
+
     :param request:
     :type request: web.Request
     :param kg_id: KGE File Set identifier for the knowledge graph for which graph metadata is being accessed.
@@ -1116,6 +1455,12 @@ async def kge_meta_knowledge_graph(request: web.Request, kg_id: str, fileset_ver
     :type fileset_version: str
     :param downloading: flag set 'True' if file downloading in progress.
     :type downloading: bool
+    :param inline: flag set 'True' if the content metadata JSON is to be returned directly.
+    :type inline: bool
+    :param category: (optional) comma separated list of the node categories (and their edges) returned inline.
+    :type category: str
+    :param predicate: (optional) comma separated list of the edge predicates returned inline.
+    :type predicate: str
 
     :rtype: web.Response( Dict[str, Dict[str, List[str]]] )
     """
@@ -1143,7 +1488,40 @@ async def kge_meta_knowledge_graph(request: web.Request, kg_id: str, fileset_ver
         file_set_location, assigned_version = with_version(func=get_object_location, version=fileset_version)(kg_id)
 
         content_metadata_file_key = file_set_location + CONTENT_METADATA_FILE
-        
+
+        if inline:
+            # cache misses load the content metadata from S3, off the event loop: preferably
+            # the content metadata computed from the data while archiving, else the submitted one
+            loop = asyncio.get_event_loop()
+            content_metadata = await loop.run_in_executor(
+                None, get_content_metadata,
+                kg_id, assigned_version, f"{file_set_location}archive/{CONTENT_METADATA_FILE}"
+            )
+            if not content_metadata:
+                content_metadata = await loop.run_in_executor(
+                    None, get_content_metadata, kg_id, assigned_version, content_metadata_file_key
+                )
+            if not content_metadata:
+                await report_not_found(
+                    request,
+                    "kge_meta_knowledge_graph(): content metadata of KGE File Set version " +
+                    f"'{fileset_version}' of knowledge graph '{kg_id}' is unavailable?",
+                    active_session=True
+                )
+
+            categories = [c.strip() for c in category.split(',') if c.strip()] if category else None
+            predicates = [p.strip() for p in predicate.split(',') if p.strip()] if predicate else None
+            if categories or predicates:
+                body, gzip_body, etag = serialize_json(
+                    filter_content_metadata(content_metadata["metadata"], categories, predicates)
+                )
+            else:
+                body, gzip_body, etag = \
+                    content_metadata["body"], content_metadata["gzip"], content_metadata["etag"]
+
+            response = _json_payload_response(request, body, gzip_body, etag)
+            return await with_session(request, response)
+
         if not object_key_exists(object_key=content_metadata_file_key):
             if downloading:
                 await redirect(
@@ -1206,7 +1584,7 @@ async def download_kge_file_set_archive(request: web.Request, kg_id, fileset_ver
 
         kg_files_for_version = object_keys_in_location(
             default_s3_bucket,
-            file_set_object_key
+            f"{file_set_object_key}archive/"
         )
 
         maybe_archive = [
@@ -1261,7 +1639,8 @@ async def download_kge_file_set_archive_sha1hash(request: web.Request, kg_id: st
             object_keys_for_fileset_version(
                 kg_id=kg_id,
                 fileset_version=fileset_version,
-                match_function=lambda x: "sha1.txt" in x
+                match_function=lambda x: "sha1.txt" in x,
+                object_subfolder="manifest/"
             )
 
         sha1hash_file_key: str = ''
@@ -1283,3 +1662,111 @@ async def download_kge_file_set_archive_sha1hash(request: web.Request, kg_id: st
         # If session is not active, then just a redirect
         # directly back to unauthenticated landing page
         await redirect(request, LANDING_PAGE)
+
+
+async def get_kge_file_set_files(request: web.Request, kg_id: str, fileset_version: str) -> web.Response:
+    """Lists the individually downloadable files of the archive of a KGE File Set.
+
+    :param request:
+    :type request: web.Request
+    :param kg_id: Identifier of the knowledge graph of the KGE File Set a file set version for which is being accessed.
+    :type kg_id: str
+    :param fileset_version: Version of file set of the knowledge graph being accessed.
+    :type fileset_version: str
+
+    :return: list of the 'file_name', 'size', 'etag', 'sha1' and signed download 'url' of each file
+    """
+    if not (kg_id and fileset_version):
+        await report_not_found(
+            request,
+            "get_kge_file_set_files(): KGE File Set 'kg_id' has value " + str(kg_id) +
+            " and 'fileset_version' has value " + str(fileset_version) + "... both must be non-null."
+        )
+
+    logger.debug(f"Entering get_kge_file_set_files(kg_id: '{kg_id}', fileset_version: '{fileset_version}')")
+
+    session = await get_session(request)
+    if not session.empty:
+
+        file_entries: List[Dict[str, Any]] = await asyncio.get_running_loop().run_in_executor(
+            None, get_archive_file_entries, kg_id, fileset_version
+        )
+
+        if not file_entries:
+            await report_not_found(
+                request,
+                f"get_kge_file_set_files(): archive not (yet) available for {kg_id}.{fileset_version}",
+                active_session=True
+            )
+
+        files = [
+            {
+                'file_name': entry['file_name'],
+                'size': entry['size'],
+                'etag': entry['etag'],
+                'sha1': entry['sha1'],
+                # S3 signed URLs honour HTTP Range requests, for resumable and parallel downloads
+                'url': create_presigned_url(object_key=entry['object_key'])
+            }
+            for entry in file_entries
+        ]
+
+        response = web.json_response(files, status=200)
+        return await with_session(request, response)
+
+    else:
+        # If session is not active, then just a redirect
+        # directly back to unauthenticated landing page
+        await redirect(request, LANDING_PAGE)
+
+
+async def download_kge_file_set_file(request: web.Request, kg_id: str, fileset_version: str, file_name: str):
+    """Returns a single file of the archive of a KGE File Set.
+
+    :param request:
+    :type request: web.Request
+    :param kg_id: Identifier of the knowledge graph of the KGE File Set a file set version for which is being accessed.
+    :type kg_id: str
+    :param fileset_version: Version of file set of the knowledge graph being accessed.
+    :type fileset_version: str
+    :param file_name: Name of a file of the KGE File Set archive (e.g. 'nodes.tsv')
+    :type file_name: str
+
+    :return: None - redirection responses triggered
+    """
+    if not (kg_id and fileset_version and file_name) or '/' in file_name:
+        await report_not_found(
+            request,
+            "download_kge_file_set_file(): KGE File Set 'kg_id' has value " + str(kg_id) +
+            ", 'fileset_version' has value " + str(fileset_version) +
+            " and 'file_name' has value " + str(file_name) + "... all must be non-null (and simple file names)."
+        )
+
+    logger.debug(
+        f"Entering download_kge_file_set_file(kg_id: '{kg_id}', " +
+        f"fileset_version: '{fileset_version}', file_name: '{file_name}')"
+    )
+
+    session = await get_session(request)
+    if not session.empty:
+
+        file_set_object_key, _ = with_version(get_object_location, fileset_version)(kg_id)
+        file_object_key = f"{file_set_object_key}archive/{file_name}"
+
+        if not object_key_exists(object_key=file_object_key):
+            await report_not_found(
+                request,
+                f"download_kge_file_set_file(): file '{file_name}' not available for {kg_id}.{fileset_version}"
+            )
+
+        # The client follows the redirection with its original (HTTP Range) request
+        # headers, which the signed S3 URL honours with partial (206) content responses
+        download_url = create_presigned_url(object_key=file_object_key)
+        logger.debug(f"download_kge_file_set_file() download_url: '{download_url}'")
+
+        await download(request, download_url)
+
+    else:
+        # If session is not active, then just a redirect
+        # directly back to unauthenticated landing page
+        await redirect(request, LANDING_PAGE)
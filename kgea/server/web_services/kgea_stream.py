@@ -2,29 +2,44 @@
 KGE Archive data file streaming.
 """
 from os import getenv
-from typing import List, Dict
+from typing import Dict, Optional, Callable, Set, Tuple
+from hashlib import md5
+import time
 
 import logging
 
-from aiohttp import web
+from aiohttp import web, ClientSession, ClientTimeout, ClientPayloadError
+from aiohttp import ClientError as AiohttpClientError
 import smart_open
 
 from asyncio import (
     ensure_future,
-    wait
+    wait,
+    gather,
+    sleep,
+    wait_for,
+    Task,
+    Semaphore,
+    IncompleteReadError,
+    CancelledError,
+    get_running_loop
 )
 from collections.abc import AsyncIterable
 
-import boto3
 from botocore.exceptions import ClientError
 
+from kgea.config import get_app_config
+
 from .kgea_file_ops import (
+    default_s3_bucket,
     get_object_location,
     object_keys_in_location,
-    with_version
+    with_version,
+    invalidate_object_keys
 )
 
 from kgea.server.web_services.kgea_file_ops import s3_client
+from kgea.server.web_services.upload_checkpoints import UploadCheckpoints
 
 
 from .kgea_session import KgeaSession
@@ -45,6 +60,40 @@ S3_CHUNK_SIZE = 8 * MB  # MPU threshold 8 MB at a time for production AWS transf
 
 URL_TRANSFER_TIMEOUT = 300   # default timeout, in seconds
 
+# Opaquely access the configuration dictionary
+_KGEA_APP_CONFIG = get_app_config()
+
+# Maximum number of multipart upload parts being uploaded (hence held in memory) concurrently, per transfer
+Upload_Part_Window = \
+    _KGEA_APP_CONFIG['Upload_Part_Window'] if 'Upload_Part_Window' in _KGEA_APP_CONFIG else 4
+
+# Age (in seconds) after which unfinished multipart uploads, which may not (or no longer) be resumed, are aborted
+ORPHANED_UPLOAD_AGE = 86400
+
+# Maximum number of parts of an S3 multipart upload
+MAX_UPLOAD_PARTS = 10000
+
+# Maximum size (in bytes) of a part of an S3 multipart upload
+MAX_UPLOAD_PART_SIZE = 5 * KB * MB
+
+# Number of parts of a data stream of unknown size, after which its part size is doubled (see grown_part_size())
+PART_SIZE_GROWTH_INTERVAL = 1000
+
+# Timeouts (in seconds) of the connection to a URL source, and of each read of its data. The transfer of
+# a URL resource as a whole is not time limited (unlike with the 5 minutes default of the client session).
+URL_CONNECT_TIMEOUT = 60
+URL_READ_TIMEOUT = 300
+URL_STREAM_TIMEOUT = ClientTimeout(total=None, sock_connect=URL_CONNECT_TIMEOUT, sock_read=URL_READ_TIMEOUT)
+
+# Number of attempts at uploading each multipart upload part
+UPLOAD_PART_ATTEMPTS = 3
+
+# Delay (in seconds) before the first retry of a failed part upload, doubled at each further retry
+UPLOAD_PART_RETRY_DELAY = 1.0
+
+# Size (in bytes) of the reads of an incoming data stream (see transfer_from_stream())
+STREAM_READ_SIZE = 1 * MB
+
 # TEST_FILE_URL = "https://raw.githubusercontent.com/NCATSTranslator/" + \
 #                 "Knowledge_Graph_Exchange_Registry/master/LICENSE"
 TEST_FILE_URL = 'https://archive.monarchinitiative.org/202012/kgx/sri-reference-kg_edges.tsv.gz'
@@ -57,27 +106,56 @@ TEST_BUCKET = 'kgea-test-bucket'
 TEST_KG_NAME = 'test_kg'
 
 
-# TODO: Perhaps need to manage the aiohttp sessions globally in the application?
+def grown_part_size(part_number: int, part_size: int) -> int:
+    """
+    :param part_number: number of a part (from 1) of a multipart upload of a data stream of unknown size
+    :param part_size: size (in bytes) of the first parts
+    :return: size of the part, doubled every PART_SIZE_GROWTH_INTERVAL parts (up to MAX_UPLOAD_PART_SIZE),
+             such that e.g. up to 8 terabytes fit in MAX_UPLOAD_PARTS parts of initially 8 megabytes
+    """
+    return min(part_size << ((part_number - 1) // PART_SIZE_GROWTH_INTERVAL), MAX_UPLOAD_PART_SIZE)
+
+
 # See https://docs.aiohttp.org/en/stable/client_quickstart.html#make-a-request
-async def stream_from_url(url) -> AsyncIterable:
+async def stream_from_url(
+        url: str,
+        chunk_size: int = S3_CHUNK_SIZE,
+        session: Optional[ClientSession] = None,
+        grow: bool = False
+) -> AsyncIterable:
     """
-    Streaming of data from URL endpoint.
+    Streaming of data from URL endpoint, in fixed size chunks. Only the connection
+    and each read are time limited (see URL_STREAM_TIMEOUT), not the whole stream.
 
     :param url: URL endpoint source of data
     :type url: str
+    :param chunk_size: size (in bytes) of the chunks (but the last one, which may be shorter)
+    :type chunk_size: int
+    :param session: (optional) client session, by default the global KGE Archive Client Session
+    :type session: ClientSession
+    :param grow: if True, the chunk size grows with the number of chunks, as per grown_part_size()
+    :type grow: bool
 
     :yield: chunk of data
-    :rtype: str
+    :rtype: bytes
     """
-    async with KgeaSession.get_global_session().get(
-            url
-            # chunked=True,
-            # read_bufsize=S3_CHUNK_SIZE
-    ) as resp:
-        data = await resp.content.read()
-    # async with KgeaSession.get_global_session().get(url, chunked=True) as resp:
-    #     data = await resp.content.read(S3_CHUNK_SIZE)
-    #     yield data
+    if not session:
+        session = KgeaSession.get_global_session()
+    async with session.get(url, timeout=URL_STREAM_TIMEOUT) as resp:
+        resp.raise_for_status()
+        chunk_number = 0
+        while True:
+            chunk_number += 1
+            try:
+                data = await resp.content.readexactly(
+                    grown_part_size(chunk_number, chunk_size) if grow else chunk_size
+                )
+            except IncompleteReadError as ire:
+                # end of the data stream
+                if ire.partial:
+                    yield ire.partial
+                return
+            yield data
 
 
 async def stream_from_url2(url):
@@ -158,27 +236,600 @@ def test_data_stream_from_url(test_url):
     return True
 
 
-async def _mpu_transfer_from_url(mpu, url: str) -> List[Dict]:
+_the_upload_checkpoints: Optional[UploadCheckpoints] = None
+
+
+def get_upload_checkpoints() -> UploadCheckpoints:
+    """
+    :return: singleton UploadCheckpoints of the multipart uploads of this service
+    """
+    global _the_upload_checkpoints
+    if not _the_upload_checkpoints:
+        _the_upload_checkpoints = UploadCheckpoints()
+    return _the_upload_checkpoints
+
+
+class S3MultipartUpload:
+    """
+    AWS S3 Multi-part Upload of a sequence of data chunks, uploaded as parts, concurrently,
+    within a bounded window: the submission of a part waits while 'window' parts are being
+    uploaded, hence at most 'window' parts are held in memory. Each part upload is retried,
+    with exponential back off, up to UPLOAD_PART_ATTEMPTS times.
+
+    With (durable) checkpoints, the UploadId and the ETags of the completed parts are recorded,
+    such that an interrupted upload of the same source to the same target is resumed, its
+    completed parts (as listed by S3) being skipped, rather than uploaded again.
+    """
+    def __init__(
+            self,
+            bucket: str,
+            object_key: str,
+            window: int = Upload_Part_Window,
+            callback: Optional[Callable[[int], None]] = None,
+            client=None,
+            checkpoints: Optional[UploadCheckpoints] = None,
+            source: Optional[str] = None,
+            part_size: int = S3_CHUNK_SIZE,
+            context: Optional[Dict] = None
+    ):
+        """
+        :param bucket: target S3 bucket
+        :param object_key: target S3 object key
+        :param window: maximum number of parts being uploaded concurrently
+        :param callback: (optional) called with the size of each uploaded part, e.g. progress monitor
+        :param client: (optional) S3 client
+        :param checkpoints: (optional) checkpoints of the multipart uploads
+        :param source: (optional) URL of the uploaded data, if the upload may be resumed from it
+        :param part_size: size (in bytes) of the parts of the upload (but the last one)
+        :param context: (optional, JSON serializable) application context of the upload, checkpointed with it
+        """
+        self.bucket = bucket
+        self.object_key = object_key
+        self.callback = callback
+        self.client = client if client else s3_client()
+        self.checkpoints = checkpoints
+        self.source = source
+        self.part_size = part_size
+        self.context = context
+
+        self.upload_id: Optional[str] = None
+        self.parts: Dict[int, str] = dict()
+        self.size: int = 0
+
+        # completed parts of a resumed upload: ETag and size, by part number
+        self.resumed_parts: Dict[int, Tuple[str, int]] = dict()
+
+        self._part_number: int = 0
+        self._window = Semaphore(window)
+        self._tasks: Set[Task] = set()
+        self._failure: Optional[BaseException] = None
+
+    async def _run(self, func, **kwargs):
+        return await get_running_loop().run_in_executor(None, lambda: func(**kwargs))
+
+    async def _list_parts(self, upload_id: str) -> Dict[int, Tuple[str, int]]:
+        parts: Dict[int, Tuple[str, int]] = dict()
+        marker = 0
+        while True:
+            response = await self._run(
+                self.client.list_parts,
+                Bucket=self.bucket, Key=self.object_key, UploadId=upload_id, PartNumberMarker=marker
+            )
+            for part in response.get('Parts', []):
+                parts[part['PartNumber']] = (part['ETag'], part['Size'])
+            if not response.get('IsTruncated'):
+                return parts
+            marker = response['NextPartNumberMarker']
+
+    async def _resume(self) -> bool:
+        upload: Optional[Dict] = await self._run(
+            self.checkpoints.get_upload, bucket=self.bucket, object_key=self.object_key
+        )
+        if not upload:
+            return False
+
+        if self.source and upload['source'] == self.source and upload['part_size'] == self.part_size:
+            try:
+                listed_parts = await self._list_parts(upload['upload_id'])
+                checkpointed_parts = await self._run(self.checkpoints.get_parts, upload_id=upload['upload_id'])
+                self.upload_id = upload['upload_id']
+                # only the checkpointed parts still held by S3 are deemed completed
+                self.resumed_parts = {
+                    part_number: part for part_number, part in listed_parts.items()
+                    if checkpointed_parts.get(part_number) == part
+                }
+                logger.info(
+                    f"S3MultipartUpload: resuming the upload of '{self.object_key}' " +
+                    f"from {len(self.resumed_parts)} completed parts"
+                )
+                return True
+            except ClientError as ce:
+                logger.warning(f"S3MultipartUpload: upload of '{self.object_key}' can't be resumed: {str(ce)}")
+
+        # a stale upload to the same target is discarded
+        await discard_multipart_upload(upload, self.checkpoints, self.client)
+        return False
+
+    async def start(self):
+        """
+        Initiates the multipart upload, or resumes an interrupted (checkpointed) upload of the same source.
+        """
+        if self.checkpoints and await self._resume():
+            return
+        response = await self._run(self.client.create_multipart_upload, Bucket=self.bucket, Key=self.object_key)
+        self.upload_id = response['UploadId']
+        if self.checkpoints:
+            await self._run(
+                self.checkpoints.start,
+                bucket=self.bucket, object_key=self.object_key, upload_id=self.upload_id,
+                part_size=self.part_size, source=self.source, context=self.context
+            )
+        logger.debug(f"S3MultipartUpload.start(): '{self.object_key}' upload id '{self.upload_id}'")
+
+    def skip_part(self, part_number: int, size: int, data: Optional[bytes] = None) -> bool:
+        """
+        Checks whether a part was already completed, before the upload was resumed
+        (if so, the part is reported as uploaded).
+
+        :param part_number: number of the part
+        :param size: size (in bytes) of the part
+        :param data: (optional) data of the part, then checked against the ETag (MD5 hash) of the completed part
+        :return: True if the part was already completed, hence need not be uploaded
+        """
+        if part_number not in self.resumed_parts:
+            return False
+        etag, resumed_size = self.resumed_parts.pop(part_number)
+        if resumed_size != size or (data is not None and md5(data).hexdigest() != etag.strip('"')):
+            return False
+        self.parts[part_number] = etag
+        self._part_number = max(self._part_number, part_number)
+        if self.callback:
+            self.callback(size)
+        return True
+
+    async def upload_part(self, part_number: int, data: bytes):
+        """
+        Uploads a given part of the upload, retrying on failure.
+        (The part is uploaded directly, regardless of the window of put() parts).
+
+        :param part_number: number of the part (from 1 to 10000)
+        :param data: part data (at least 5 megabytes, except for the last part)
+        """
+        for attempt in range(UPLOAD_PART_ATTEMPTS):
+            try:
+                response = await self._run(
+                    self.client.upload_part,
+                    Bucket=self.bucket, Key=self.object_key, UploadId=self.upload_id,
+                    PartNumber=part_number, Body=data
+                )
+                break
+            except ClientError as ce:
+                if attempt + 1 == UPLOAD_PART_ATTEMPTS:
+                    raise ce
+                logger.warning(
+                    f"S3MultipartUpload: upload of part {part_number} of '{self.object_key}' " +
+                    f"failed (attempt {attempt + 1}): {str(ce)}... retrying"
+                )
+                await sleep(UPLOAD_PART_RETRY_DELAY * 2**attempt)
+        self.parts[part_number] = response['ETag']
+        self._part_number = max(self._part_number, part_number)
+        if self.checkpoints:
+            await self._run(
+                self.checkpoints.record_part,
+                upload_id=self.upload_id, part_number=part_number, etag=response['ETag'], size=len(data)
+            )
+        if self.callback:
+            self.callback(len(data))
+
+    async def _upload_part(self, part_number: int, data: bytes):
+        try:
+            await self.upload_part(part_number, data)
+        except BaseException as exc:
+            if not self._failure:
+                self._failure = exc
+        finally:
+            self._window.release()
+
+    async def put(self, data: bytes):
+        """
+        Submits the next part of the upload, waiting while the window of parts being uploaded is full.
+
+        :param data: part data (at least 5 megabytes, except for the last part)
+        :raises: the exception of any failed part upload
+        """
+        await self._window.acquire()
+        if self._failure:
+            self._window.release()
+            raise self._failure
+        if self._part_number >= MAX_UPLOAD_PARTS:
+            self._window.release()
+            raise RuntimeError(
+                f"S3MultipartUpload: upload of '{self.object_key}' exceeds {MAX_UPLOAD_PARTS} parts " +
+                f"(of {self.part_size} bytes)"
+            )
+        self._part_number += 1
+        self.size += len(data)
+        if self.skip_part(self._part_number, len(data), data):
+            self._window.release()
+            return
+        task = ensure_future(self._upload_part(self._part_number, data))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def complete(self):
+        """
+        Completes the multipart upload, once all its parts are uploaded.
+
+        :raises: the exception of any failed part upload
+        """
+        if self._tasks:
+            await gather(*self._tasks)
+        if self._failure:
+            raise self._failure
+        if not self.parts:
+            # an empty upload is completed with a single, empty part
+            await self.put(b'')
+            await gather(*self._tasks)
+            if self._failure:
+                raise self._failure
+        await self._run(
+            self.client.complete_multipart_upload,
+            Bucket=self.bucket, Key=self.object_key, UploadId=self.upload_id,
+            MultipartUpload={
+                "Parts": [
+                    {"PartNumber": part_number, "ETag": self.parts[part_number]}
+                    for part_number in sorted(self.parts) if part_number <= self._part_number
+                ]
+            }
+        )
+        if self.checkpoints:
+            await self._run(self.checkpoints.finish, upload_id=self.upload_id)
+        invalidate_object_keys(self.object_key, self.bucket)
+        logger.debug(f"S3MultipartUpload.complete(): '{self.object_key}' of {self.size} bytes uploaded")
+
+    async def suspend(self):
+        """
+        Stops the multipart upload, keeping its completed (checkpointed) parts, for a later resumption.
+        """
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await gather(*self._tasks, return_exceptions=True)
+
+    async def abort(self):
+        """
+        Aborts the multipart upload, discarding its uploaded parts.
+        """
+        await self.suspend()
+        if self.upload_id:
+            await discard_multipart_upload(
+                {"bucket": self.bucket, "object_key": self.object_key, "upload_id": self.upload_id},
+                self.checkpoints, self.client
+            )
+
+
+async def discard_multipart_upload(upload: Dict, checkpoints: Optional[UploadCheckpoints] = None, client=None):
+    """
+    Aborts a multipart upload (discarding its uploaded parts) and its checkpoints.
+
+    :param upload: dictionary of the 'bucket', 'object_key' and 'upload_id' of the multipart upload
+    :param checkpoints: (optional) checkpoints of the multipart uploads
+    :param client: (optional) S3 client
+    """
+    if not client:
+        client = s3_client()
+    loop = get_running_loop()
+    try:
+        await loop.run_in_executor(
+            None, lambda: client.abort_multipart_upload(
+                Bucket=upload['bucket'], Key=upload['object_key'], UploadId=upload['upload_id']
+            )
+        )
+        logger.debug(f"discard_multipart_upload(): upload '{upload['upload_id']}' of '{upload['object_key']}' aborted")
+    except ClientError as ce:
+        if ce.response.get('Error', {}).get('Code') != 'NoSuchUpload':
+            logger.error(f"discard_multipart_upload(): '{upload['object_key']}' upload not aborted? {str(ce)}")
+    if checkpoints:
+        await loop.run_in_executor(None, checkpoints.finish, upload['upload_id'])
+
+
+async def cleanup_multipart_uploads(
+        bucket: str = default_s3_bucket,
+        prefix: str = "",
+        max_age: float = ORPHANED_UPLOAD_AGE,
+        checkpoints: Optional[UploadCheckpoints] = None,
+        client=None
+) -> int:
+    """
+    Aborts the orphaned multipart uploads of a bucket (location), i.e. those initiated more than max_age
+    seconds ago, unless they are checkpointed, hence may still be resumed (from a URL source), and
+    recently active. Checkpointed uploads without a URL source, which may not be resumed, are also aborted.
+
+    :param bucket: S3 bucket
+    :param prefix: (optional) object key prefix of the location of the uploads
+    :param max_age: age (in seconds) after which an upload is deemed orphaned
+    :param checkpoints: (optional) checkpoints of the multipart uploads
+    :param client: (optional) S3 client
+    :return: number of aborted uploads
+    """
+    if not client:
+        client = s3_client()
+    loop = get_running_loop()
+    now = time.time()
+    aborted = 0
+
+    resumable: Set[str] = set()
+    if checkpoints:
+        for upload in await loop.run_in_executor(None, checkpoints.get_uploads):
+            if upload['source'] and now - upload['updated'] < max_age:
+                resumable.add(upload['upload_id'])
+            elif upload['bucket'] == bucket:
+                await discard_multipart_upload(upload, checkpoints, client)
+                aborted += 1
+
+    listing: Dict[str, str] = {'Bucket': bucket, 'Prefix': prefix}
+    while True:
+        response = await loop.run_in_executor(None, lambda: client.list_multipart_uploads(**listing))
+        for upload in response.get('Uploads', []):
+            if upload['UploadId'] in resumable or now - upload['Initiated'].timestamp() < max_age:
+                continue
+            await discard_multipart_upload(
+                {"bucket": bucket, "object_key": upload['Key'], "upload_id": upload['UploadId']},
+                checkpoints, client
+            )
+            aborted += 1
+        if not response.get('IsTruncated'):
+            break
+        listing['KeyMarker'] = response['NextKeyMarker']
+        listing['UploadIdMarker'] = response['NextUploadIdMarker']
+
+    if aborted:
+        logger.info(f"cleanup_multipart_uploads(): {aborted} orphaned multipart uploads aborted")
+    return aborted
+
+
+class RangesUnsupported(RuntimeError):
+    """
+    Raised when a source URL does not honour (byte) range requests.
     """
-    Data pipe from an aiohttp URL data stream, to an AWS S3 Multi-part Upload process.
+    pass
+
+
+async def _fetch_range(session: ClientSession, url: str, start: int, end: int) -> bytes:
+    """
+    Fetches a [start, end) byte range of a URL resource, retrying on (client) failure.
+
+    :raises: RangesUnsupported if the range is not served as such (i.e. the whole resource is served)
+    """
+    for attempt in range(UPLOAD_PART_ATTEMPTS):
+        try:
+            async with session.get(
+                    url, headers={'Range': f"bytes={start}-{end - 1}"}, timeout=URL_STREAM_TIMEOUT
+            ) as resp:
+                if resp.status != 206:
+                    resp.raise_for_status()
+                    raise RangesUnsupported(f"{url} range request answered with HTTP status {resp.status}")
+                data = await resp.read()
+            if len(data) != end - start:
+                raise ClientPayloadError(f"{len(data)} bytes received, instead of {end - start}")
+            return data
+        except AiohttpClientError as ce:
+            if attempt + 1 == UPLOAD_PART_ATTEMPTS:
+                raise ce
+            logger.warning(
+                f"_fetch_range(): fetch of bytes {start}-{end - 1} of {url} " +
+                f"failed (attempt {attempt + 1}): {str(ce)}... retrying"
+            )
+            await sleep(UPLOAD_PART_RETRY_DELAY * 2**attempt)
+
+
+async def get_url_ranges_size(url: str, session: ClientSession) -> int:
+    """
+    :param url: URL of a resource
+    :param session: client session
+    :return: size (in bytes) of the URL resource, if the source advertises byte range
+             request support ('Accept-Ranges: bytes'), otherwise (or if unknown) -1
+    """
+    try:
+        async with session.head(url, allow_redirects=True) as resp:
+            if resp.status != 200 or resp.headers.get('Accept-Ranges', '').lower() != 'bytes':
+                return -1
+            return int(resp.headers.get('Content-Length', -1))
+    except (AiohttpClientError, ValueError) as exc:
+        logger.debug(f"get_url_ranges_size({url}): {str(exc)}")
+        return -1
+
+
+async def _transfer_ranges(
+        mpu: S3MultipartUpload,
+        url: str,
+        size: int,
+        part_size: int,
+        window: int,
+        session: ClientSession
+):
+    """
+    Transfers a URL resource of known size into a multipart upload, as byte ranges fetched concurrently
+    by 'window' workers, each range being uploaded as the part of the same position.
+    """
+    ranges = [(start, min(start + part_size, size)) for start in range(0, size, part_size)]
+    next_range = iter(enumerate(ranges, start=1))
+
+    async def _range_worker():
+        for part_number, (start, end) in next_range:
+            if mpu.skip_part(part_number, end - start):
+                # part completed before the transfer was resumed
+                mpu.size += end - start
+                continue
+            data = await _fetch_range(session, url, start, end)
+            await mpu.upload_part(part_number, data)
+            mpu.size += len(data)
+
+    workers = [ensure_future(_range_worker()) for _ in range(min(window, len(ranges)))]
+    try:
+        await gather(*workers)
+    except BaseException as exc:
+        for worker in workers:
+            worker.cancel()
+        await gather(*workers, return_exceptions=True)
+        raise exc
+
+
+async def _end_transfer(mpu: S3MultipartUpload, url: str, exc: BaseException):
+    """
+    Ends a failed transfer: cancelled transfers are aborted, while failed checkpointed
+    transfers are only suspended, to be resumed by a later transfer of the same URL.
+    """
+    if mpu.checkpoints and not isinstance(exc, (RuntimeWarning, CancelledError)):
+        logger.warning(
+            f"transfer_from_url({url}): transfer to '{mpu.object_key}' interrupted " +
+            f"after {len(mpu.parts)} parts (resumable): {str(exc)}"
+        )
+        await mpu.suspend()
+    else:
+        logger.warning(f"transfer_from_url({url}): transfer to '{mpu.object_key}' aborted: {str(exc)}")
+        await mpu.abort()
+
+
+async def transfer_from_url(
+        url: str,
+        bucket: str,
+        object_key: str,
+        callback: Optional[Callable[[int], None]] = None,
+        part_size: int = S3_CHUNK_SIZE,
+        window: int = Upload_Part_Window,
+        session: Optional[ClientSession] = None,
+        client=None,
+        checkpoints: Optional[UploadCheckpoints] = None,
+        context: Optional[Dict] = None
+) -> int:
+    """
+    Data pipe from an aiohttp URL data stream, to an AWS S3 Multi-part Upload: the data is read
+    in part_size chunks, uploaded concurrently, such that memory use is bounded by window * part_size.
+
+    If the source advertises byte range request support, the chunks are rather fetched
+    concurrently as distinct byte ranges (over up to 'window' connections), each mapped onto
+    the part of the same position; otherwise (or if the source then fails to honour the range
+    requests), the data is read as a single stream: if its size is unknown, its parts grow
+    (see grown_part_size()) to keep the upload within the 10000 parts limit.
+
+    With checkpoints, a failed transfer is not aborted (unless cancelled), but resumed
+    from its completed parts by the next transfer of the same URL to the same object key.
 
-    :param mpu: active Multi-Part Upload handle
     :param url: URL from which to access the (binary) data stream.
-    :return: List of Dictionary entries of PartNumbers and ETag's for uploaded MPU Parts
-    :rtype: List[Dict]
-    """
-    part_number = 0
-    parts = []
-    async for data in stream_from_url(url):
-        # there is more data, upload it as a part
-        part_number += 1
-        part = mpu.Part(part_number)
-        response = part.upload(Body=data)
-        parts.append({
-            "PartNumber": part_number,
-            "ETag": response["ETag"]
-        })
-    return parts
+    :param bucket: target S3 bucket
+    :param object_key: target S3 object key
+    :param callback: (optional) called with the size of each uploaded part, e.g. progress monitor
+    :param part_size: size (in bytes) of the parts of the upload (at least 5 megabytes)
+    :param window: maximum number of parts being uploaded concurrently
+    :param session: (optional) client session, by default the global KGE Archive Client Session
+    :param client: (optional) S3 client
+    :param checkpoints: (optional) checkpoints of the multipart uploads
+    :param context: (optional, JSON serializable) application context of the transfer, checkpointed with it
+    :return: number of bytes transferred
+    """
+    if not session:
+        session = KgeaSession.get_global_session()
+
+    size = await get_url_ranges_size(url, session)
+
+    # multipart uploads are limited to 10000 parts
+    part_size = max(part_size, -(-size // MAX_UPLOAD_PARTS))
+
+    def _multipart_upload() -> S3MultipartUpload:
+        return S3MultipartUpload(
+            bucket, object_key, window=window, callback=callback, client=client,
+            checkpoints=checkpoints, source=url, part_size=part_size, context=context
+        )
+
+    if size > part_size:
+        mpu = _multipart_upload()
+        await mpu.start()
+        try:
+            await _transfer_ranges(mpu, url, size, part_size, window, session)
+            await mpu.complete()
+            return mpu.size
+        except RangesUnsupported as ru:
+            logger.warning(f"transfer_from_url({url}): {str(ru)}, falling back onto a single stream transfer")
+            if checkpoints:
+                # the completed parts are kept, for the single stream transfer to skip them
+                await mpu.suspend()
+            else:
+                await mpu.abort()
+        except BaseException as exc:
+            await _end_transfer(mpu, url, exc)
+            raise exc
+
+    mpu = _multipart_upload()
+    await mpu.start()
+    try:
+        async for data in stream_from_url(url, chunk_size=part_size, session=session, grow=size < 0):
+            await mpu.put(data)
+        await mpu.complete()
+    except BaseException as exc:
+        await _end_transfer(mpu, url, exc)
+        raise exc
+    return mpu.size
+
+
+async def transfer_from_stream(
+        stream,
+        bucket: str,
+        object_key: str,
+        callback: Optional[Callable[[int], None]] = None,
+        part_size: int = S3_CHUNK_SIZE,
+        window: int = Upload_Part_Window,
+        client=None,
+        size_hint: Optional[int] = None
+) -> int:
+    """
+    Data pipe from an incoming aiohttp data stream (e.g. the file field of a multipart/form-data
+    request body) to an AWS S3 Multi-part Upload: the chunks of the stream are gathered into
+    part_size parts, each submitted for upload as soon as it is filled. The stream is not read
+    while the window of parts being uploaded is full, so that the sender is held back to the
+    pace of the upload, and memory use is bounded by (window + 1) * part_size.
+
+    The upload can't be resumed from such a stream, hence it is aborted on failure.
+
+    :param stream: source of the data, with a 'read_chunk(size)' coroutine method returning b'' at its end
+    :param bucket: target S3 bucket
+    :param object_key: target S3 object key
+    :param callback: (optional) called with the size of each uploaded part, e.g. progress monitor
+    :param part_size: size (in bytes) of the parts of the upload (at least 5 megabytes)
+    :param window: maximum number of parts being uploaded concurrently
+    :param client: (optional) S3 client
+    :param size_hint: (optional) expected size of the data, to keep the upload within the 10000 parts limit
+                      (without it, the parts grow as per grown_part_size())
+    :return: number of bytes transferred
+    """
+    if size_hint:
+        part_size = max(part_size, -(-size_hint // MAX_UPLOAD_PARTS))
+
+    mpu = S3MultipartUpload(bucket, object_key, window=window, callback=callback, client=client, part_size=part_size)
+    await mpu.start()
+    try:
+        buffer = bytearray()
+        parts = 0
+        next_part_size = part_size
+        while True:
+            chunk = await stream.read_chunk(STREAM_READ_SIZE)
+            if not chunk:
+                break
+            buffer.extend(chunk)
+            while len(buffer) >= next_part_size:
+                await mpu.put(bytes(buffer[:next_part_size]))
+                del buffer[:next_part_size]
+                parts += 1
+                if not size_hint:
+                    next_part_size = grown_part_size(parts + 1, part_size)
+        if buffer:
+            await mpu.put(bytes(buffer))
+        await mpu.complete()
+    except BaseException as exc:
+        logger.warning(f"transfer_from_stream(): upload to '{object_key}' aborted: {str(exc)}")
+        await mpu.abort()
+        raise exc
+    return mpu.size
 
 
 # TODO: should I wrap any exceptions within this function?
@@ -200,45 +851,10 @@ def transfer_file_from_url(
 
     object_key = f"{object_location}{file_name}"
 
-    # Attempt to transfer the file from the URL
-    mpu = None
-    try:
-
-        # AWS Boto3 session should already be initialized
-        s3res = boto3.resource('s3')
-
-        target_s3obj = s3res.Object(bucket, object_key)
-
-        # initiate MultiPartUpload
-        mpu = target_s3obj.initiate_multipart_upload()
-
-        # transfer_task = ensure_future(_mpu_transfer_from_url(mpu, url))
-        # KgeaSession.get_event_loop().run_until_complete(wait_for(transfer_task, timeout=timeout))
-        
-        # MPU Parts returned as the result
-        # parts = transfer_task.result()
-
-        # logging.debug(parts)
-
-        # no more data, complete the multipart upload
-        # part_info = {"Parts": parts}
-        # mpu_result = mpu.complete(MultipartUpload=part_info)
-
-    except ClientError as ce_error:
-        if mpu:
-            # clean up failed multipart uploads?
-            response = mpu.abort()
-            # TODO: should check ListParts for empty list after abort
-            print(response)
-        raise ce_error
-    
-    except RuntimeError as rt_error:
-        if mpu:
-            # clean up failed multipart uploads?
-            response = mpu.abort()
-            # TODO: should check ListParts for empty list after abort
-            print(response)
-        raise rt_error
+    # Attempt to transfer the file from the URL (the multipart upload is aborted on failure)
+    KgeaSession.get_event_loop().run_until_complete(
+        wait_for(transfer_from_url(url, bucket, object_key), timeout=timeout)
+    )
 
     return object_key
 
@@ -0,0 +1,192 @@
+"""
+Durable (SQLite database backed) checkpoints of the S3 multipart uploads of the KGE Archive.
+
+The UploadId of each multipart upload, with the ETags of its completed parts, is recorded
+such that an interrupted upload (e.g. a failed direct URL transfer, or a restart of the
+service) may be resumed from its completed parts, rather than started again. Multipart
+uploads which can not be resumed (i.e. cancelled, or orphaned) are aborted, to discard their parts.
+
+Only the direct URL transfers are checkpointed: the streamed (browser) file uploads, which
+can't be resumed from their request body, are not (see transfer_from_stream()).
+"""
+from typing import Dict, List, Optional, Tuple
+from os.path import dirname
+from contextlib import contextmanager
+import json
+import sqlite3
+import time
+
+from kgea.config import get_app_config, CONFIG_FILE_PATH
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Opaquely access the configuration dictionary
+_KGEA_APP_CONFIG = get_app_config()
+
+# Path of the SQLite database file of the multipart upload checkpoints
+Upload_Checkpoint_Path = \
+    _KGEA_APP_CONFIG['Upload_Checkpoint_Path'] if 'Upload_Checkpoint_Path' in _KGEA_APP_CONFIG \
+    else f"{dirname(CONFIG_FILE_PATH)}/upload_checkpoints.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS multipart_upload (
+    upload_id TEXT PRIMARY KEY,
+    bucket TEXT NOT NULL,
+    object_key TEXT NOT NULL,
+    source TEXT,
+    part_size INTEGER NOT NULL,
+    context TEXT,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS multipart_upload_target ON multipart_upload (bucket, object_key);
+CREATE TABLE IF NOT EXISTS multipart_part (
+    upload_id TEXT NOT NULL,
+    part_number INTEGER NOT NULL,
+    etag TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (upload_id, part_number)
+);
+"""
+
+
+class UploadCheckpoints:
+    """
+    SQLite database backed record of the (unfinished) S3 multipart uploads and of their completed parts.
+
+    Each method opens its own short-lived database connection, hence the checkpoints
+    may be shared between threads (and between processes using the same database file).
+    """
+    def __init__(self, db_path: str = Upload_Checkpoint_Path):
+        """
+        :param db_path: path of the SQLite database file (created, if necessary)
+        """
+        self.db_path = db_path
+        with self._connection() as db:
+            db.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connection(self):
+        db = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            yield db
+        finally:
+            db.close()
+
+    def start(
+            self,
+            bucket: str,
+            object_key: str,
+            upload_id: str,
+            part_size: int,
+            source: Optional[str] = None,
+            context: Optional[Dict] = None
+    ):
+        """
+        Records a new multipart upload, replacing any earlier record of an upload to the same target.
+
+        :param bucket: target S3 bucket
+        :param object_key: target S3 object key
+        :param upload_id: UploadId of the multipart upload
+        :param part_size: size (in bytes) of the parts of the upload (but the last one)
+        :param source: (optional) URL of the uploaded data, if the upload may be resumed from it
+        :param context: (optional, JSON serializable) application context of the upload
+        """
+        now = time.time()
+        with self._connection() as db:
+            db.execute("BEGIN IMMEDIATE")
+            db.execute(
+                "DELETE FROM multipart_part WHERE upload_id IN " +
+                "(SELECT upload_id FROM multipart_upload WHERE bucket = ? AND object_key = ?)",
+                (bucket, object_key)
+            )
+            db.execute("DELETE FROM multipart_upload WHERE bucket = ? AND object_key = ?", (bucket, object_key))
+            db.execute(
+                "INSERT INTO multipart_upload " +
+                "(upload_id, bucket, object_key, source, part_size, context, created, updated) " +
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (upload_id, bucket, object_key, source, part_size, json.dumps(context), now, now)
+            )
+            db.execute("COMMIT")
+
+    def record_part(self, upload_id: str, part_number: int, etag: str, size: int):
+        """
+        Records the completion of a part of a multipart upload.
+
+        :param upload_id:
+        :param part_number:
+        :param etag: ETag of the uploaded part
+        :param size: size (in bytes) of the uploaded part
+        """
+        with self._connection() as db:
+            db.execute("BEGIN IMMEDIATE")
+            db.execute(
+                "INSERT OR REPLACE INTO multipart_part (upload_id, part_number, etag, size) VALUES (?, ?, ?, ?)",
+                (upload_id, part_number, etag, size)
+            )
+            db.execute("UPDATE multipart_upload SET updated = ? WHERE upload_id = ?", (time.time(), upload_id))
+            db.execute("COMMIT")
+
+    def finish(self, upload_id: str):
+        """
+        Discards the record of a completed (or aborted) multipart upload.
+
+        :param upload_id:
+        """
+        with self._connection() as db:
+            db.execute("BEGIN IMMEDIATE")
+            db.execute("DELETE FROM multipart_part WHERE upload_id = ?", (upload_id,))
+            db.execute("DELETE FROM multipart_upload WHERE upload_id = ?", (upload_id,))
+            db.execute("COMMIT")
+
+    @staticmethod
+    def _upload(row) -> Dict:
+        return {
+            "upload_id": row[0],
+            "bucket": row[1],
+            "object_key": row[2],
+            "source": row[3],
+            "part_size": row[4],
+            "context": json.loads(row[5]) if row[5] else None,
+            "created": row[6],
+            "updated": row[7]
+        }
+
+    def get_upload(self, bucket: str, object_key: str) -> Optional[Dict]:
+        """
+        :param bucket: target S3 bucket
+        :param object_key: target S3 object key
+        :return: dictionary of the 'upload_id', 'bucket', 'object_key', 'source', 'part_size', 'context',
+                 'created' and 'updated' (time) of the unfinished multipart upload to the target, None if none
+        """
+        with self._connection() as db:
+            row = db.execute(
+                "SELECT upload_id, bucket, object_key, source, part_size, context, created, updated " +
+                "FROM multipart_upload WHERE bucket = ? AND object_key = ?",
+                (bucket, object_key)
+            ).fetchone()
+        return self._upload(row) if row else None
+
+    def get_uploads(self) -> List[Dict]:
+        """
+        :return: list of the unfinished multipart uploads (see get_upload()), in order of their creation
+        """
+        with self._connection() as db:
+            rows = db.execute(
+                "SELECT upload_id, bucket, object_key, source, part_size, context, created, updated " +
+                "FROM multipart_upload ORDER BY created"
+            ).fetchall()
+        return [self._upload(row) for row in rows]
+
+    def get_parts(self, upload_id: str) -> Dict[int, Tuple[str, int]]:
+        """
+        :param upload_id:
+        :return: dictionary of the ETag and size of the completed parts of the multipart upload, by part number
+        """
+        with self._connection() as db:
+            rows = db.execute(
+                "SELECT part_number, etag, size FROM multipart_part WHERE upload_id = ?", (upload_id,)
+            ).fetchall()
+        return {part_number: (etag, size) for part_number, etag, size in rows}
@@ -28,6 +28,7 @@ from kgea.config import (
     PUBLISH_FILE_SET,
     # SETUP_UPLOAD_CONTEXT,
     UPLOAD_FILE,
+    UPLOAD_FILE_STREAM,
     DIRECT_URL_TRANSFER,
     CANCEL_UPLOAD,
     # GET_UPLOAD_STATUS,
@@ -349,6 +350,7 @@ async def get_kge_file_upload_form(request: web.Request) -> web.Response:
             "fileset_version": fileset_version,
             "submitter_name": submitter_name,
             "upload_action": UPLOAD_FILE,
+            "upload_stream_action": UPLOAD_FILE_STREAM,
             "direct_url_transfer_action": DIRECT_URL_TRANSFER,
             "cancel_upload_action": CANCEL_UPLOAD,
             "publish_file_set_action": PUBLISH_FILE_SET
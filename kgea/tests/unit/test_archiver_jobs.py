@@ -0,0 +1,177 @@
+"""
+Tests of the durable KGE Archiver job queue
+"""
+import json
+import zlib
+
+import pytest
+from botocore.session import get_session
+from botocore.stub import Stubber, ANY
+
+from kgea.server.web_services import archiver_jobs
+from kgea.server.web_services.archiver_jobs import (
+    SQLiteArchiverJobQueue,
+    DynamoDBArchiverJobQueue,
+    filesystem_type,
+    ARCHIVER_STEPS,
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_PENDING,
+    JOB_RUNNING
+)
+
+
+def test_archiver_job_checkpoints(tmp_path):
+    db_path = str(tmp_path / "archiver_jobs.sqlite")
+    job_queue = SQLiteArchiverJobQueue(db_path)
+
+    job_queue.enqueue("test_kg.1.0", {"kg_id": "test_kg", "data_files": {}})
+    job_queue.start("test_kg.1.0", "worker-1")
+    job_queue.checkpoint("test_kg.1.0", ARCHIVER_STEPS[0], {"kg_id": "test_kg", "data_files": {"a": {}}}, 1.5)
+
+    # a fresh queue instance, as after a restart, sees the interrupted job and its checkpoint
+    job_queue = SQLiteArchiverJobQueue(db_path)
+    assert job_queue.get_unfinished_jobs() == [("test_kg.1.0", {"kg_id": "test_kg", "data_files": {"a": {}}})]
+    assert job_queue.get_completed_steps("test_kg.1.0") == {ARCHIVER_STEPS[0]: 1.5}
+
+    job_queue.complete("test_kg.1.0")
+    assert job_queue.get_status("test_kg.1.0") == JOB_COMPLETED
+    assert not job_queue.get_unfinished_jobs()
+
+    # publishing a file set again restarts its job from scratch
+    job_queue.enqueue("test_kg.1.0", {"kg_id": "test_kg", "data_files": {}})
+    assert not job_queue.get_completed_steps("test_kg.1.0")
+
+    job_queue.fail("test_kg.1.0", "failed!")
+    assert job_queue.get_status("test_kg.1.0") == JOB_FAILED
+    assert not job_queue.get_unfinished_jobs()
+
+
+def test_archiver_job_claims(tmp_path):
+    job_queue = SQLiteArchiverJobQueue(str(tmp_path / "archiver_jobs.sqlite"))
+
+    job_queue.enqueue("test_kg.1.0", {"kg_id": "test_kg", "fileset_version": "1.0"})
+    job_queue.enqueue("test_kg.1.1", {"kg_id": "test_kg", "fileset_version": "1.1"})
+
+    # distinct workers claim distinct jobs, in order of their creation
+    assert job_queue.claim("worker-1") == ("test_kg.1.0", {"kg_id": "test_kg", "fileset_version": "1.0"})
+    assert job_queue.claim("worker-2") == ("test_kg.1.1", {"kg_id": "test_kg", "fileset_version": "1.1"})
+    assert job_queue.claim("worker-3") is None
+    assert job_queue.get_job("test_kg.1.0")["worker"] == "worker-1"
+
+    # a running job without recent heartbeat is deemed abandoned, hence may be claimed again
+    job_queue.complete("test_kg.1.1")
+    assert job_queue.claim("worker-3", lease=-1.0)[0] == "test_kg.1.0"
+    assert job_queue.get_job("test_kg.1.0")["worker"] == "worker-3"
+
+
+def test_archiver_job_queue_single_host(tmp_path, monkeypatch):
+    mounts = tmp_path / "mounts"
+    mounts.write_text(
+        "/dev/sda1 / ext4 rw 0 0\n" +
+        f"server:/export {tmp_path}/shared nfs4 rw 0 0\n"
+    )
+    assert filesystem_type(f"{tmp_path}/local/archiver_jobs.sqlite", str(mounts)) == "ext4"
+    assert filesystem_type(f"{tmp_path}/shared/archiver_jobs.sqlite", str(mounts)) == "nfs4"
+    assert filesystem_type("/any/path", str(tmp_path / "no_mounts")) is None
+
+    # the job queue refuses a database on a network filesystem
+    monkeypatch.setattr(archiver_jobs, "filesystem_type", lambda path: "nfs4")
+    with pytest.raises(RuntimeError):
+        SQLiteArchiverJobQueue(str(tmp_path / "archiver_jobs.sqlite"))
+
+
+def _file_set(state):
+    return {'B': zlib.compress(json.dumps(state).encode('utf-8'))}
+
+
+def test_dynamodb_archiver_job_queue():
+    client = get_session().create_client(
+        'dynamodb', region_name='us-east-1', aws_access_key_id='test', aws_secret_access_key='test'
+    )
+    with Stubber(client) as stubber:
+        # the missing table is created
+        stubber.add_client_error('describe_table', service_error_code='ResourceNotFoundException')
+        stubber.add_response('create_table', {}, {
+            'TableName': 'jobs',
+            'AttributeDefinitions': [{'AttributeName': 'job_id', 'AttributeType': 'S'}],
+            'KeySchema': [{'AttributeName': 'job_id', 'KeyType': 'HASH'}],
+            'BillingMode': 'PAY_PER_REQUEST'
+        })
+        stubber.add_response('describe_table', {'Table': {'TableStatus': 'ACTIVE'}}, {'TableName': 'jobs'})
+        job_queue = DynamoDBArchiverJobQueue('jobs', client=client)
+
+        stubber.add_response('put_item', {}, {'TableName': 'jobs', 'Item': ANY})
+        job_queue.enqueue("test_kg.1.1", {"kg_id": "test_kg", "fileset_version": "1.1"})
+
+        # of the claimable jobs, in order of their creation, the first one
+        # is claimed by another worker meanwhile, hence the second one is claimed
+        stubber.add_response('scan', {'Items': [
+            {'job_id': {'S': "test_kg.1.1"}, 'status': {'S': JOB_PENDING}, 'created': {'N': '2.0'}},
+            {'job_id': {'S': "test_kg.1.0"}, 'status': {'S': JOB_RUNNING}, 'created': {'N': '1.0'}}
+        ]}, {
+            'TableName': 'jobs',
+            'FilterExpression': "#status = :pending OR (#status = :running AND #updated < :expiry)",
+            'ProjectionExpression': ANY,
+            'ExpressionAttributeNames': ANY,
+            'ExpressionAttributeValues': ANY,
+            'ConsistentRead': True
+        })
+        claim = {
+            'TableName': 'jobs',
+            'Key': ANY,
+            'UpdateExpression': "SET #status = :running, #worker = :worker, #updated = :now",
+            'ConditionExpression': "#status = :pending OR (#status = :running AND #updated < :expiry)",
+            'ExpressionAttributeNames': {'#status': 'status', '#worker': 'worker', '#updated': 'updated'},
+            'ExpressionAttributeValues': ANY,
+            'ReturnValues': 'ALL_NEW'
+        }
+        stubber.add_client_error(
+            'update_item', service_error_code='ConditionalCheckFailedException',
+            expected_params={**claim, 'Key': {'job_id': {'S': "test_kg.1.0"}}}
+        )
+        stubber.add_response(
+            'update_item',
+            {'Attributes': {'file_set': _file_set({"kg_id": "test_kg", "fileset_version": "1.1"})}},
+            {**claim, 'Key': {'job_id': {'S': "test_kg.1.1"}}}
+        )
+        assert job_queue.claim("worker-1") == ("test_kg.1.1", {"kg_id": "test_kg", "fileset_version": "1.1"})
+
+        # all the jobs are claimed
+        stubber.add_response('scan', {'Items': []})
+        assert job_queue.claim("worker-2") is None
+
+        # the checkpoints only update existing jobs
+        stubber.add_response('update_item', {}, {
+            'TableName': 'jobs',
+            'Key': {'job_id': {'S': "test_kg.1.1"}},
+            'UpdateExpression': "SET #steps.#step = :step, #file_set = :file_set, #updated = :now",
+            'ConditionExpression': "attribute_exists(#job_id)",
+            'ExpressionAttributeNames': {
+                '#job_id': 'job_id', '#steps': 'steps', '#file_set': 'file_set', '#updated': 'updated',
+                '#step': ARCHIVER_STEPS[0]
+            },
+            'ExpressionAttributeValues': ANY
+        })
+        job_queue.checkpoint("test_kg.1.1", ARCHIVER_STEPS[0], {"kg_id": "test_kg"}, 1.5)
+
+        stubber.add_response('get_item', {'Item': {'steps': {'M': {
+            ARCHIVER_STEPS[0]: {'M': {'seconds': {'N': '1.5'}, 'completed': {'N': '3.0'}}},
+            ARCHIVER_STEPS[1]: {'M': {'seconds': {'NULL': True}, 'completed': {'N': '4.0'}}}
+        }}}})
+        assert job_queue.get_completed_steps("test_kg.1.1") == {ARCHIVER_STEPS[0]: 1.5, ARCHIVER_STEPS[1]: None}
+
+        stubber.add_response('get_item', {'Item': {
+            'job_id': {'S': "test_kg.1.1"},
+            'status': {'S': JOB_FAILED},
+            'file_set': _file_set({"kg_id": "test_kg"}),
+            'worker': {'S': "worker-1"},
+            'error': {'S': "failed!"}
+        }})
+        assert job_queue.get_job("test_kg.1.1") == \
+            {"status": JOB_FAILED, "file_set": {"kg_id": "test_kg"}, "worker": "worker-1", "error": "failed!"}
+
+        stubber.add_response('get_item', {})
+        assert job_queue.get_status("test_kg.2.0") is None
+
+        stubber.assert_no_pending_responses()
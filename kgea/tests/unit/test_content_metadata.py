@@ -0,0 +1,130 @@
+"""
+Tests of the computation of the content metadata (meta knowledge graph) of KGE File Sets
+"""
+from io import BytesIO
+
+from kgea.server.web_services import content_metadata
+from kgea.server.web_services.kgea_file_ops import default_s3_root_key
+from kgea.server.web_services.content_metadata import (
+    archive_data_keys,
+    summarize_nodes,
+    summarize_edges,
+    compute_content_metadata,
+    compare_content_metadata,
+    DEFAULT_CATEGORY
+)
+
+_TEST_NODES = [
+    {"id": "HGNC:1", "category": "biolink:Gene", "provided_by": "infores:hgnc"},
+    {"id": "HGNC:2", "category": "biolink:Gene", "provided_by": "infores:hgnc"},
+    {"id": "MONDO:1", "category": "biolink:Disease"}
+]
+
+_TEST_EDGES = [
+    {"subject": "HGNC:1", "predicate": "biolink:related_to", "object": "MONDO:1", "relation": "RO:0003302"},
+    {"subject": "HGNC:2", "predicate": "biolink:related_to", "object": "MONDO:1", "knowledge_source": "infores:go"},
+    {"subject": "CHEBI:1", "predicate": "biolink:treats", "object": "MONDO:1"}
+]
+
+
+def test_summarize_content_metadata(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        content_metadata, "_read_records",
+        lambda bucket, object_key, start, end, header: iter(_TEST_NODES if "nodes" in object_key else _TEST_EDGES)
+    )
+
+    nodes, node_index = summarize_nodes("nodes.tsv", 0, 1, [])
+    assert nodes["biolink:Gene"][0] == 2
+    assert nodes["biolink:Gene"][1] == {"HGNC"}
+    assert nodes["biolink:Gene"][2] == {"infores:hgnc": 2}
+    # nodes of the same categories share a single category set code
+    hashes, codes, category_sets = node_index
+    assert len(hashes) == 3
+    assert codes[0] == codes[1] != codes[2]
+    assert category_sets == [("biolink:Gene",), ("biolink:Disease",)]
+
+    hashes_file, codes_file = str(tmp_path / "node_hashes.npy"), str(tmp_path / "node_codes.npy")
+    category_sets = content_metadata._save_node_index([node_index], hashes_file, codes_file)
+    content_metadata._load_node_index(hashes_file, codes_file, category_sets)
+    try:
+        edges = summarize_edges("edges.tsv", 0, 1, [])
+    finally:
+        content_metadata._unload_node_index()
+    assert edges[("biolink:Gene", "biolink:related_to", "biolink:Disease")][0] == 2
+    assert edges[("biolink:Gene", "biolink:related_to", "biolink:Disease")][1] == {"RO:0003302"}
+    # edges of unknown nodes default to the most generic category
+    assert (DEFAULT_CATEGORY, "biolink:treats", "biolink:Disease") in edges
+
+
+class _TestS3Body(BytesIO):
+    """
+    Body of an S3 object (range)
+    """
+    def iter_lines(self):
+        return iter(self.read().splitlines())
+
+
+class _TestS3Client:
+    """
+    S3 client serving (ranges of) in-memory objects, by S3 object key
+    """
+    def __init__(self, objects):
+        self.objects = objects
+
+    def head_object(self, Bucket, Key):
+        return {'ContentLength': len(self.objects[Key])}
+
+    def get_object(self, Bucket, Key, Range):
+        start, end = Range[len("bytes="):].split('-')
+        return {'Body': _TestS3Body(self.objects[Key][int(start):int(end) + 1])}
+
+
+def test_compute_content_metadata(monkeypatch, tmp_path):
+    # data files of a KGE File Set archive, as recorded by the aggregation of its files
+    archive_folder = f"{default_s3_root_key}/test_kg/1.0/archive"
+    data_files = {
+        f"s3://test-bucket/{archive_folder}/nodes.tsv": {"file_name": "nodes.tsv"},
+        f"s3://test-bucket/{archive_folder}/edges.tsv": {"file_name": "edges.tsv"}
+    }
+    client = _TestS3Client({
+        f"{archive_folder}/nodes.tsv":
+            b"id\tcategory\tprovided_by\n" +
+            b"".join(f"{n['id']}\t{n['category']}\t{n.get('provided_by', '')}\n".encode() for n in _TEST_NODES),
+        f"{archive_folder}/edges.tsv":
+            b"subject\tpredicate\tobject\n" +
+            b"".join(f"{e['subject']}\t{e['predicate']}\t{e['object']}\n".encode() for e in _TEST_EDGES)
+    })
+    monkeypatch.setattr(content_metadata, "s3_client", lambda: client)
+    monkeypatch.setattr(content_metadata, "CONTENT_METADATA_SHARD_SIZE", 32)
+
+    node_keys, edge_keys = archive_data_keys("test_kg", "1.0", [entry["file_name"] for entry in data_files.values()])
+    assert node_keys == [f"{archive_folder}/nodes.tsv"]
+    assert edge_keys == [f"{archive_folder}/edges.tsv"]
+
+    computed = compute_content_metadata(
+        node_keys, edge_keys, bucket="test-bucket", processes=0, index_directory=str(tmp_path)
+    )
+    assert computed["nodes"]["biolink:Gene"] == \
+        {"id_prefixes": ["HGNC"], "count": 2, "count_by_source": {"provided_by": {"infores:hgnc": 2}}}
+    assert computed["nodes"]["biolink:Disease"] == {"id_prefixes": ["MONDO"], "count": 1}
+    assert {(e["subject"], e["predicate"], e["object"]): e["count"] for e in computed["edges"]} == {
+        ("biolink:Gene", "biolink:related_to", "biolink:Disease"): 2,
+        (DEFAULT_CATEGORY, "biolink:treats", "biolink:Disease"): 1
+    }
+    # the node index files are removed
+    assert not list(tmp_path.iterdir())
+
+
+def test_compare_content_metadata():
+    computed = {
+        "nodes": {"biolink:Gene": {"id_prefixes": ["HGNC"], "count": 2}},
+        "edges": [{"subject": "biolink:Gene", "predicate": "biolink:related_to", "object": "biolink:Gene", "count": 1}]
+    }
+    assert not compare_content_metadata(computed, computed)
+    assert compare_content_metadata(computed, None)
+
+    submitted = {
+        "nodes": {"biolink:Gene": {"id_prefixes": ["HGNC"], "count": 3}},
+        "edges": [{"subject": "biolink:Gene", "predicate": "biolink:related_to", "object": "biolink:Gene", "count": -1}]
+    }
+    assert len(compare_content_metadata(computed, submitted)) == 1
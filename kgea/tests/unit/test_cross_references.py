@@ -0,0 +1,41 @@
+"""
+Tests of the node cross-reference check of the KGX data files of KGE File Sets
+"""
+from kgea.server.web_services import cross_references
+from kgea.server.web_services.cross_references import NodeIdFilter, check_cross_references
+
+_TEST_NODES = "id\tcategory\nHGNC:1\tbiolink:Gene\nHGNC:2\tbiolink:Gene\nMONDO:1\tbiolink:Disease\n"
+
+_TEST_EDGES = "subject\tpredicate\tobject\n" + \
+              "HGNC:1\tbiolink:related_to\tMONDO:1\n" + \
+              "HGNC:3\tbiolink:related_to\tMONDO:1\n" + \
+              "HGNC:2\tbiolink:related_to\tMONDO:2\n"
+
+_TEST_JSONL_EDGES = '{"subject": "HGNC:1", "predicate": "biolink:related_to", "object": "CHEBI:1"}\n'
+
+
+def test_node_id_filter():
+    node_ids = NodeIdFilter(size=1024)
+    for i in range(100):
+        node_ids.add(f"HGNC:{i}")
+    # a Bloom filter has no false negatives
+    assert all(f"HGNC:{i}" in node_ids for i in range(100))
+    assert sum(f"MONDO:{i}" in node_ids for i in range(1000)) < 100
+    assert 0.0 < node_ids.false_positive_rate() < 0.1
+
+
+def test_check_cross_references(tmp_path, monkeypatch):
+    for name, content in [
+        ("nodes.tsv", _TEST_NODES), ("edges.tsv", _TEST_EDGES), ("edges.jsonl", _TEST_JSONL_EDGES)
+    ]:
+        (tmp_path / name).write_text(content)
+    monkeypatch.setattr(
+        cross_references.smart_open, "open",
+        lambda uri, *args, **kwargs: open(tmp_path / uri.rsplit('/', 1)[-1], *args, **kwargs)
+    )
+
+    results = check_cross_references(["nodes.tsv"], ["edges.tsv", "edges.jsonl"], "bucket")
+    assert results['error_count'] == 3
+    assert len(results['errors']) == 3
+    assert any("'HGNC:3'" in error for error in results['errors'])
+    assert any("'CHEBI:1'" in error for error in results['errors'])
@@ -0,0 +1,46 @@
+"""
+Tests of the block-parallel gzip compression
+"""
+import gzip
+import io
+import os
+import tarfile
+
+import pytest
+
+from kgea.server.web_services.gzip_utils import ParallelGzipWriter
+
+
+@pytest.mark.parametrize(
+    "data_size,block_size",
+    [
+        (0, 1024),
+        (100, 1024),
+        (1024, 1024),
+        (100000, 1024),
+        (100000, 65536),
+    ],
+)
+def test_parallel_gzip_round_trip(data_size, block_size):
+    data = os.urandom(data_size // 2) + b"KGX\tnode\n" * (data_size // 18)
+    target = io.BytesIO()
+    with ParallelGzipWriter(target, block_size=block_size, max_workers=3) as writer:
+        for i in range(0, len(data), 777):
+            writer.write(data[i:i+777])
+    assert gzip.decompress(target.getvalue()) == data
+    statistics = writer.get_statistics()
+    assert statistics['bytes_in'] == len(data)
+    assert statistics['bytes_out'] == len(target.getvalue())
+
+
+def test_parallel_gzip_tar_archive():
+    members = {'provider.yaml': b"kg_id: test\n", 'nodes/nodes.tsv': b"id\tcategory\n" * 5000}
+    target = io.BytesIO()
+    with ParallelGzipWriter(target, block_size=4096) as writer, tarfile.open(fileobj=writer, mode='w|') as tar:
+        for name, content in members.items():
+            tar_info = tarfile.TarInfo(name=name)
+            tar_info.size = len(content)
+            tar.addfile(tar_info, fileobj=io.BytesIO(content))
+    target.seek(0)
+    with tarfile.open(fileobj=target, mode='r:gz') as tar:
+        assert {member.name: tar.extractfile(member).read() for member in tar.getmembers()} == members
@@ -1,7 +1,9 @@
 """
 Test Parameters + Decorator
 """
-from sys import stderr
+from sys import stderr, executable
+from typing import List
+import asyncio
 from os import getenv
 from functools import wraps
 
@@ -37,12 +39,13 @@ from kgea.tests import (
 )
 
 from kgea.server.web_services.kgea_file_ops import (
-    upload_from_link, get_url_file_size, get_archive_contents, aggregate_files,
+    upload_from_link, get_url_file_size, get_archive_contents, load_archive_contents, aggregate_files,
     print_error_trace, compress_fileset, object_keys_in_location, get_object_key,
     upload_file, with_version, get_object_location, upload_file_multipart,
     create_presigned_url, get_fileset_versions_available, random_alpha_string,
     s3_client, location_available, copy_file, object_key_exists,
-    object_keys_for_fileset_version, object_folder_contents_size
+    object_keys_for_fileset_version, object_folder_contents_size,
+    object_keys_exist, run_script
 )
 
 logger = logging.getLogger(__name__)
@@ -121,6 +124,15 @@ def test_is_not_location_available(test_object_location=TEST_LARGE_NODES_FILE_KE
         assert False
 
 
+def test_object_keys_exist(test_object_location=TEST_LARGE_NODES_FILE_KEY, test_bucket=TEST_BUCKET):
+    missing_key = f"{test_object_location}-{random_alpha_string()}"
+    key_exists = object_keys_exist([test_object_location, missing_key], bucket_name=test_bucket)
+    assert key_exists[test_object_location]
+    assert not key_exists[missing_key]
+    assert object_key_exists(test_object_location, bucket_name=test_bucket, use_cache=False)
+    assert not object_key_exists(missing_key, bucket_name=test_bucket, use_cache=False)
+
+
 def test_object_keys_in_location(test_object_location=TEST_LARGE_NODES_FILE_KEY, test_bucket=TEST_BUCKET):
     try:
         kg_file_list = object_keys_in_location(bucket=test_bucket, object_location=test_object_location)
@@ -412,6 +424,21 @@ def test_copy_file():
         assert False
 
 
+def test_run_script_long_output_lines():
+    # output lines longer than the default asyncio stream limit (64 KiB) are tolerated
+    lines: List[str] = list()
+    return_code = asyncio.run(
+        run_script(
+            executable,
+            args=("-c", "print('start'); print('x' * 200000); print('end')"),
+            stdout_parser=lines.append
+        )
+    )
+    assert return_code == 0
+    assert lines[0] == 'start' and lines[-1] == 'end'
+    assert sum(len(line) for line in lines[1:-1]) == 200000
+
+
 async def test_compress_fileset():
     try:
         s3_archive_key: str = await compress_fileset(
@@ -476,6 +503,19 @@ def test_get_archive_contents(test_bucket=TEST_BUCKET):
     logger.info(f"test_get_archive_contents() test output:")
     contents = get_archive_contents(test_bucket)
     logger.info(str(contents))
+
+
+def test_get_archive_contents_from_index(test_bucket=TEST_BUCKET):
+    # first call (re-)builds the persisted index, second call should be served from it
+    indexed_contents = get_archive_contents(test_bucket)
+    assert indexed_contents == get_archive_contents(test_bucket)
+    assert indexed_contents == get_archive_contents(test_bucket, use_index=False)
+
+
+def test_load_archive_contents(test_bucket=TEST_BUCKET):
+    # the persisted index snapshot records the whole contents, data file object keys included
+    contents = get_archive_contents(test_bucket)
+    assert load_archive_contents(test_bucket) == contents
     
 
 def test_get_url_file_size():
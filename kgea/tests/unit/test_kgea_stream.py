@@ -0,0 +1,254 @@
+"""
+Tests of the streamed transfers of data (from URLs and request bodies) into S3 multipart uploads
+"""
+from typing import Dict, List, Optional, Set, Tuple
+import asyncio
+import threading
+import time
+
+import pytest
+from aiohttp import web, ClientSession, ClientTimeout
+from aiohttp.test_utils import TestServer
+from botocore.exceptions import ClientError
+
+from kgea.server.web_services import kgea_stream
+from kgea.server.web_services.kgea_stream import (
+    S3MultipartUpload,
+    stream_from_url,
+    get_url_ranges_size,
+    transfer_from_url,
+    transfer_from_stream,
+    grown_part_size,
+    MAX_UPLOAD_PARTS,
+    MAX_UPLOAD_PART_SIZE,
+    MB
+)
+
+
+class _TestS3Client:
+    """
+    S3 client stub recording the parts of its multipart uploads
+    """
+    def __init__(self, failed_part: Optional[int] = None):
+        """
+        :param failed_part: (optional) number of a part of which every upload fails
+        """
+        self.failed_part = failed_part
+        self.uploads: Dict[str, Dict[int, bytes]] = dict()
+        self.completed: Dict[str, List[Dict]] = dict()
+        self.aborted: Set[str] = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def create_multipart_upload(self, Bucket, Key):
+        upload_id = f"upload-{len(self.uploads) + 1}"
+        self.uploads[upload_id] = dict()
+        return {'UploadId': upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # the lower numbered parts take longer to upload, hence complete out of order
+            time.sleep(0.01 * (4 - PartNumber % 4))
+            if PartNumber == self.failed_part:
+                raise ClientError({'Error': {'Code': 'InternalError', 'Message': 'test'}}, 'UploadPart')
+            self.uploads[UploadId][PartNumber] = Body
+            return {'ETag': f'"etag-{PartNumber}"'}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.completed[UploadId] = MultipartUpload['Parts']
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted.add(UploadId)
+
+    def object_data(self) -> bytes:
+        """
+        :return: data of the (single) completed upload, assembled from its completed parts
+        """
+        (upload_id, parts), = self.completed.items()
+        return b''.join(self.uploads[upload_id][part['PartNumber']] for part in parts)
+
+
+class _TestStream:
+    """
+    Incoming data stream, read in chunks
+    """
+    def __init__(self, data: bytes, chunk_size: int = 3):
+        self.data = data
+        self.chunk_size = chunk_size
+
+    async def read_chunk(self, size: int) -> bytes:
+        chunk = self.data[:min(size, self.chunk_size)]
+        self.data = self.data[len(chunk):]
+        return chunk
+
+
+async def _slow_data(request: web.Request) -> web.StreamResponse:
+    response = web.StreamResponse()
+    await response.prepare(request)
+    for _ in range(4):
+        await response.write(b'x' * 1024)
+        await asyncio.sleep(0.5)
+    await response.write_eof()
+    return response
+
+
+def test_stream_from_url_past_total_timeout():
+
+    async def _stream() -> bytes:
+        app = web.Application()
+        app.router.add_get('/data', _slow_data)
+        async with TestServer(app) as server:
+            # the stream lasts longer than the total timeout of the client session
+            async with ClientSession(timeout=ClientTimeout(total=1)) as session:
+                return b''.join([
+                    chunk async for chunk in stream_from_url(str(server.make_url('/data')), 1500, session)
+                ])
+
+    assert asyncio.run(_stream()) == b'x' * 4096
+
+
+_TEST_DATA = bytes(range(100))
+
+
+def _data_handler(ranges: bool, advertised: bool, range_requests: List[str]):
+    """
+    :param ranges: whether byte range requests are honoured
+    :param advertised: whether byte range requests are advertised (by an 'Accept-Ranges: bytes' header)
+    :param range_requests: list recording the byte ranges requested
+    :return: handler serving _TEST_DATA
+    """
+    async def _handler(request: web.Request) -> web.Response:
+        headers = {'Accept-Ranges': 'bytes'} if advertised else {}
+        if 'Range' in request.headers:
+            range_requests.append(request.headers['Range'])
+            if ranges:
+                return web.Response(status=206, body=_TEST_DATA[request.http_range], headers=headers)
+        return web.Response(body=_TEST_DATA, headers=headers)
+    return _handler
+
+
+def _transfer_from_url(path: str, ranges: bool, advertised: bool, client: _TestS3Client) -> Tuple[int, List[str]]:
+    """
+    :return: 2-tuple of the size of the URL resource (-1 if byte ranges are not advertised)
+             and of the byte ranges requested by its transfer
+    """
+    range_requests: List[str] = list()
+
+    async def _transfer() -> int:
+        app = web.Application()
+        app.router.add_get(path, _data_handler(ranges, advertised, range_requests))
+        async with TestServer(app) as server:
+            async with ClientSession() as session:
+                url = str(server.make_url(path))
+                size = await get_url_ranges_size(url, session)
+                transferred = await transfer_from_url(
+                    url, "bucket", "object", part_size=16, window=3, session=session, client=client
+                )
+                assert transferred == len(_TEST_DATA)
+                return size
+
+    return asyncio.run(_transfer()), range_requests
+
+
+def test_transfer_from_url_ranges():
+    client = _TestS3Client()
+    size, range_requests = _transfer_from_url('/data', ranges=True, advertised=True, client=client)
+    assert size == len(_TEST_DATA)
+    # each part is fetched as a distinct byte range
+    assert sorted(range_requests) == sorted(f"bytes={start}-{min(start + 16, 100) - 1}" for start in range(0, 100, 16))
+    assert [len(data) for _, data in sorted(client.uploads["upload-1"].items())] == [16] * 6 + [4]
+    assert client.object_data() == _TEST_DATA
+
+
+def test_transfer_from_url_ranges_unsupported():
+    # a range request answered with the whole resource (HTTP 200) falls back onto a single stream transfer
+    client = _TestS3Client()
+    size, range_requests = _transfer_from_url('/data', ranges=False, advertised=True, client=client)
+    assert size == len(_TEST_DATA)
+    assert range_requests
+    assert "upload-1" in client.aborted
+    assert list(client.completed) == ["upload-2"]
+    assert client.object_data() == _TEST_DATA
+
+    # unadvertised byte ranges are not requested
+    client = _TestS3Client()
+    size, range_requests = _transfer_from_url('/data', ranges=False, advertised=False, client=client)
+    assert size == -1
+    assert not range_requests
+    assert client.object_data() == _TEST_DATA
+
+
+def test_multipart_upload_window():
+    client = _TestS3Client()
+
+    async def _upload():
+        mpu = S3MultipartUpload("bucket", "object", window=3, client=client)
+        await mpu.start()
+        for part in range(10):
+            await mpu.put(bytes([part]) * 8)
+        await mpu.complete()
+        return mpu
+
+    mpu = asyncio.run(_upload())
+    assert mpu.size == 80
+    # the parts are uploaded concurrently, within the window, but completed in order
+    assert 1 < client.max_in_flight <= 3
+    assert client.completed["upload-1"] == [
+        {"PartNumber": part_number, "ETag": f'"etag-{part_number}"'} for part_number in range(1, 11)
+    ]
+    assert client.object_data() == b''.join(bytes([part]) * 8 for part in range(10))
+
+
+def test_multipart_upload_part_failure(monkeypatch):
+    monkeypatch.setattr(kgea_stream, "UPLOAD_PART_RETRY_DELAY", 0)
+    client = _TestS3Client(failed_part=2)
+
+    with pytest.raises(ClientError):
+        asyncio.run(transfer_from_stream(
+            _TestStream(b'x' * 40), "bucket", "object", part_size=8, window=2, client=client
+        ))
+
+    # the upload is aborted, never completed
+    assert client.aborted == {"upload-1"}
+    assert not client.completed
+
+
+def test_transfer_from_stream_part_size(monkeypatch):
+    # with a size hint, the parts are large enough for the data to fit in MAX_UPLOAD_PARTS parts
+    client = _TestS3Client()
+    asyncio.run(transfer_from_stream(
+        _TestStream(b'x' * 120), "bucket", "object", part_size=4, client=client, size_hint=12 * MAX_UPLOAD_PARTS
+    ))
+    assert [len(data) for _, data in sorted(client.uploads["upload-1"].items())] == [12] * 10
+
+    # without, the parts grow
+    monkeypatch.setattr(kgea_stream, "PART_SIZE_GROWTH_INTERVAL", 2)
+    client = _TestS3Client()
+    asyncio.run(transfer_from_stream(_TestStream(b'x' * 40), "bucket", "object", part_size=4, client=client))
+    assert [len(data) for _, data in sorted(client.uploads["upload-1"].items())] == [4, 4, 8, 8, 16]
+    assert client.object_data() == b'x' * 40
+
+
+def test_transfer_from_empty_stream():
+    client = _TestS3Client()
+    size = asyncio.run(transfer_from_stream(_TestStream(b''), "bucket", "object", client=client))
+    assert size == 0
+    # an empty object is uploaded as a single, empty part
+    assert client.uploads["upload-1"] == {1: b''}
+    assert client.completed["upload-1"] == [{"PartNumber": 1, "ETag": '"etag-1"'}]
+
+
+def test_grown_part_size():
+    assert grown_part_size(1, 8 * MB) == 8 * MB
+    assert grown_part_size(1001, 8 * MB) == 16 * MB
+    assert grown_part_size(MAX_UPLOAD_PARTS, 8 * MB) <= MAX_UPLOAD_PART_SIZE
+    assert grown_part_size(MAX_UPLOAD_PARTS, 64 * MB) == MAX_UPLOAD_PART_SIZE
+    # parts of initially 8 megabytes hold more than the 5 terabytes maximum size of S3 objects
+    assert sum(grown_part_size(n, 8 * MB) for n in range(1, MAX_UPLOAD_PARTS + 1)) > 5 * 2**40
@@ -0,0 +1,27 @@
+"""
+Tests of the durable checkpoints of the S3 multipart uploads
+"""
+from kgea.server.web_services.upload_checkpoints import UploadCheckpoints
+
+
+def test_upload_checkpoints(tmp_path):
+    checkpoints = UploadCheckpoints(str(tmp_path / "upload_checkpoints.sqlite"))
+
+    checkpoints.start("bucket", "kge-data/kg/1.0/nodes/nodes.tsv", "upload-1", 1024, "http://host/nodes.tsv")
+    checkpoints.record_part("upload-1", 1, '"etag-1"', 1024)
+    checkpoints.record_part("upload-1", 2, '"etag-2"', 512)
+
+    upload = checkpoints.get_upload("bucket", "kge-data/kg/1.0/nodes/nodes.tsv")
+    assert upload["upload_id"] == "upload-1"
+    assert upload["source"] == "http://host/nodes.tsv"
+    assert checkpoints.get_parts("upload-1") == {1: ('"etag-1"', 1024), 2: ('"etag-2"', 512)}
+
+    # a new upload to the same target replaces the earlier one
+    checkpoints.start("bucket", "kge-data/kg/1.0/nodes/nodes.tsv", "upload-2", 1024, context={"kg_id": "kg"})
+    assert [u["upload_id"] for u in checkpoints.get_uploads()] == ["upload-2"]
+    assert checkpoints.get_uploads()[0]["context"] == {"kg_id": "kg"}
+    assert not checkpoints.get_parts("upload-1")
+
+    checkpoints.finish("upload-2")
+    assert checkpoints.get_upload("bucket", "kge-data/kg/1.0/nodes/nodes.tsv") is None
+    assert not checkpoints.get_uploads()